@@ -0,0 +1,74 @@
+"""
+    Compare the JSON backends of dhanhq.codec on the response fixtures in tests/data.
+
+    Each fixture is measured as is and scaled up: list payloads are repeated to the size of a
+    busy trade book or a multi-day intraday response.
+
+    Usage:
+        python benchmarks/codec_benchmark.py [--scale 2000] [--number 200]
+"""
+
+import argparse
+import pathlib
+import timeit
+
+from dhanhq import codec
+
+DATA_DIR = pathlib.Path(__file__).resolve().parent.parent / 'tests' / 'data'
+
+
+def load_fixtures(scale):
+    fixtures = {}
+    for path in sorted(DATA_DIR.glob('*.json')):
+        document = codec.use('json').loads(path.read_bytes())
+        fixtures[path.stem] = document
+        if isinstance(document.get('data'), list) and document['data']:
+            fixtures[f'{path.stem} x{scale}'] = {**document, 'data': document['data'] * scale}
+    return fixtures
+
+
+def available_backends():
+    backends = {}
+    for name in codec.BACKENDS:
+        try:
+            backends[name] = codec.use(name)
+        except ImportError:
+            continue
+    return backends
+
+
+def measure(fixtures, backends, number):
+    print(f"{'payload':<40}{'bytes':>10}" + ''.join(f"{name + ' loads':>16}{name + ' encode':>16}"
+                                                    for name in backends))
+    totals = {name: [0.0, 0.0] for name in backends}
+    for label, document in fixtures.items():
+        raw = backends['json'].encode(document)
+        row = f'{label:<40}{len(raw):>10}'
+        for name, backend in backends.items():
+            loads = timeit.timeit(lambda: backend.loads(raw), number=number) / number
+            encode = timeit.timeit(lambda: backend.encode(document), number=number) / number
+            totals[name][0] += loads
+            totals[name][1] += encode
+            row += f'{loads * 1e6:>14.1f}us{encode * 1e6:>14.1f}us'
+        print(row)
+
+    baseline = totals['json']
+    for name, (loads, encode) in totals.items():
+        print(f'{name}: loads {baseline[0] / loads:.2f}x, encode {baseline[1] / encode:.2f}x vs json')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=2000, help='Repetitions of list payloads')
+    parser.add_argument('--number', type=int, default=200, help='Timed runs per payload')
+    args = parser.parse_args()
+
+    selected = codec.get_codec().name
+    try:
+        measure(load_fixtures(args.scale), available_backends(), args.number)
+    finally:
+        codec.use(selected)
+
+
+if __name__ == '__main__':
+    main()
@@ -50,6 +50,7 @@ setup(name=PACKAGE_NAME,
       ],
       install_requires=INSTALL_REQUIRES,
       extras_require={
-          'dev': TEST_REQUIRES
+          'dev': TEST_REQUIRES,
+          'fast': ['orjson>=3.8'],
       },
       )
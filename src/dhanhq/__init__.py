@@ -1,6 +1,24 @@
+"""
+    DhanHQ Python client.
+
+    The REST client is imported eagerly. The websocket feeds, the asyncio client and the
+    instrument master are imported on first access, so REST-only scripts do not pay for
+    websockets, asyncio and pandas.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+from importlib import import_module
+
 from .dhan_context import DhanContext
 from .auth import DhanLogin
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+from .response_cache import ResponseCache
+from .metrics import MetricsRegistry
 from .dhan_http import DhanHTTP
+from .batch import Batch
 from ._order import Order
 from ._forever_order import ForeverOrder
 from ._super_order import SuperOrder
@@ -9,13 +27,45 @@ from ._funds import Funds
 from ._statement import Statement
 from ._trader_control import TraderControl
 from ._security import Security
-from ._market_feed import MarketFeed
 from ._historical_data import HistoricalData
 from ._option_chain import OptionChain
 from ._conditional_order import ConditionalOrder
 from ._global_stocks import GlobalStocks
 from .dhanhq import dhanhq
-from .marketfeed import MarketFeed
-from .orderupdate import OrderUpdate
-from .fulldepth import FullDepth
-from .global_stocks_feed import GlobalStocksFeed
\ No newline at end of file
+
+"""Attributes imported from their submodule on first access"""
+_LAZY_ATTRIBUTES = {
+    'AsyncDhanHTTP': '.async_dhan_http',
+    'AsyncDhanHQ': '.async_dhanhq',
+    'MarketFeed': '.marketfeed',
+    'OrderUpdate': '.orderupdate',
+    'FullDepth': '.fulldepth',
+    'GlobalStocksFeed': '.global_stocks_feed',
+    'InstrumentMaster': '.instruments',
+    'SharedInstrumentMaster': '.shared_instruments',
+    'InstrumentDiff': '.instrument_diff',
+    'OptionsIndex': '.options_index',
+    'SymbolSearch': '.symbol_search',
+    'CandleStore': '.candle_store',
+    'BulkDownloader': '.bulk_download',
+    'Resampler': '.resample',
+    'OptionsPanel': '.options_panel',
+}
+
+__all__ = ['DhanContext', 'DhanLogin', 'RateLimiter', 'RetryPolicy', 'ResponseCache', 'MetricsRegistry',
+           'DhanHTTP', 'Batch', 'Order', 'ForeverOrder', 'SuperOrder', 'Portfolio', 'Funds', 'Statement',
+           'TraderControl', 'Security', 'HistoricalData', 'OptionChain', 'ConditionalOrder', 'GlobalStocks',
+           'dhanhq', *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -2,14 +2,39 @@
 This API gives you historical candle data for the desired scrip across segments & exchange.
 This data is presented in the form of a candle and gives you timestamp, open, high, low, close (OHLC) & volume.
 """
+import datetime
 import logging
+from itertools import product
+
+from dhanhq import DhanHTTP
+from dhanhq.candle_windows import CandleWindows
+
 
 class HistoricalData:
 
+    """Longest from_date/to_date range the server accepts per request, in days"""
+    INTRADAY_MAX_DAYS = CandleWindows.INTRADAY_MAX_DAYS
+    DAILY_MAX_DAYS = CandleWindows.DAILY_MAX_DAYS
+    EXPIRED_OPTIONS_MAX_DAYS = CandleWindows.EXPIRED_OPTIONS_MAX_DAYS
+
+    """Requests in flight for a range fetch; the data APIs allow 5 requests per second"""
+    RANGE_DEFAULT_WORKERS = 5
+
+    IST = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+    IST_OFFSET_SECONDS = 19800
+
+    """Result modes for candle responses"""
+    ARRAYS = 'arrays'
+    FRAME = 'frame'
+
+    """Candle fields stored as int64; all other fields are float64"""
+    INTEGER_FIELDS = ('volume', 'open_interest')
+
     def __init__(self, dhan_context):
         self.dhan_http = dhan_context.get_dhan_http()
 
-    def intraday_minute_data(self, security_id, exchange_segment, instrument_type, from_date, to_date, interval=1, oi=False):
+    def intraday_minute_data(self, security_id, exchange_segment, instrument_type, from_date, to_date, interval=1,
+                             oi=False, result=None):
         """
         Retrieve OHLC & Volume of minute candles for desired instrument for last 5 trading day.
 
@@ -21,11 +46,16 @@ class HistoricalData:
             to_date (str): The end date for the historical data (YYYY-MM-DD).
             interval (int): Time interval - 1, 5, 15, 25, or 60 minutes (default: 1).
             oi (bool): Fetch Open Interest data (default: False).
+            result (str, optional): 'arrays' or 'frame' for the candles as NumPy arrays or a DataFrame;
+                see candles_as_arrays and candles_as_frame.
 
         Returns:
             dict: The response containing intraday minute data.
         """
 
+        invalid = self._invalid_result(result, 'intraday_minute_data')
+        if invalid:
+            return invalid
         endpoint = '/charts/intraday'
         payload = {
             'securityId': security_id,
@@ -36,9 +66,10 @@ class HistoricalData:
             'fromDate': from_date,
             'toDate': to_date
         }
-        return self.dhan_http.post(endpoint, payload)
+        return self._candle_result(self.dhan_http.post(endpoint, payload), result)
 
-    def historical_daily_data(self, security_id, exchange_segment, instrument_type, from_date, to_date, expiry_code=0, oi=False):
+    def historical_daily_data(self, security_id, exchange_segment, instrument_type, from_date, to_date,
+                              expiry_code=0, oi=False, result=None):
         """
         Retrieve OHLC & Volume of daily candle for desired instrument.
 
@@ -50,10 +81,15 @@ class HistoricalData:
             to_date (str): The end date for the historical data (YYYY-MM-DD).
             expiry_code (int): The expiry code for derivatives (0, 1, 2, 3).
             oi (bool): Fetch Open Interest data (default: False).
+            result (str, optional): 'arrays' or 'frame' for the candles as NumPy arrays or a DataFrame;
+                see candles_as_arrays and candles_as_frame.
 
         Returns:
             dict: The response containing historical daily data.
         """
+        invalid = self._invalid_result(result, 'historical_daily_data')
+        if invalid:
+            return invalid
         if expiry_code not in [0, 1, 2, 3]:
             err = "expiry_code value must be [0, 1, 2, 3]"
             logging.error('Exception in dhanhq>>historical_daily_data: %s', err)
@@ -72,7 +108,7 @@ class HistoricalData:
             "fromDate": from_date,
             "toDate": to_date
         }
-        return self.dhan_http.post(endpoint, payload)
+        return self._candle_result(self.dhan_http.post(endpoint, payload), result)
 
     def expired_options_data(self, security_id, exchange_segment, instrument_type, expiry_flag, expiry_code, strike, drv_option_type, required_data, from_date, to_date, interval=1):
         """
@@ -147,4 +183,434 @@ class HistoricalData:
         }
         return self.dhan_http.post(endpoint, payload)
 
+    def expired_options_sweep(self, security_id, exchange_segment, instrument_type, expiry_flag, from_date, to_date,
+                              strikes=range(-10, 11), option_types=('CALL', 'PUT'), expiry_codes=(1,),
+                              required_data=('open', 'high', 'low', 'close', 'iv', 'volume', 'oi', 'spot'),
+                              interval=1, max_workers=RANGE_DEFAULT_WORKERS, dtype='float32'):
+        """
+        Fetch expired options data for ranges of strikes, option types and expiry codes into one panel.
+
+        Every combination of strike, option type, expiry code and window of at most 30 days is
+        one expired_options_data request. The requests run concurrently (still under the rate
+        limiter, if one is set) and their candles are assembled into an OptionsPanel of shape
+        (expiry code, option type, time, strike, field). Requests that fail leave their cells NaN
+        and are listed in the `failures` of the panel, so they can be fetched again on their own.
+
+        The panel is dense: a year of 1 minute candles, about 93,000 times, of 21 strikes, calls
+        and puts and 8 fields takes about 125 MB as float32 and twice that as float64.
+
+        Args:
+            security_id (str): Security ID of the underlying instrument.
+            exchange_segment (str): Exchange segment (e.g., NSE_FNO).
+            instrument_type (str): Instrument type (e.g., OPTIDX, OPTSTK).
+            expiry_flag (str): Expiry flag - 'WEEK' or 'MONTH'.
+            from_date (str | date): Start date (YYYY-MM-DD format).
+            to_date (str | date): End date (YYYY-MM-DD format).
+            strikes (iterable): Strikes relative to spot, as offsets from ATM (-10 for 'ATM-10') or
+                strings such as 'ATM+1' (default: ATM-10 to ATM+10).
+            option_types (iterable): 'CALL' and/or 'PUT' (default: both).
+            expiry_codes (iterable): Expiry codes (default: 1).
+            required_data (iterable): Fields to fetch (open, high, low, close, iv, volume, strike, oi, spot).
+            interval (int): Time interval - 1, 5, 15, 25, or 60 minutes (default: 1).
+            max_workers (int): Maximum number of requests in flight.
+            dtype (str): Type of the panel values (default: float32, exact for open interest up to
+                16.7 million; use float64 beyond).
+
+        Returns:
+            dict: The response with an OptionsPanel in 'data', or the first failure if every request failed.
+        """
+        from dhanhq.options_panel import OptionsPanel
+
+        strikes = [OptionsPanel.strike_name(strike) for strike in strikes]
+        option_types, expiry_codes, required_data = list(option_types), list(expiry_codes), list(required_data)
+        err = self._sweep_error(expiry_flag, strikes, option_types, expiry_codes, required_data, interval)
+        try:
+            windows = [] if err else CandleWindows.date_windows(from_date, to_date, self.EXPIRED_OPTIONS_MAX_DAYS)
+        except ValueError as e:
+            err = str(e)
+        if err:
+            logging.error('Exception in dhanhq>>expired_options_sweep: %s', err)
+            return {
+                'status': 'failure',
+                'remarks': err,
+                'data': '',
+            }
+
+        keys, calls = [], []
+        for expiry_code, option_type, strike, (start, end) in product(expiry_codes, option_types, strikes, windows):
+            keys.append((expiry_code, option_type, strike))
+            calls.append(('POST', '/charts/rollingoption', {
+                "securityId": security_id,
+                "exchangeSegment": exchange_segment,
+                "instrument": instrument_type,
+                "expiryFlag": expiry_flag,
+                "expiryCode": expiry_code,
+                "strike": strike,
+                "drvOptionType": option_type,
+                "requiredData": required_data,
+                "fromDate": start,
+                "toDate": end,
+                "interval": interval
+            }))
+        responses = self.dhan_http.execute_many(calls, max_workers)
+        succeeded, failures = [], []
+        for key, (_, _, payload), response in zip(keys, calls, responses):
+            if response.get('status') == DhanHTTP.HttpResponseStatus.SUCCESS.value:
+                succeeded.append((*key, response['data']))
+            else:
+                failures.append(dict(zip(('expiry_code', 'option_type', 'strike'), key), from_date=payload['fromDate'],
+                                     to_date=payload['toDate'], remarks=response.get('remarks')))
+        if not succeeded:
+            return responses[0]
+        panel = OptionsPanel.from_responses(succeeded, expiry_codes, option_types, strikes, required_data, dtype,
+                                            failures)
+        if failures:
+            logging.warning('dhanhq>>expired_options_sweep: %d of %d requests failed', len(failures), len(calls))
+        return {
+            'status': DhanHTTP.HttpResponseStatus.SUCCESS.value,
+            'remarks': f'{len(failures)} of {len(calls)} requests failed, see data.failures' if failures else '',
+            'data': panel,
+        }
+
+    @staticmethod
+    def _sweep_error(expiry_flag, strikes, option_types, expiry_codes, required_data, interval):
+        """Return why the arguments of expired_options_sweep are invalid, or None."""
+        valid_fields = ["open", "high", "low", "close", "iv", "volume", "strike", "oi", "spot"]
+        if interval not in [1, 5, 15, 25, 60]:
+            return "interval value must be [1, 5, 15, 25, 60]"
+        if expiry_flag not in ["WEEK", "MONTH"]:
+            return "expiry_flag value must be ['WEEK', 'MONTH']"
+        if not option_types or not all(option_type in ["CALL", "PUT"] for option_type in option_types):
+            return "option_types values must be ['CALL', 'PUT']"
+        if not strikes or not expiry_codes:
+            return "strikes and expiry_codes must not be empty"
+        if not all(field in valid_fields for field in required_data):
+            return f"required_data must only contain {valid_fields}"
+        return None
+
+    def intraday_minute_data_range(self, security_id, exchange_segment, instrument_type, from_date, to_date,
+                                   interval=1, oi=False, max_workers=RANGE_DEFAULT_WORKERS, result=None):
+        """
+        Retrieve minute candles over a range of any length, e.g. a year of 1 minute candles.
+
+        The range is split into windows of at most INTRADAY_MAX_DAYS days, which are fetched
+        concurrently (still under the rate limiter, if one is set) and stitched into one
+        time-ordered series without duplicate candles.
+
+        Args:
+            security_id (str): The ID of the security.
+            exchange_segment (str): The exchange segment (e.g., NSE, BSE).
+            instrument_type (str): The type of instrument (e.g., stock, option).
+            from_date (str): The start date (YYYY-MM-DD) or time (YYYY-MM-DD HH:MM:SS).
+            to_date (str): The end date (YYYY-MM-DD) or time (YYYY-MM-DD HH:MM:SS).
+            interval (int): Time interval - 1, 5, 15, 25, or 60 minutes (default: 1).
+            oi (bool): Fetch Open Interest data (default: False).
+            max_workers (int): Maximum number of requests in flight.
+            result (str, optional): 'arrays' or 'frame' for the candles as NumPy arrays or a DataFrame;
+                see candles_as_arrays and candles_as_frame.
+
+        Returns:
+            dict: The response containing the candles of the whole range, or the first failure.
+        """
+        if interval not in [1, 5, 15, 25, 60]:
+            err = "interval value must be [1, 5, 15, 25, 60]"
+            logging.error('Exception in dhanhq>>intraday_minute_data_range: %s', err)
+            return {
+                'status': 'failure',
+                'remarks': err,
+                'data': '',
+            }
+        invalid = self._invalid_result(result, 'intraday_minute_data_range')
+        if invalid:
+            return invalid
+        payload = {
+            'securityId': security_id,
+            'exchangeSegment': exchange_segment,
+            'instrument': instrument_type,
+            'interval': interval,
+            'oi': oi,
+        }
+        response = self._fetch_range('/charts/intraday', payload, [(from_date, to_date)], self.INTRADAY_MAX_DAYS,
+                                     max_workers, 'intraday_minute_data_range')
+        return self._candle_result(response, result)
+
+    def historical_daily_data_range(self, security_id, exchange_segment, instrument_type, from_date, to_date,
+                                    expiry_code=0, oi=False, max_workers=RANGE_DEFAULT_WORKERS, result=None):
+        """
+        Retrieve daily candles over a range of any length.
+
+        The range is split into windows of at most DAILY_MAX_DAYS days, which are fetched
+        concurrently and stitched into one time-ordered series without duplicate candles.
+
+        Args:
+            security_id (str): Security ID of the instrument.
+            exchange_segment (str): The exchange segment (e.g., NSE, BSE).
+            instrument_type (str): The type of instrument (e.g., stock, option).
+            from_date (str): The start date for the historical data (YYYY-MM-DD).
+            to_date (str): The end date for the historical data (YYYY-MM-DD).
+            expiry_code (int): The expiry code for derivatives (0, 1, 2, 3).
+            oi (bool): Fetch Open Interest data (default: False).
+            max_workers (int): Maximum number of requests in flight.
+            result (str, optional): 'arrays' or 'frame' for the candles as NumPy arrays or a DataFrame;
+                see candles_as_arrays and candles_as_frame.
+
+        Returns:
+            dict: The response containing the candles of the whole range, or the first failure.
+        """
+        if expiry_code not in [0, 1, 2, 3]:
+            err = "expiry_code value must be [0, 1, 2, 3]"
+            logging.error('Exception in dhanhq>>historical_daily_data_range: %s', err)
+            return {
+                'status': 'failure',
+                'remarks': err,
+                'data': '',
+            }
+        invalid = self._invalid_result(result, 'historical_daily_data_range')
+        if invalid:
+            return invalid
+        payload = {
+            "securityId": security_id,
+            "exchangeSegment": exchange_segment,
+            "instrument": instrument_type,
+            "expiryCode": expiry_code,
+            "oi": oi,
+        }
+        response = self._fetch_range('/charts/historical', payload, [(from_date, to_date)], self.DAILY_MAX_DAYS,
+                                     max_workers, 'historical_daily_data_range')
+        return self._candle_result(response, result)
+
+    def sync_candles(self, security_id, exchange_segment, instrument_type, from_date, to_date, interval='D',
+                     oi=False, store=True, max_workers=RANGE_DEFAULT_WORKERS, result=None):
+        """
+        Bring the local candle store up to date for a range and return the candles from it.
+
+        Only the parts of the range that were not fetched before are requested, concurrently
+        and in windows the server accepts. Today is never marked as fetched, so its candles
+        are fetched again, and completed, on the next sync.
+
+        Args:
+            security_id (str): The ID of the security.
+            exchange_segment (str): The exchange segment (e.g., NSE, BSE).
+            instrument_type (str): The type of instrument (e.g., stock, option).
+            from_date (str): The start date (YYYY-MM-DD) or time (YYYY-MM-DD HH:MM:SS).
+            to_date (str): The end date (YYYY-MM-DD) or time (YYYY-MM-DD HH:MM:SS), not included.
+            interval (str | int): 'D' for daily candles, or 1, 5, 15, 25 or 60 minutes.
+            oi (bool): Fetch Open Interest data (default: False).
+            store (bool | str | CandleStore): The store; True for ~/.cache/dhanhq/candles, or a directory.
+            max_workers (int): Maximum number of requests in flight.
+            result (str, optional): 'arrays' or 'frame' for the candles as NumPy arrays or a DataFrame;
+                see candles_as_arrays and candles_as_frame.
+
+        Returns:
+            dict: The response, with the candles of the range as memory-mapped arrays in 'data',
+                or the first failure.
+        """
+        from dhanhq.candle_store import CandleStore
+
+        if interval != CandleStore.DAILY and interval not in [1, 5, 15, 25, 60]:
+            err = "interval value must be ['D', 1, 5, 15, 25, 60]"
+            logging.error('Exception in dhanhq>>sync_candles: %s', err)
+            return {
+                'status': 'failure',
+                'remarks': err,
+                'data': '',
+            }
+        invalid = self._invalid_result(result, 'sync_candles')
+        if invalid:
+            return invalid
+        store = CandleStore.resolve(store)
+        key = (security_id, exchange_segment, instrument_type, interval, oi)
+        endpoint, payload, max_days = CandleWindows.request(security_id, exchange_segment, instrument_type, interval,
+                                                            oi)
+        try:
+            gaps = store.missing(*key, from_date=from_date, to_date=to_date)
+        except ValueError as e:
+            logging.error('Exception in dhanhq>>sync_candles: %s', e)
+            return {
+                'status': 'failure',
+                'remarks': str(e),
+                'data': '',
+            }
+        if gaps:
+            ranges = [(CandleWindows.format_time(start), CandleWindows.format_time(end)) for start, end in gaps]
+            response = self._fetch_range(endpoint, payload, ranges, max_days, max_workers, 'sync_candles')
+            if response['status'] != DhanHTTP.HttpResponseStatus.SUCCESS.value:
+                return response
+            covered = [CandleWindows.final_range(start, end) for start, end in gaps]
+            store.append(*key, candles=response['data'], covered=covered)
+        return self._candle_result({
+            'status': DhanHTTP.HttpResponseStatus.SUCCESS.value,
+            'remarks': '',
+            'data': store.read(*key, from_date=from_date, to_date=to_date),
+        }, result)
+
+    def bulk_download(self, securities, from_date, to_date, interval='D', oi=False, store=True, checkpoint=None,
+                      max_workers=RANGE_DEFAULT_WORKERS, retry_policy=None, progress=None):
+        """
+        Download the candles of many securities into the local candle store, resuming an interrupted run.
+
+        See BulkDownloader.run. Only statistics are returned; read the candles with
+        CandleStore.read or sync_candles.
+
+        Args:
+            securities (iterable | InstrumentMaster): (security_id, exchange_segment, instrument_type)
+                tuples, or an instrument master for all of its securities.
+            from_date (str | date | datetime): Start of the range, in IST.
+            to_date (str | date | datetime): End of the range, not included, in IST.
+            interval (str | int): 'D' for daily candles, or 1, 5, 15, 25 or 60 minutes.
+            oi (bool): Fetch Open Interest data (default: False).
+            store (bool | str | CandleStore): The store; True for ~/.cache/dhanhq/candles, or a directory.
+            checkpoint (str | bool, optional): Path of the checkpoint file, False for none.
+            max_workers (int): Maximum number of securities downloaded at once.
+            retry_policy (RetryPolicy, optional): Attempts and backoff for failed windows.
+            progress (callable, optional): Called with the result of each security and the run statistics.
+
+        Returns:
+            dict: The run statistics.
+        """
+        from dhanhq.bulk_download import BulkDownloader
+
+        downloader = BulkDownloader(self, store, checkpoint, max_workers, retry_policy, progress)
+        return downloader.run(securities, from_date, to_date, interval, oi)
+
+    def _fetch_range(self, endpoint, payload, ranges, max_days, max_workers, caller):
+        try:
+            windows = [window for from_date, to_date in ranges
+                       for window in CandleWindows.date_windows(from_date, to_date, max_days)]
+        except ValueError as e:
+            logging.error('Exception in dhanhq>>%s: %s', caller, e)
+            return {
+                'status': 'failure',
+                'remarks': str(e),
+                'data': '',
+            }
+        calls = [('POST', endpoint, {**payload, 'fromDate': start, 'toDate': end}) for start, end in windows]
+        responses = self.dhan_http.execute_many(calls, max_workers)
+        for response in responses:
+            if response.get('status') != DhanHTTP.HttpResponseStatus.SUCCESS.value:
+                return response
+        return {
+            'status': DhanHTTP.HttpResponseStatus.SUCCESS.value,
+            'remarks': '',
+            'data': self._stitch_candles([response['data'] for response in responses]),
+        }
+
+    @staticmethod
+    def _stitch_candles(parts):
+        """Join the candle arrays of consecutive windows, ordered by timestamp, first of duplicates kept."""
+        import numpy as np
+
+        parts = [part for part in parts if isinstance(part, dict) and len(part.get('timestamp') or [])]
+        if not parts:
+            return {}
+        keys = [key for key in parts[0] if all(len(part.get(key) or []) == len(part['timestamp']) for part in parts)]
+        timestamps = np.concatenate([np.asarray(part['timestamp']) for part in parts])
+        order = np.argsort(timestamps, kind='stable')
+        keep = np.r_[True, timestamps[order][1:] != timestamps[order][:-1]]
+        order = order[keep]
+        return {key: np.concatenate([np.asarray(part[key]) for part in parts])[order].tolist() for key in keys}
+
+    @staticmethod
+    def candles_as_arrays(data):
+        """
+        Convert the candle data of a response to NumPy arrays in one pass per field.
+
+        Prices become float64 and volume and open interest int64 arrays, or float64 arrays if a
+        value is missing (None or NaN). Epoch timestamps become one datetime64[s] array of IST
+        wall-clock times, instead of a datetime per candle as convert_to_date_time would create.
+
+        Args:
+            data (dict): The 'data' of a historical data response: field name to list.
+
+        Returns:
+            dict: Field name to array; 'timestamp' is datetime64[s] in IST.
+        """
+        import numpy as np
+
+        arrays = {}
+        for field, values in (data or {}).items():
+            if field == 'timestamp':
+                epochs = np.asarray(values, dtype=np.int64) + HistoricalData.IST_OFFSET_SECONDS
+                arrays[field] = epochs.astype('datetime64[s]')
+            elif field in HistoricalData.INTEGER_FIELDS:
+                arrays[field] = HistoricalData._integer_column(values)
+            else:
+                arrays[field] = np.asarray(values, dtype=np.float64)
+        return arrays
+
+    @staticmethod
+    def _integer_column(values):
+        """Return counts as int64, or as float64 if any of them is missing."""
+        import numpy as np
+
+        column = np.asarray(values)
+        if column.dtype.kind in 'iu':
+            return column.astype(np.int64, copy=False)
+        column = np.asarray(values, dtype=np.float64)
+        if np.isnan(column).any():
+            return column
+        return column.astype(np.int64)
+
+    @staticmethod
+    def candles_as_frame(data):
+        """
+        Convert the candle data of a response to a DataFrame indexed by IST time.
+
+        The columns are built from the NumPy arrays of candles_as_arrays, without Python
+        objects per candle.
+
+        Args:
+            data (dict): The 'data' of a historical data response: field name to list.
+
+        Returns:
+            pd.DataFrame: One row per candle, indexed by a timezone-aware IST DatetimeIndex named 'timestamp'.
+        """
+        import pandas as pd
+
+        arrays = HistoricalData.candles_as_arrays(data)
+        timestamps = arrays.pop('timestamp', None)
+        if timestamps is None:
+            return pd.DataFrame(arrays)
+        index = pd.DatetimeIndex(timestamps, name='timestamp').tz_localize(HistoricalData.IST)
+        return pd.DataFrame(arrays, index=index)
+
+    @staticmethod
+    def resample_candles(data, interval, session='NSE'):
+        """
+        Build bars of a higher timeframe from 1 minute candles locally, e.g. 3, 10, 30 or 75 minute
+        bars or daily bars, instead of fetching them.
+
+        Bars are aligned to the session of the exchange; open interest keeps its last value.
+        See Resampler.resample.
+
+        Args:
+            data (dict): Candles ordered by time, as in the data of intraday_minute_data or candles_as_arrays.
+            interval (int | str): Bar length in minutes, or 'D' for daily bars.
+            session (str | tuple): Exchange ('NSE', 'MCX'), exchange segment or (start, end) times (default: NSE).
+
+        Returns:
+            dict: Field name to NumPy array, with timestamps of the same kind as the input.
+        """
+        from dhanhq.resample import Resampler
+        return Resampler.resample(data, interval, session)
+
+    @staticmethod
+    def _invalid_result(result, caller):
+        """Return the failure response of an unknown result mode, before any request is sent."""
+        if result in (None, HistoricalData.ARRAYS, HistoricalData.FRAME):
+            return None
+        err = "result value must be [None, 'arrays', 'frame']"
+        logging.error('Exception in dhanhq>>%s: %s', caller, err)
+        return {
+            'status': 'failure',
+            'remarks': err,
+            'data': '',
+        }
 
+    @staticmethod
+    def _candle_result(response, result):
+        if result is None or response.get('status') != DhanHTTP.HttpResponseStatus.SUCCESS.value:
+            return response
+        if result == HistoricalData.ARRAYS:
+            return {**response, 'data': HistoricalData.candles_as_arrays(response['data'])}
+        return {**response, 'data': HistoricalData.candles_as_frame(response['data'])}
@@ -1,3 +1,5 @@
+from dhanhq.prepared_order import PreparedOrder
+
 
 class Order:
 
@@ -170,3 +172,98 @@ class Order:
                                 order_type, product_type, price, trigger_price, disclosed_quantity,
                                 after_market_order, validity, amo_time,
                                 bo_profit_value, bo_stop_loss_Value, tag, True)
+
+    def prepare_order(self, security_id, exchange_segment, transaction_type, order_type, product_type,
+                      disclosed_quantity=0, after_market_order=False, validity='DAY', amo_time='OPEN',
+                      bo_profit_value=None, bo_stop_loss_Value=None, should_slice=False):
+        """
+        Validate and encode the fixed part of an order once, for fast repeated placement
+        with `place_prepared_order`.
+
+        Args:
+            security_id (str): The ID of the security to trade.
+            exchange_segment (str): The exchange segment (e.g., NSE, BSE).
+            transaction_type (str): The type of transaction (BUY/SELL).
+            order_type (str): The type of order (LIMIT, MARKET, etc.).
+            product_type (str): The product type (CNC, INTRA, etc.).
+            disclosed_quantity (int): The disclosed quantity for the order.
+            after_market_order (bool): Flag for after market order.
+            validity (str): The validity of the order (DAY, IOC, etc.).
+            amo_time (str): The time for AMO orders.
+            bo_profit_value (float): The profit value for BO orders.
+            bo_stop_loss_Value (float): The stop loss value for BO orders.
+            should_slice (bool): Place through the order slicing endpoint.
+
+        Returns:
+            PreparedOrder: The order template.
+
+        Raises:
+            ValueError: If a field is missing or invalid.
+        """
+        if not all([security_id, exchange_segment, transaction_type, order_type, product_type, validity]):
+            raise ValueError("Missing required parameters for preparing an order.")
+        if transaction_type.upper() not in ('BUY', 'SELL'):
+            raise ValueError("transaction_type must be either BUY or SELL.")
+        if after_market_order and (amo_time not in ['OPEN', 'OPEN_30', 'OPEN_60']):
+            raise ValueError("amo_time value must be one of ['OPEN','OPEN_30','OPEN_60']")
+
+        fields = {
+            "transactionType": transaction_type.upper(),
+            "exchangeSegment": exchange_segment.upper(),
+            "productType": product_type.upper(),
+            "orderType": order_type.upper(),
+            "validity": validity.upper(),
+            "securityId": str(security_id),
+            "disclosedQuantity": int(disclosed_quantity),
+            "afterMarketOrder": after_market_order,
+            "boProfitValue": bo_profit_value,
+            "boStopLossValue": bo_stop_loss_Value,
+        }
+        if after_market_order:
+            fields["amoTime"] = amo_time
+
+        endpoint = '/orders/slicing' if should_slice else '/orders'
+        return PreparedOrder(endpoint, fields, self.dhan_http.client_id)
+
+    def place_prepared_order(self, prepared_order, quantity, price=0, trigger_price=0, tag=None):
+        """
+        Place an order prepared with `prepare_order`. The send-to-ack latency of each placement
+        is logged, see `get_order_ack_latencies`.
+
+        Args:
+            prepared_order (PreparedOrder): The order template.
+            quantity (int): The quantity of the order.
+            price (float): The price of the order.
+            trigger_price (float): The trigger price for the order.
+            tag (str): Optional correlation ID for tracking.
+
+        Returns:
+            dict: The response containing the status of the order placement.
+        """
+        body = prepared_order.encode(((b'quantity', int(quantity)), (b'price', float(price)),
+                                      (b'triggerPrice', float(trigger_price))), tag)
+        return self.dhan_http.post_encoded(prepared_order.endpoint, body, tag or None)
+
+    def enable_low_latency_mode(self, connections=2, keep_alive_interval=20):
+        """
+        Open pooled connections to the API now and keep them warm, so that orders do not pay
+        DNS, TCP and TLS setup after an idle period.
+
+        Args:
+            connections (int): Number of connections to keep warm.
+            keep_alive_interval (float): Seconds between keep-alive requests.
+        """
+        self.dhan_http.start_keep_alive(keep_alive_interval, connections)
+
+    def disable_low_latency_mode(self):
+        """Stop keeping connections warm."""
+        self.dhan_http.stop_keep_alive()
+
+    def get_order_ack_latencies(self):
+        """
+        Retrieve the send-to-ack latencies of the most recent prepared order placements.
+
+        Returns:
+            list: Dicts of endpoint, order_id, correlation_id, status, latency (seconds) and sent_at.
+        """
+        return self.dhan_http.ack_log.entries()
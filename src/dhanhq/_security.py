@@ -92,18 +92,27 @@ class Security:
         return self.dhan_http.get(endpoint)
 
     @staticmethod
-    def fetch_security_list(mode='compact', filename='security_id_list.csv'):
+    def fetch_security_list(mode='compact', filename='security_id_list.csv', cache=None, stream=False,
+                            columns=None, exchange_segments=None, instruments=None):
         """
         Fetch CSV file from dhan based on the specified mode and save it to the current directory.
 
         Args:
             mode (str): The mode to fetch the CSV ('compact' or 'detailed').
             filename (str): The name of the file to save the CSV as (default is 'data.csv').
+            cache (bool | str | ScripMasterCache): Keep the parsed list in a binary on-disk cache
+                (True for ~/.cache/dhanhq, or a directory) instead of saving the CSV. It is
+                downloaded again only on a new day and only if the server copy has changed.
+            stream (bool): Write the CSV to disk as it arrives and parse it in blocks with compact
+                dtypes (categoricals for codes, int32 IDs unless one is blank or not a number,
+                float32 sizes), which keeps peak memory low.
+            columns (list, optional): Only return these CSV columns.
+            exchange_segments (list, optional): Only return these exchange segments, e.g. ['NSE_FNO'].
+            instruments (list, optional): Only return these instruments, e.g. ['OPTIDX'].
 
         Returns:
             pd.DataFrame: The DataFrame containing the CSV data.
         """
-        import pandas as pd
         try:
             if mode == 'compact':
                 csv_url = Security.COMPACT_CSV_URL
@@ -111,20 +120,15 @@ class Security:
                 csv_url = Security.DETAILED_CSV_URL
             else:
                 raise ValueError("Invalid mode. Choose 'compact' or 'detailed'.")
-
-            response = requests.get(csv_url)
-            response.raise_for_status()
-
-            with open(filename, 'wb') as f:
-                f.write(response.content)
-            df = pd.read_csv(filename)
-            return df
+            return Security._load_security_list(mode, csv_url, filename, cache, stream, columns,
+                                                exchange_segments, instruments)
         except Exception as e:
             logging.error('Exception in dhanhq>>fetch_security_list: %s', e)
             return None
 
     @staticmethod
-    def fetch_global_security_list(filename='global_security_id_list.csv'):
+    def fetch_global_security_list(filename='global_security_id_list.csv', cache=None, stream=False,
+                                   columns=None, instruments=None):
         """
         Fetch the Global Stocks (US) instrument list CSV from Dhan and save it to the
         current directory. This list is distinct from the Indian instrument list fetched
@@ -137,17 +141,109 @@ class Security:
 
         Args:
             filename (str): The name of the file to save the CSV as.
+            cache (bool | str | ScripMasterCache): Keep the parsed list in a binary on-disk cache
+                instead of saving the CSV; see fetch_security_list.
+            stream (bool): Stream and parse in blocks with compact dtypes; see fetch_security_list.
+            columns (list, optional): Only return these CSV columns.
+            instruments (list, optional): Only return these instruments.
 
         Returns:
             pd.DataFrame: The DataFrame containing the CSV data, or None on failure.
         """
-        import pandas as pd
         try:
-            response = requests.get(Security.GLOBAL_STOCKS_CSV_URL)
+            return Security._load_security_list('global', Security.GLOBAL_STOCKS_CSV_URL, filename, cache,
+                                                stream, columns, None, instruments)
+        except Exception as e:
+            logging.error('Exception in dhanhq>>fetch_global_security_list: %s', e)
+            return None
+
+    @staticmethod
+    def fetch_security_lists(sources=('compact', 'detailed', 'global'), directory='.', cache=None, processes=None,
+                             columns=None, exchange_segments=None, instruments=None):
+        """
+        Fetch several instrument lists concurrently, e.g. all of them before the market opens.
+
+        Every list is downloaded on its own thread and parsed in blocks with compact dtypes as
+        soon as it is complete; see fetch_security_list with stream=True.
+
+        Args:
+            sources (list): The lists to fetch: 'compact', 'detailed' and/or 'global'.
+            directory (str): Where to save the CSVs, as compact.csv, detailed.csv and global.csv.
+            cache (bool | str | ScripMasterCache): Load the lists through the binary on-disk cache
+                instead; see fetch_security_list.
+            processes (bool | int, optional): Parse the CSVs in a process pool (True for one process
+                per list) so that parsing does not hold up the other downloads.
+            columns (dict, optional): Only return these CSV columns, per list.
+            exchange_segments (list, optional): Only return these exchange segments, e.g. ['NSE_FNO'].
+            instruments (list, optional): Only return these instruments, e.g. ['OPTIDX'].
+
+        Returns:
+            dict: {'data': list name to pd.DataFrame, 'timings': list name to the download, parse and
+                total seconds and the number of rows}, or None on failure.
+        """
+        from dhanhq import scrip_master
+        from dhanhq.scrip_master_cache import ScripMasterCache
+        urls = {'compact': Security.COMPACT_CSV_URL, 'detailed': Security.DETAILED_CSV_URL,
+                'global': Security.GLOBAL_STOCKS_CSV_URL}
+        try:
+            unknown = [source for source in sources if source not in urls]
+            if unknown or not sources:
+                raise ValueError(f"Invalid sources {unknown}. Choose 'compact', 'detailed' and/or 'global'.")
+            loaded = scrip_master.fetch_all({source: urls[source] for source in sources}, directory, columns,
+                                            exchange_segments, instruments, ScripMasterCache.resolve(cache),
+                                            processes)
+            for source, (_, timing) in loaded.items():
+                logging.info('Fetched %s security list: %d rows in %.2fs', source, timing['rows'], timing['total'])
+            return {'data': {source: frame for source, (frame, _) in loaded.items()},
+                    'timings': {source: timing for source, (_, timing) in loaded.items()}}
+        except Exception as e:
+            logging.error('Exception in dhanhq>>fetch_security_lists: %s', e)
+            return None
+
+    @staticmethod
+    def _load_security_list(source, csv_url, filename, cache, stream, columns, exchange_segments, instruments):
+        import pandas as pd
+        from dhanhq import scrip_master
+        from dhanhq.scrip_master_cache import ScripMasterCache
+
+        scrip_master_cache = ScripMasterCache.resolve(cache)
+        if scrip_master_cache is not None:
+            df = scrip_master_cache.load(source, csv_url)
+        elif stream:
+            scrip_master.download(csv_url, filename)
+            return scrip_master.read(filename, source, columns, exchange_segments, instruments)
+        else:
+            response = requests.get(csv_url)
             response.raise_for_status()
+
             with open(filename, 'wb') as f:
                 f.write(response.content)
-            return pd.read_csv(filename)
+            df = pd.read_csv(filename)
+        return scrip_master.select(df, source, columns, exchange_segments, instruments)
+
+    @staticmethod
+    def fetch_instrument_master(mode='detailed', include_global=False, cache=None, exchange_segments=None,
+                                instruments=None, processes=None):
+        """
+        Fetch the instrument list from Dhan and index it for constant time lookups by
+        security ID, trading symbol, ISIN and option contract.
+
+        Args:
+            mode (str): The Indian instrument list to use ('compact' or 'detailed').
+            include_global (bool): Also load the Global Stocks (US) instrument list.
+            cache (bool | str | ScripMasterCache): Load the lists through the binary on-disk
+                cache; see fetch_security_list.
+            exchange_segments (list, optional): Only index these exchange segments, e.g. ['NSE_FNO'].
+            instruments (list, optional): Only index these instruments, e.g. ['OPTIDX'].
+            processes (bool | int, optional): Parse the lists in a process pool; see fetch_security_lists.
+
+        Returns:
+            InstrumentMaster: The indexed instrument master, or None on failure. Per-list timings
+                are in its `timings`.
+        """
+        from dhanhq.instruments import InstrumentMaster
+        try:
+            return InstrumentMaster.fetch(mode, include_global, cache, exchange_segments, instruments, processes)
         except Exception as e:
-            logging.error('Exception in dhanhq>>fetch_global_security_list: %s', e)
+            logging.error('Exception in dhanhq>>fetch_instrument_master: %s', e)
             return None
@@ -1,3 +1,6 @@
+from dhanhq.prepared_order import PreparedOrder
+
+
 class SuperOrder:
     """
     Interface to manage Dhan 'Super Orders', which are composite trading orders that include
@@ -134,31 +137,11 @@ class SuperOrder:
         if not all([security_id, exchange_segment, transaction_type, quantity, order_type, product_type, price]):
             raise ValueError("Missing required parameters for placing a super order.")
 
-        # Leg validation
-        if price <= 0:
-            raise ValueError("Price must be > 0.")
-
-        if targetPrice <= 0 and stopLossPrice <= 0:
-            raise ValueError("At least one of targetPrice or stopLossPrice must be provided and > 0.")
-
         transaction_type = transaction_type.upper()
         price = float(price)
         targetPrice = float(targetPrice)
         stopLossPrice = float(stopLossPrice)
-
-        # Logical leg validation
-        if transaction_type == "BUY":
-            if targetPrice > 0 and not (targetPrice > price):
-                raise ValueError("For BUY: targetPrice must be > price.")
-            if stopLossPrice > 0 and not (stopLossPrice < price):
-                raise ValueError("For BUY: stopLossPrice must be < price.")
-        elif transaction_type == "SELL":
-            if targetPrice > 0 and not (targetPrice < price):
-                raise ValueError("For SELL: targetPrice must be < price.")
-            if stopLossPrice > 0 and not (stopLossPrice > price):
-                raise ValueError("For SELL: stopLossPrice must be > price.")
-        else:
-            raise ValueError("transaction_type must be either BUY or SELL.")
+        SuperOrder._validate_legs(transaction_type, price, targetPrice, stopLossPrice)
 
         payload = {
             "transactionType": transaction_type,
@@ -180,3 +163,90 @@ class SuperOrder:
 
         return self.dhan_http.post(endpoint, payload)
 
+    def prepare_super_order(self, security_id, exchange_segment, transaction_type, order_type, product_type):
+        """
+        Validate and encode the fixed part of a super order once, for fast repeated placement
+        with `place_prepared_super_order`.
+
+        Args:
+            security_id (str): Instrument/security ID (required).
+            exchange_segment (str): Exchange (e.g., NSE, BSE).
+            transaction_type (str): BUY or SELL.
+            order_type (str): LIMIT, MARKET, etc.
+            product_type (str): CNC, INTRA, etc.
+
+        Returns:
+            PreparedOrder: The super order template.
+
+        Raises:
+            ValueError: If a field is missing or invalid.
+        """
+        if not all([security_id, exchange_segment, transaction_type, order_type, product_type]):
+            raise ValueError("Missing required parameters for preparing a super order.")
+        if transaction_type.upper() not in ("BUY", "SELL"):
+            raise ValueError("transaction_type must be either BUY or SELL.")
+
+        fields = {
+            "transactionType": transaction_type.upper(),
+            "exchangeSegment": exchange_segment.upper(),
+            "productType": product_type.upper(),
+            "orderType": order_type.upper(),
+            "securityId": str(security_id),
+        }
+        return PreparedOrder('/super/orders', fields, self.dhan_http.client_id)
+
+    def place_prepared_super_order(self, prepared_order, quantity, price, targetPrice=0.0, stopLossPrice=0.0,
+                                   trailingJump=0.0, tag=None):
+        """
+        Place a super order prepared with `prepare_super_order`. The legs are validated as in
+        `place_super_order`, and the send-to-ack latency is logged, see `get_order_ack_latencies`.
+
+        Args:
+            prepared_order (PreparedOrder): The super order template.
+            quantity (int): Order quantity (> 0).
+            price (float): Entry price.
+            targetPrice (float): Target price.
+            stopLossPrice (float): Stop loss price.
+            trailingJump (float): Trailing SL value.
+            tag (str): Optional correlation ID or tracking label.
+
+        Returns:
+            dict: The response containing the order placement status.
+
+        Raises:
+            ValueError: If quantity or the legs are invalid.
+        """
+        if not quantity:
+            raise ValueError("Missing required parameters for placing a super order.")
+        price = float(price)
+        targetPrice = float(targetPrice)
+        stopLossPrice = float(stopLossPrice)
+        SuperOrder._validate_legs(prepared_order.fields["transactionType"], price, targetPrice, stopLossPrice)
+
+        body = prepared_order.encode(((b'quantity', int(quantity)), (b'price', price),
+                                      (b'targetPrice', targetPrice), (b'stopLossPrice', stopLossPrice),
+                                      (b'trailingJump', float(trailingJump))), tag)
+        return self.dhan_http.post_encoded(prepared_order.endpoint, body, tag or None)
+
+    @staticmethod
+    def _validate_legs(transaction_type, price, targetPrice, stopLossPrice):
+        """Check the entry, target and stop-loss prices against each other."""
+        if price <= 0:
+            raise ValueError("Price must be > 0.")
+
+        if targetPrice <= 0 and stopLossPrice <= 0:
+            raise ValueError("At least one of targetPrice or stopLossPrice must be provided and > 0.")
+
+        if transaction_type == "BUY":
+            if targetPrice > 0 and not (targetPrice > price):
+                raise ValueError("For BUY: targetPrice must be > price.")
+            if stopLossPrice > 0 and not (stopLossPrice < price):
+                raise ValueError("For BUY: stopLossPrice must be < price.")
+        elif transaction_type == "SELL":
+            if targetPrice > 0 and not (targetPrice < price):
+                raise ValueError("For SELL: targetPrice must be < price.")
+            if stopLossPrice > 0 and not (stopLossPrice > price):
+                raise ValueError("For SELL: stopLossPrice must be > price.")
+        else:
+            raise ValueError("transaction_type must be either BUY or SELL.")
+
@@ -0,0 +1,353 @@
+"""
+    An asyncio based HTTP client for the DhanHQ REST APIs.
+
+    AsyncDhanHTTP speaks HTTP/1.1 directly over asyncio streams and keeps a pool of
+    keep-alive connections per host, so many REST calls can be in flight from a single
+    event loop without blocking it or hopping through an executor.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import asyncio
+import logging
+import ssl
+import time
+import zlib
+from collections import deque
+from urllib.parse import urlsplit
+
+from dhanhq import codec
+from dhanhq.dhan_http import DhanHTTP
+from dhanhq.metrics import MetricsRegistry
+from dhanhq.rate_limiter import RateLimiter
+from dhanhq.retry import RetryPolicy
+
+
+class AsyncResponse:
+    """Response of an AsyncDhanHTTP request, exposing what DhanHTTP._parse_response reads."""
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+
+class AsyncConnectionPool:
+    """
+    Pool of keep-alive connections to a single host.
+
+    At most `maxsize` requests are in flight at once; finished connections are parked and
+    reused by the next request until they have been idle for `idle_timeout` seconds.
+    """
+
+    """Methods sent again on a fresh connection when a parked one turns out to be closed"""
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self, host, port, use_ssl, maxsize=10, idle_timeout=30):
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl.create_default_context() if use_ssl else None
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self._semaphore = asyncio.Semaphore(maxsize)
+        self._idle = deque()
+
+    async def request(self, method, target, headers, body, timeout):
+        """
+        Send one request over a pooled connection and read the complete response.
+
+        Args:
+            method (str): The HTTP method.
+            target (str): The request target (path and query string).
+            headers (dict): The request headers.
+            body (bytes): The request body, or None.
+            timeout (float): Seconds allowed for the whole exchange.
+
+        Returns:
+            AsyncResponse: The response received from the server.
+        """
+        request_bytes = self._build_request(method, target, headers, body)
+        async with self._semaphore:
+            while True:
+                reader, writer, reused = await self._acquire(timeout)
+                written = []
+                try:
+                    response, keep_alive = await asyncio.wait_for(
+                        self._exchange(reader, writer, request_bytes, written), timeout)
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    self._close(writer)
+                    # A parked connection may have been closed by the server while idle. Send again
+                    # on a fresh one only if the server cannot have acted on the request: it is
+                    # idempotent, or it was never written. Orders are left to the retry policy,
+                    # which checks their correlation id first.
+                    safe = method in AsyncConnectionPool.IDEMPOTENT_METHODS or not written
+                    if reused and safe and not getattr(e, 'partial', b''):
+                        continue
+                    raise
+                except BaseException:
+                    self._close(writer)
+                    raise
+                if keep_alive:
+                    self._idle.append((reader, writer, asyncio.get_running_loop().time()))
+                else:
+                    self._close(writer)
+                return response
+
+    async def aclose(self):
+        """Close all idle connections held by the pool."""
+        while self._idle:
+            _, writer, _ = self._idle.popleft()
+            self._close(writer)
+
+    async def _acquire(self, timeout):
+        now = asyncio.get_running_loop().time()
+        while self._idle:
+            reader, writer, parked_at = self._idle.pop()
+            if now - parked_at < self.idle_timeout and not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            self._close(writer)
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=self.ssl_context,
+                                    server_hostname=self.host if self.ssl_context else None),
+            timeout)
+        return reader, writer, False
+
+    def _build_request(self, method, target, headers, body):
+        lines = [f'{method} {target} HTTP/1.1', f'Host: {self.host}']
+        lines.extend(f'{name}: {value}' for name, value in headers.items())
+        lines.append('Connection: keep-alive')
+        lines.append('Accept-Encoding: gzip')
+        if body is not None:
+            lines.append(f'Content-Length: {len(body)}')
+        head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+        return head + body if body is not None else head
+
+    async def _exchange(self, reader, writer, request_bytes, written):
+        writer.write(request_bytes)
+        await writer.drain()
+        written.append(True)
+
+        status_line = await reader.readuntil(b'\r\n')
+        parts = status_line.decode('latin-1').split(None, 2)
+        version, status_code = parts[0], int(parts[1])
+        headers = {}
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            if line == b'\r\n':
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' and (version != 'HTTP/1.0' or connection == 'keep-alive')
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            content = await self._read_chunked(reader)
+        elif 'content-length' in headers:
+            content = await reader.readexactly(int(headers['content-length']))
+        elif status_code in (204, 304) or 100 <= status_code < 200:
+            content = b''
+        else:
+            content = await reader.read()
+            keep_alive = False
+
+        if headers.get('content-encoding', '').lower() == 'gzip':
+            content = zlib.decompress(content, 16 + zlib.MAX_WBITS)
+        return AsyncResponse(status_code, headers, content), keep_alive
+
+    @staticmethod
+    async def _read_chunked(reader):
+        chunks = []
+        while True:
+            size_line = await reader.readuntil(b'\r\n')
+            size = int(size_line.split(b';', 1)[0].strip(), 16)
+            if size == 0:
+                # Skip optional trailers up to the terminating blank line.
+                while await reader.readuntil(b'\r\n') != b'\r\n':
+                    pass
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    @staticmethod
+    def _close(writer):
+        try:
+            writer.close()
+        except Exception:
+            pass
+
+
+class AsyncDhanHTTP(DhanHTTP):
+    """
+    Asyncio counterpart of DhanHTTP.
+
+    get/post/put/delete return coroutines resolving to the same status/remarks/data dict
+    DhanHTTP returns. Connections are pooled and kept alive per host; the pool is bound to
+    the event loop that first uses it. Rate limiting and retry backoff wait with
+    asyncio.sleep, so queued requests never block the loop.
+    """
+
+    ASYNC_DEFAULT_POOL_SIZE = 10
+    ASYNC_DEFAULT_IDLE_TIMEOUT = 30
+
+    def __init__(self, client_id, access_token, disable_ssl=False, pool_size=ASYNC_DEFAULT_POOL_SIZE,
+                 idle_timeout=ASYNC_DEFAULT_IDLE_TIMEOUT, **http_options):
+        """
+        Args:
+            client_id (str): The client ID of the Dhan account.
+            access_token (str): The access token for the Dhan API.
+            disable_ssl (bool): Flag to disable SSL.
+            pool_size (int): Maximum number of connections, and so of requests in flight, per host.
+            idle_timeout (float): Seconds an idle connection is kept for reuse.
+            **http_options: Further DhanHTTP options, e.g. rate_limiter, retry_policy or response_cache.
+        """
+        super().__init__(client_id, access_token, disable_ssl, **http_options)
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self._pools = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close all pooled connections."""
+        for pool in self._pools.values():
+            await pool.aclose()
+        self._pools.clear()
+
+    async def execute_many(self, calls, max_workers=None):
+        """
+        Send independent requests concurrently; see DhanHTTP.execute_many.
+
+        Args:
+            calls (iterable): Call descriptors (method, endpoint) or (method, endpoint, payload).
+            max_workers (int, optional): Maximum number of requests in flight. The pool size if omitted.
+
+        Returns:
+            list: The response dict of each call in input order.
+        """
+        semaphore = asyncio.Semaphore(max_workers) if max_workers else None
+
+        async def execute(call):
+            try:
+                method, endpoint, payload = DhanHTTP._parse_call(call)
+                if semaphore is None:
+                    return await self._send_request(method, endpoint, payload)
+                async with semaphore:
+                    return await self._send_request(method, endpoint, payload)
+            except Exception as e:
+                logging.error('Exception in AsyncDhanHTTP.execute_many %r: %s', call, e)
+                return {
+                    'status': DhanHTTP.HttpResponseStatus.FAILURE.value,
+                    'remarks': str(e),
+                    'data': '',
+                }
+
+        return list(await asyncio.gather(*(execute(call) for call in calls)))
+
+    async def post_encoded(self, endpoint, body, correlation_id=None):
+        """Coroutine version of DhanHTTP.post_encoded."""
+        started = time.perf_counter()
+        result = await self._send_cached(DhanHTTP.HttpMethods.POST, endpoint, body, correlation_id)
+        self.ack_log.record(endpoint, started, result, correlation_id)
+        return result
+
+    def _get_pool(self, scheme, host, port, risk_off=False):
+        # Risk-reducing calls get their own pool, so they never wait for a connection behind bulk requests.
+        key = (scheme, host, port, risk_off)
+        pool = self._pools.get(key)
+        if pool is None:
+            size = DhanHTTP.PRIORITY_POOL_SIZE if risk_off else self.pool_size
+            pool = AsyncConnectionPool(host, port, scheme == 'https', size, self.idle_timeout)
+            self._pools[key] = pool
+        return pool
+
+    async def _send_request(self, method, endpoint, payload=None):
+        correlation_id = None
+        if payload:
+            payload["dhanClientId"] = self.client_id
+            correlation_id = payload.get("correlationId")
+        coalesce_key = None if self.coalescer is None else self.coalescer.key(method.value, endpoint, payload)
+        if payload:
+            payload = codec.encode(payload)
+        if coalesce_key is None:
+            return await self._send_cached(method, endpoint, payload, correlation_id)
+        return await self.coalescer.do_async(coalesce_key,
+                                             lambda: self._send_cached(method, endpoint, payload, correlation_id))
+
+    async def _send_cached(self, method, endpoint, payload, correlation_id):
+        if self.response_cache is None:
+            return await self._send_with_retry(method, endpoint, payload, correlation_id)
+
+        cache_key = self.response_cache.key(method.value, endpoint, payload)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            generation = self.response_cache.generation(cache_key)
+        result = await self._send_with_retry(method, endpoint, payload, correlation_id)
+        if cache_key is not None:
+            self.response_cache.put(cache_key, result, generation)
+        else:
+            self.response_cache.invalidate_for_write(method.value, endpoint)
+        return result
+
+    async def _send_with_retry(self, method, endpoint, payload, correlation_id):
+        attempt = 0
+        while True:
+            attempt += 1
+            result, retryable = await self._send_once(method, endpoint, payload)
+            if not retryable or attempt >= self.retry_policy.max_attempts:
+                return result
+            retry_kind = self.retry_policy.retry_kind(method.value, endpoint, correlation_id)
+            if retry_kind is None:
+                return result
+            await asyncio.sleep(self.retry_policy.backoff(attempt))
+            if retry_kind == RetryPolicy.ORDER_PLACEMENT:
+                lookup = await self._send_request(DhanHTTP.HttpMethods.GET,
+                                                  RetryPolicy.correlation_endpoint(correlation_id))
+                outcome = RetryPolicy.placement_outcome(lookup)
+                if outcome == 'placed':
+                    return lookup
+                if outcome == 'unknown':
+                    return result
+            logging.warning('Retrying AsyncDhanHTTP.%s %s, attempt %d', method.value, endpoint, attempt + 1)
+
+    async def _send_once(self, method, endpoint, payload):
+        risk_off = DhanHTTP.priority_of(method.value, endpoint) is DhanHTTP.RequestPriority.RISK_OFF
+        delay = 0.0
+        if self.rate_limiter is not None:
+            reservation = self.rate_limiter.book(RateLimiter.classify(method.value, endpoint), risk_off)
+            slot = None
+            # Sleep again only if a priority request pushed the slot back meanwhile.
+            while (wait := self.rate_limiter.delay(reservation)) > 0 and reservation.at != slot:
+                slot = reservation.at
+                await asyncio.sleep(wait)
+                delay += wait
+        started = time.perf_counter() if self.metrics is not None else None
+        url = urlsplit(self.base_url + endpoint)
+        try:
+            pool = self._get_pool(url.scheme, url.hostname, url.port or (443 if url.scheme == 'https' else 80),
+                                  risk_off)
+            target = url.path + ('?' + url.query if url.query else '')
+            response = await pool.request(method.value, target, self.header, payload or None, self.timeout)
+        except Exception as e:
+            logging.error('Exception in AsyncDhanHTTP.%s: %s', method.value.upper(), e)
+            if started is not None:
+                self.metrics.record(method.value, endpoint, time.perf_counter() - started,
+                                    MetricsRegistry.TRANSPORT_ERROR, len(payload or b''), rate_limit_wait=delay)
+            retryable = self.retry_policy is not None and any((isinstance(e, asyncio.TimeoutError),
+                                                               self.retry_policy.is_retryable_exception(e)))
+            return {
+                'status': DhanHTTP.HttpResponseStatus.FAILURE.value,
+                'remarks': str(e) or type(e).__name__,
+                'data': '',
+            }, retryable
+        retryable = self.retry_policy is not None and self.retry_policy.is_retryable_status(response.status_code)
+        result = self._parse_response(response)
+        if started is not None:
+            self._record_metrics(method, endpoint, started, payload, response, result, delay)
+        return result, retryable
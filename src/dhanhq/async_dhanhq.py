@@ -0,0 +1,145 @@
+"""
+    An asyncio facade over the core DhanHQ APIs.
+
+    AsyncDhanHQ exposes every REST method of `dhanhq` as a coroutine. Requests go through
+    AsyncDhanHTTP, so they share one pool of keep-alive connections and never block the loop.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import asyncio
+import inspect
+
+from dhanhq.async_dhan_http import AsyncDhanHTTP
+from dhanhq.dhanhq import dhanhq
+
+
+class _AsyncDhanContext:
+    """DhanContext stand-in that hands the mixins an AsyncDhanHTTP (or a bridge to it)."""
+
+    def __init__(self, dhan_context, dhan_http):
+        self.dhan_context = dhan_context
+        self.dhan_http = dhan_http
+
+    def get_client_id(self):
+        return self.dhan_context.get_client_id()
+
+    def get_access_token(self):
+        return self.dhan_context.get_access_token()
+
+    def get_dhan_http(self):
+        return self.dhan_http
+
+    def get_dhan_login(self):
+        return self.dhan_context.get_dhan_login()
+
+
+class _LoopBridgeHTTP:
+    """
+    Blocking HTTP facade for mixin methods that post-process responses.
+
+    Such methods run in a worker thread; their requests are still sent over the event
+    loop's connection pool.
+    """
+
+    def __init__(self, async_http):
+        self.async_http = async_http
+        self.loop = None
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def get(self, endpoint):
+        return self._run(self.async_http.get(endpoint))
+
+    def post(self, endpoint, payload):
+        return self._run(self.async_http.post(endpoint, payload))
+
+    def put(self, endpoint, payload):
+        return self._run(self.async_http.put(endpoint, payload))
+
+    def delete(self, endpoint):
+        return self._run(self.async_http.delete(endpoint))
+
+    def execute_many(self, calls, max_workers=None):
+        return self._run(self.async_http.execute_many(calls, max_workers))
+
+
+class AsyncDhanHQ:
+    """
+    Asyncio version of `dhanhq`.
+
+    Every REST method of `dhanhq` is available under the same name and signature as a
+    coroutine, e.g. `await dhan.get_order_list()`. Use it as an async context manager, or
+    call `aclose()` when done, to release pooled connections.
+    """
+
+    """Methods that post-process responses or do blocking I/O; they run in a worker thread"""
+    THREADED_METHODS = {'generate_tpin', 'open_browser_for_tpin', 'fetch_security_list',
+                        'fetch_global_security_list', 'fetch_security_lists', 'fetch_instrument_master',
+                        'intraday_minute_data', 'historical_daily_data', 'intraday_minute_data_range',
+                        'historical_daily_data_range', 'sync_candles', 'bulk_download',
+                        'expired_options_sweep'}
+
+    """Methods that do no I/O and are exposed as plain functions"""
+    SYNC_METHODS = {'convert_to_date_time', 'candles_as_arrays', 'candles_as_frame', 'resample_candles'}
+
+    """Methods with no asyncio counterpart: use asyncio.gather or dhan_http.execute_many instead of
+    batch; the connection pool already keeps connections alive for its idle timeout"""
+    EXCLUDED_METHODS = {'batch', 'enable_low_latency_mode', 'disable_low_latency_mode'}
+
+    def __init__(self, dhan_context, pool_size=AsyncDhanHTTP.ASYNC_DEFAULT_POOL_SIZE, **http_options):
+        """
+        Args:
+            dhan_context (DhanContext): The context providing client id and access token.
+            pool_size (int): Maximum number of connections, and so of requests in flight.
+            **http_options: Further AsyncDhanHTTP options, e.g. rate_limiter or retry_policy.
+        """
+        self.dhan_http = AsyncDhanHTTP(dhan_context.get_client_id(), dhan_context.get_access_token(),
+                                       pool_size=pool_size, **http_options)
+        self._dhan = dhanhq(_AsyncDhanContext(dhan_context, self.dhan_http))
+        self._bridge = _LoopBridgeHTTP(self.dhan_http)
+        self._threaded_dhan = dhanhq(_AsyncDhanContext(dhan_context, self._bridge))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close all pooled connections."""
+        await self.dhan_http.aclose()
+
+    async def _call(self, name, *args, **kwargs):
+        result = getattr(self._dhan, name)(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _call_in_thread(self, name, *args, **kwargs):
+        self._bridge.loop = asyncio.get_running_loop()
+        return await asyncio.to_thread(getattr(self._threaded_dhan, name), *args, **kwargs)
+
+
+def _make_coroutine_method(name, threaded):
+    async def method(self, *args, **kwargs):
+        if threaded:
+            return await self._call_in_thread(name, *args, **kwargs)
+        return await self._call(name, *args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = f'AsyncDhanHQ.{name}'
+    method.__doc__ = getattr(dhanhq, name).__doc__
+    return method
+
+
+for _name, _value in inspect.getmembers(dhanhq):
+    if _name.startswith('_') or hasattr(AsyncDhanHQ, _name) or _name in AsyncDhanHQ.EXCLUDED_METHODS:
+        continue
+    if not callable(_value) or _name in AsyncDhanHQ.SYNC_METHODS:
+        # Static lookup keeps static methods static.
+        setattr(AsyncDhanHQ, _name, inspect.getattr_static(dhanhq, _name))
+    else:
+        setattr(AsyncDhanHQ, _name, _make_coroutine_method(_name, _name in AsyncDhanHQ.THREADED_METHODS))
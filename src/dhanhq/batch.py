@@ -0,0 +1,90 @@
+"""
+    Concurrent execution of independent DhanHQ API calls.
+
+    Calls collected in a Batch run over a bounded worker pool when the batch is executed. They
+    share the client's pooled session and rate limiter, and results come back in the order
+    the calls were added.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from dhanhq.dhan_http import DhanHTTP
+
+
+class Batch:
+    """
+    Collects API calls and runs them concurrently.
+
+    Use it as a context manager: calls added inside the block run when it exits, e.g.
+
+        with dhan.batch() as batch:
+            for order_id in order_ids:
+                batch.add(dhan.get_order_by_id, order_id)
+        statuses = batch.results
+    """
+
+    def __init__(self, max_workers=DhanHTTP.BATCH_DEFAULT_WORKERS):
+        """
+        Args:
+            max_workers (int): Maximum number of calls in flight.
+        """
+        self.max_workers = max_workers
+        self.results = None
+        self._calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.execute()
+
+    def __len__(self):
+        return len(self._calls)
+
+    def add(self, func, *args, **kwargs):
+        """
+        Add a call to the batch.
+
+        Args:
+            func (callable): An API method, e.g. dhan.get_order_by_id.
+            *args: Positional arguments of the call.
+            **kwargs: Keyword arguments of the call.
+
+        Returns:
+            int: Position of the call's result in `results`.
+        """
+        self._calls.append((func, args, kwargs))
+        return len(self._calls) - 1
+
+    def execute(self):
+        """
+        Run the collected calls concurrently.
+
+        Returns:
+            list: The result of each call in the order added. A call that raised has a failure response.
+        """
+        calls, self._calls = self._calls, []
+        if not calls:
+            self.results = []
+            return self.results
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(calls))) as executor:
+            self.results = list(executor.map(Batch._run, calls))
+        return self.results
+
+    @staticmethod
+    def _run(call):
+        func, args, kwargs = call
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            logging.error('Exception in dhanhq>>batch %s: %s', getattr(func, '__name__', func), e)
+            return {
+                'status': DhanHTTP.HttpResponseStatus.FAILURE.value,
+                'remarks': str(e),
+                'data': '',
+            }
@@ -0,0 +1,295 @@
+"""
+    Resumable bulk download of historical candles.
+
+    BulkDownloader backfills the candles of many securities, e.g. the whole F&O universe and
+    every NSE equity from the instrument master, into a CandleStore. Securities are downloaded
+    by a bounded pool of workers, each window of a security is written to the store as soon as
+    it arrives, and finished securities are recorded in an append-only checkpoint, so an
+    interrupted run (a crash, Ctrl+C or an expired token) continues where it stopped. Ranges
+    that reach today are left to the store's coverage instead, as today's candles are fetched
+    again until the day is over.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+import numpy as np
+
+from dhanhq.candle_store import CandleStore
+from dhanhq.candle_windows import CandleWindows
+from dhanhq.dhan_http import DhanHTTP
+from dhanhq.retry import RetryPolicy
+
+
+class BulkDownloader:
+    """Downloads the candles of many securities into a CandleStore, resuming from a checkpoint."""
+
+    """Securities downloaded at once; each has one request in flight, within the 5 per second data API limit"""
+    DEFAULT_WORKERS = 5
+
+    """Error codes of an invalid or expired access token; the run stops instead of failing every security"""
+    AUTH_ERROR_CODES = ('DH-901',)
+
+    """Error codes of rate limiting, server and network errors, which are retried; others fail the window at once"""
+    TRANSIENT_ERROR_CODES = ('DH-904', 'DH-908', 'DH-909', '800', '805')
+
+    """Security states in the checkpoint"""
+    DONE = 'done'
+    FAILED = 'failed'
+
+    CHECKPOINT_DIRECTORY = 'checkpoints'
+
+    def __init__(self, dhan, store=True, checkpoint=None, max_workers=DEFAULT_WORKERS, retry_policy=None,
+                 progress=None):
+        """
+        Args:
+            dhan (dhanhq): The client whose historical data APIs are used.
+            store (bool | str | CandleStore): The store; True for ~/.cache/dhanhq/candles, or a directory.
+            checkpoint (str | bool, optional): Path of the checkpoint file, False for none
+                (default: a file per interval in the store's 'checkpoints' directory).
+            max_workers (int): Maximum number of securities downloaded at once.
+            retry_policy (RetryPolicy, optional): Attempts and backoff for failed windows (default: RetryPolicy()).
+            progress (callable, optional): Called with the result dict of each security and the run
+                statistics when the security is finished.
+        """
+        self.dhan = dhan
+        self.store = CandleStore.resolve(store)
+        self.checkpoint = checkpoint
+        self.max_workers = max_workers
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.progress = progress
+        self.stats = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    @staticmethod
+    def securities(master, exchange_segments=None, instruments=None):
+        """
+        Return the securities of an instrument master, as accepted by `run`.
+
+        Args:
+            master (InstrumentMaster): The instrument master.
+            exchange_segments (list, optional): Only these segments, e.g. ['NSE_EQ', 'NSE_FNO'].
+            instruments (list, optional): Only these instruments, e.g. ['EQUITY', 'FUTSTK'].
+
+        Returns:
+            list: (security_id, exchange_segment, instrument_type) tuples.
+        """
+        columns = master.columns
+        mask = np.ones(len(master), dtype=bool)
+        if exchange_segments is not None:
+            mask &= np.isin(columns['exchange_segment'], list(exchange_segments))
+        if instruments is not None:
+            mask &= np.isin(columns['instrument'], list(instruments))
+        return list(zip(columns['security_id'][mask].tolist(), columns['exchange_segment'][mask].tolist(),
+                        columns['instrument'][mask].tolist()))
+
+    def checkpoint_path(self, interval, oi=False):
+        """Return the checkpoint file of an interval, or None if checkpoints are off."""
+        if self.checkpoint is False:
+            return None
+        if self.checkpoint:
+            return self.checkpoint
+        name = f'{interval}-oi.jsonl' if oi else f'{interval}.jsonl'
+        return os.path.join(self.store.directory, BulkDownloader.CHECKPOINT_DIRECTORY, name)
+
+    def stop(self):
+        """Let the running securities finish their current window, then end the run."""
+        self._stop.set()
+
+    def run(self, securities, from_date, to_date, interval='D', oi=False):
+        """
+        Download the candles of a range for many securities.
+
+        Securities the checkpoint records as done for the same range are skipped, and of the
+        others only the windows the store has not covered yet are fetched. A range that ends
+        after today's IST midnight is not recorded as done, so the next run fetches today's
+        candles again. A window that fails with a rate limit, server or network error is retried
+        with backoff; when its attempts are used up, or on any other error, the security is
+        recorded as failed and tried again by the next run. An invalid or expired token stops the run.
+
+        Args:
+            securities (iterable | InstrumentMaster): (security_id, exchange_segment, instrument_type)
+                tuples, or an instrument master for all of its securities.
+            from_date (str | date | datetime): Start of the range, in IST.
+            to_date (str | date | datetime): End of the range, not included, in IST.
+            interval (str | int): 'D' for daily candles, or 1, 5, 15, 25 or 60 minutes.
+            oi (bool): Fetch Open Interest data (default: False).
+
+        Returns:
+            dict: Run statistics: numbers of securities, done, failed and skipped securities, requests,
+                retries, candles, elapsed seconds, throughput, and 'stopped' with the remarks of a stop.
+        """
+        if not isinstance(securities, (list, tuple)):
+            securities = self.securities(securities) if hasattr(securities, 'columns') else list(securities)
+        if interval != CandleStore.DAILY and interval not in [1, 5, 15, 25, 60]:
+            raise ValueError("interval value must be ['D', 1, 5, 15, 25, 60]")
+
+        job = {'from_date': str(from_date), 'to_date': str(to_date), 'interval': interval, 'oi': oi}
+        path = self.checkpoint_path(interval, oi)
+        finished = self._read_checkpoint(path, job)
+        # Until the day is over the store does not cover today, so neither may the checkpoint.
+        complete = CandleStore.to_datetime(to_date) <= CandleWindows.today()
+        pending = [tuple(map(str, security)) for security in securities
+                   if finished.get(self._key(*security)) != BulkDownloader.DONE]
+        self._stop.clear()
+        self.stats = {'securities': len(securities), 'done': 0, 'failed': 0,
+                      'skipped': len(securities) - len(pending), 'requests': 0, 'retries': 0, 'candles': 0,
+                      'elapsed': 0.0, 'candles_per_second': 0.0, 'requests_per_second': 0.0, 'stopped': None}
+        start = time.perf_counter()
+
+        with self._open_checkpoint(path, job, finished) as checkpoint:
+            def download(security):
+                if self._stop.is_set():
+                    return
+                result = self._download(*security, from_date, to_date, interval, oi)
+                if result['status'] is None:
+                    return
+                with self._lock:
+                    if checkpoint is not None and (complete or result['status'] == BulkDownloader.FAILED):
+                        checkpoint.write(json.dumps({'key': self._key(*security), 'status': result['status']}) + '\n')
+                        checkpoint.flush()
+                    self.stats[result['status']] += 1
+                    self._update_throughput(start)
+                if self.progress is not None:
+                    self.progress(result, dict(self.stats))
+
+            if pending:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+                    list(executor.map(download, pending))
+        self._update_throughput(start)
+        return dict(self.stats)
+
+    def _download(self, security_id, exchange_segment, instrument_type, from_date, to_date, interval, oi):
+        key = (security_id, exchange_segment, instrument_type, interval, oi)
+        result = {'security_id': security_id, 'exchange_segment': exchange_segment,
+                  'instrument_type': instrument_type, 'status': BulkDownloader.DONE, 'windows': 0, 'candles': 0,
+                  'seconds': 0.0, 'remarks': ''}
+        start = time.perf_counter()
+        endpoint, payload, max_days = CandleWindows.request(security_id, exchange_segment, instrument_type, interval,
+                                                            oi)
+        try:
+            windows = [window for gap_start, gap_end in self.store.missing(*key, from_date=from_date, to_date=to_date)
+                       for window in CandleWindows.date_windows(CandleWindows.format_time(gap_start),
+                                                                CandleWindows.format_time(gap_end), max_days)]
+        except ValueError as e:
+            logging.error('Exception in BulkDownloader.run for %s: %s', self._key(security_id, exchange_segment), e)
+            return {**result, 'status': BulkDownloader.FAILED, 'remarks': str(e)}
+
+        for window_start, window_end in windows:
+            if self._stop.is_set():
+                return {**result, 'status': None}
+            response = self._fetch(endpoint, {**payload, 'fromDate': window_start, 'toDate': window_end})
+            if response.get('status') != DhanHTTP.HttpResponseStatus.SUCCESS.value:
+                status = None if self._stop.is_set() else BulkDownloader.FAILED
+                return {**result, 'status': status, 'remarks': response.get('remarks'),
+                        'seconds': time.perf_counter() - start}
+            candles = self._window_candles(response['data'], window_start, window_end)
+            covered = CandleWindows.final_range(CandleStore.to_datetime(window_start),
+                                                CandleStore.to_datetime(window_end))
+            self.store.append(*key, candles=candles, covered=[covered])
+            count = len(candles.get(CandleStore.TIMESTAMP, ()))
+            result['windows'] += 1
+            result['candles'] += count
+            with self._lock:
+                self.stats['candles'] += count
+        result['seconds'] = time.perf_counter() - start
+        return result
+
+    def _fetch(self, endpoint, payload):
+        attempt = 0
+        while True:
+            attempt += 1
+            with self._lock:
+                self.stats['requests'] += 1
+            try:
+                response = self.dhan.dhan_http.post(endpoint, payload)
+            except Exception as e:
+                response = {'status': DhanHTTP.HttpResponseStatus.FAILURE.value, 'remarks': str(e), 'data': ''}
+            if response.get('status') == DhanHTTP.HttpResponseStatus.SUCCESS.value:
+                return response
+            remarks = response.get('remarks')
+            if isinstance(remarks, dict) and remarks.get('error_code') in BulkDownloader.AUTH_ERROR_CODES:
+                logging.error('BulkDownloader.run stopped: %s', remarks)
+                with self._lock:
+                    self.stats['stopped'] = remarks
+                self._stop.set()
+                return response
+            if not self._is_transient(remarks) or attempt >= self.retry_policy.max_attempts or self._stop.is_set():
+                logging.error('BulkDownloader.run failed for %s:%s %s to %s: %s', payload['exchangeSegment'],
+                              payload['securityId'], payload['fromDate'], payload['toDate'], remarks)
+                return response
+            logging.warning('Retrying BulkDownloader window %s:%s %s to %s, attempt %d', payload['exchangeSegment'],
+                            payload['securityId'], payload['fromDate'], payload['toDate'], attempt + 1)
+            with self._lock:
+                self.stats['retries'] += 1
+            self.retry_policy.sleep(self.retry_policy.backoff(attempt))
+
+    @staticmethod
+    def _is_transient(remarks):
+        # Text remarks are transport errors, or error pages that are not JSON as gateways return on 5xx.
+        return not isinstance(remarks, dict) or remarks.get('error_code') in BulkDownloader.TRANSIENT_ERROR_CODES
+
+    @staticmethod
+    def _window_candles(data, window_start, window_end):
+        # Windows share their boundaries; keeping each window's candles within [start, end)
+        # stores every candle once and lets the store append instead of merging.
+        if not isinstance(data, dict) or not len(data.get(CandleStore.TIMESTAMP) or []):
+            return {}
+        timestamps = np.asarray(data[CandleStore.TIMESTAMP], dtype=np.int64)
+        keep = (timestamps >= CandleStore.to_epoch(window_start)) & (timestamps < CandleStore.to_epoch(window_end))
+        return {field: np.asarray(values)[keep] for field, values in data.items()
+                if len(values or []) == len(timestamps)}
+
+    def _update_throughput(self, start):
+        elapsed = time.perf_counter() - start
+        self.stats['elapsed'] = elapsed
+        if elapsed > 0:
+            self.stats['candles_per_second'] = self.stats['candles'] / elapsed
+            self.stats['requests_per_second'] = self.stats['requests'] / elapsed
+
+    @staticmethod
+    def _key(security_id, exchange_segment, *_):
+        return f'{exchange_segment}:{security_id}'
+
+    @staticmethod
+    def _read_checkpoint(path, job):
+        """Return the state of every finished security, or nothing if the checkpoint is of another job."""
+        finished = {}
+        if path is None:
+            return finished
+        try:
+            with open(path) as f:
+                if json.loads(f.readline()) != job:
+                    return {}
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # The last line of an interrupted run may be cut short.
+                    finished[entry['key']] = entry['status']
+        except (OSError, ValueError):
+            return {}
+        return finished
+
+    @staticmethod
+    def _open_checkpoint(path, job, finished):
+        """Rewrite the checkpoint compacted, so that the run appends to a well-formed file."""
+        if path is None:
+            return nullcontext()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temporary = f'{path}.tmp'
+        with open(temporary, 'w') as f:
+            f.write(json.dumps(job) + '\n')
+            for key, status in finished.items():
+                f.write(json.dumps({'key': key, 'status': status}) + '\n')
+        os.replace(temporary, path)
+        return open(path, 'a')
@@ -0,0 +1,294 @@
+"""
+    Persistent local store of historical candles.
+
+    CandleStore keeps the candles of each (security ID, exchange segment, instrument, interval,
+    OI flag) series as one append-only binary file per field, memory-mapped on read, plus the
+    date ranges already fetched from Dhan. HistoricalData.sync_candles uses it to fetch only the
+    ranges that are missing, so a daily sync of thousands of securities downloads one day each.
+    Stored rows are never changed in place, so arrays that were read stay valid while a series
+    is appended to or rewritten.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+
+
+class CandleStore:
+    """Append-only columnar candle files with the fetched date ranges of every series."""
+
+    DEFAULT_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'dhanhq', 'candles')
+    IST = timezone(timedelta(hours=5, minutes=30))
+    META_FILE = 'meta.json'
+    FORMAT_VERSION = 2
+
+    """Interval of daily candles; intraday intervals are minutes"""
+    DAILY = 'D'
+
+    """Stored fields and their dtypes, as in HistoricalData.candles_as_arrays; timestamps are epoch seconds"""
+    TIMESTAMP = 'timestamp'
+    FIELDS = {
+        TIMESTAMP: np.int64,
+        'open': np.float64,
+        'high': np.float64,
+        'low': np.float64,
+        'close': np.float64,
+        'volume': np.int64,
+        'open_interest': np.int64,
+    }
+
+    def __init__(self, directory=None):
+        """
+        Args:
+            directory (str): Directory holding the candles (default ~/.cache/dhanhq/candles).
+        """
+        self.directory = directory or CandleStore.DEFAULT_DIRECTORY
+
+    @staticmethod
+    def resolve(store):
+        """
+        Turn the `store` argument of HistoricalData.sync_candles into a store.
+
+        Args:
+            store (bool | str | CandleStore): True for the default directory, a directory path or a store.
+
+        Returns:
+            CandleStore: The store.
+        """
+        if isinstance(store, CandleStore):
+            return store
+        return CandleStore(None if store is True or store is None else store)
+
+    @staticmethod
+    def to_datetime(value):
+        """Return a naive IST datetime for a date, datetime or 'YYYY-MM-DD[ HH:MM:SS]' string."""
+        if isinstance(value, datetime):
+            return value.astimezone(CandleStore.IST).replace(tzinfo=None) if value.tzinfo else value
+        if isinstance(value, date):
+            return datetime.combine(value, datetime.min.time())
+        return datetime.fromisoformat(str(value))
+
+    @staticmethod
+    def to_epoch(value):
+        """Return the epoch seconds of a date, datetime or string in IST."""
+        return int(CandleStore.to_datetime(value).replace(tzinfo=CandleStore.IST).timestamp())
+
+    def path(self, security_id, exchange_segment, instrument_type, interval, oi=False):
+        """Return the directory of one series."""
+        return os.path.join(self.directory, str(exchange_segment), str(instrument_type), str(security_id),
+                            f'{interval}-oi' if oi else str(interval))
+
+    def read_meta(self, security_id, exchange_segment, instrument_type, interval, oi=False):
+        """
+        Return the metadata of a series: number of rows, fields and fetched ranges.
+
+        Returns:
+            dict: The metadata, or None if nothing is stored or it is of another format version.
+        """
+        return self._read_meta(self.path(security_id, exchange_segment, instrument_type, interval, oi))
+
+    def coverage(self, security_id, exchange_segment, instrument_type, interval, oi=False):
+        """
+        Return the date ranges already fetched for a series.
+
+        Returns:
+            list: (from, to) datetimes in IST, sorted and not overlapping.
+        """
+        meta = self.read_meta(security_id, exchange_segment, instrument_type, interval, oi)
+        return [tuple(datetime.fromisoformat(value) for value in span) for span in (meta or {}).get('coverage', [])]
+
+    def missing(self, security_id, exchange_segment, instrument_type, interval, oi=False, *, from_date, to_date):
+        """
+        Return the parts of a date range that have not been fetched yet.
+
+        Args:
+            from_date (str | date | datetime): Start of the range, in IST.
+            to_date (str | date | datetime): End of the range, in IST.
+
+        Returns:
+            list: (from, to) datetimes in IST.
+        """
+        start, end = self.to_datetime(from_date), self.to_datetime(to_date)
+        gaps = []
+        for covered_start, covered_end in self.coverage(security_id, exchange_segment, instrument_type, interval, oi):
+            if covered_end <= start or covered_start >= end:
+                continue
+            if covered_start > start:
+                gaps.append((start, covered_start))
+            start = max(start, covered_end)
+        if start < end:
+            gaps.append((start, end))
+        return gaps
+
+    def read(self, security_id, exchange_segment, instrument_type, interval, oi=False, from_date=None,
+             to_date=None):
+        """
+        Return the stored candles of a series as memory-mapped arrays.
+
+        Args:
+            from_date (str | date | datetime, optional): Only candles from this time on, in IST.
+            to_date (str | date | datetime, optional): Only candles before this time, in IST.
+
+        Returns:
+            dict: Field name to array, ordered by timestamp; empty arrays if nothing is stored.
+        """
+        path = self.path(security_id, exchange_segment, instrument_type, interval, oi)
+        meta = self._read_meta(path)
+        fields = meta['fields'] if meta and meta['fields'] else [CandleStore.TIMESTAMP]
+        if not meta or not meta['rows']:
+            return {field: np.empty(0, dtype=CandleStore.FIELDS[field]) for field in fields}
+        columns = {field: np.memmap(os.path.join(path, f'{field}.bin'), dtype=CandleStore.FIELDS[field], mode='r',
+                                    shape=(meta['rows'],)) for field in fields}
+        timestamps = columns[CandleStore.TIMESTAMP]
+        start = 0 if from_date is None else np.searchsorted(timestamps, self.to_epoch(from_date))
+        stop = len(timestamps) if to_date is None else np.searchsorted(timestamps, self.to_epoch(to_date))
+        return {field: values[start:stop] for field, values in columns.items()}
+
+    def append(self, security_id, exchange_segment, instrument_type, interval, oi=False, candles=None,
+               covered=()):
+        """
+        Add candles to a series and record the ranges they were fetched for.
+
+        Candles after the last stored one are appended to the files. Candles that replace stored
+        ones, such as a re-fetched trading day, or come before them (a backfill) are merged in by
+        writing the series anew and swapping it in, so arrays already read are left untouched.
+        Of candles with the same timestamp the newly added one is kept, so a re-fetched,
+        completed candle replaces a partial one. Missing volume and open interest are stored as 0.
+
+        Args:
+            candles (dict): Field name to list or array, as in the data of a historical data response.
+            covered (list): (from, to) ranges in IST that the candles were fetched for, including
+                parts without candles such as holidays.
+        """
+        path = self.path(security_id, exchange_segment, instrument_type, interval, oi)
+        meta = self._read_meta(path) or {'rows': 0, 'fields': [], 'coverage': []}
+        candles = {field: self._as_field(field, values)
+                   for field, values in (candles or {}).items() if field in CandleStore.FIELDS}
+        count = len(candles.get(CandleStore.TIMESTAMP, ()))
+        if count and not meta['rows']:
+            meta['fields'] = [field for field in CandleStore.FIELDS if field in candles]
+        if count:
+            order = np.argsort(candles[CandleStore.TIMESTAMP], kind='stable')
+            timestamps = candles[CandleStore.TIMESTAMP][order]
+            # Stable order puts the last added candle last among equal timestamps; keep that one.
+            order = order[np.r_[timestamps[1:] != timestamps[:-1], True]]
+            candles = {field: (candles[field] if field in candles else self._missing(field, count))[order]
+                       for field in meta['fields']}
+            count = len(order)
+
+        coverage = [tuple(datetime.fromisoformat(value) for value in span) for span in meta['coverage']]
+        coverage += [(self.to_datetime(start), self.to_datetime(end)) for start, end in covered]
+        coverage = self._merge_ranges(coverage)
+        meta['coverage'] = [[start.isoformat(), end.isoformat()] for start, end in coverage]
+
+        os.makedirs(path, exist_ok=True)
+        if not count:
+            self._write_meta(path, meta)
+            return
+        start = meta['rows']
+        if start:
+            stored = self.read(security_id, exchange_segment, instrument_type, interval, oi)
+            timestamps = stored[CandleStore.TIMESTAMP]
+            first = int(np.searchsorted(timestamps, candles[CandleStore.TIMESTAMP][0]))
+            if first < start:
+                self._rewrite(path, meta, self._merge(stored, candles, first, meta['fields']))
+                return
+            del stored, timestamps
+        for field in meta['fields']:
+            with open(os.path.join(path, f'{field}.bin'), 'ab') as f:
+                # Drops whatever an interrupted append left after the recorded rows, which no reader maps.
+                f.truncate(start * np.dtype(CandleStore.FIELDS[field]).itemsize)
+                f.write(candles[field].tobytes())
+        meta['rows'] = start + count
+        self._write_meta(path, meta)
+
+    def clear(self, security_id=None, exchange_segment=None, instrument_type=None, interval=None, oi=False):
+        """
+        Delete one series, or the whole store when no series is given.
+        """
+        if security_id is None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+        else:
+            shutil.rmtree(self.path(security_id, exchange_segment, instrument_type, interval, oi), ignore_errors=True)
+
+    @staticmethod
+    def _merge(stored, candles, first, fields):
+        """Merge sorted new candles into the stored ones, of which rows from `first` on may be replaced."""
+        timestamps = stored[CandleStore.TIMESTAMP]
+        if np.isin(timestamps[first:], candles[CandleStore.TIMESTAMP]).all():
+            # A re-fetched tail: the new candles replace every stored one from `first` on.
+            return {field: np.concatenate([stored[field][:first], candles[field]]) for field in fields}
+        timestamps = np.concatenate([timestamps, candles[CandleStore.TIMESTAMP]])
+        order = np.argsort(timestamps, kind='stable')
+        # Stable order puts the new candle last among equal timestamps; keep that one.
+        keep = np.r_[timestamps[order][1:] != timestamps[order][:-1], True]
+        order = order[keep]
+        return {field: np.concatenate([stored[field], candles[field]])[order] for field in fields}
+
+    @staticmethod
+    def _as_field(field, values):
+        dtype = CandleStore.FIELDS[field]
+        values = np.asarray(values)
+        if np.dtype(dtype).kind == 'i' and values.dtype.kind not in 'iu':
+            # Counts with gaps (None or NaN) are stored as 0.
+            values = np.nan_to_num(np.asarray(values, dtype=np.float64), nan=0)
+        return values.astype(dtype, copy=False)
+
+    @staticmethod
+    def _missing(field, count):
+        dtype = CandleStore.FIELDS[field]
+        return np.zeros(count, dtype=dtype) if np.dtype(dtype).kind == 'i' else np.full(count, np.nan)
+
+    def _rewrite(self, path, meta, merged):
+        staging = tempfile.mkdtemp(prefix='.rewrite-', dir=os.path.dirname(path))
+        try:
+            for field, values in merged.items():
+                values.tofile(os.path.join(staging, f'{field}.bin'))
+            self._write_meta(staging, {**meta, 'rows': len(merged[CandleStore.TIMESTAMP])})
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        # Swap the directories before deleting anything, so a failure keeps the old series.
+        replaced = staging + '-replaced'
+        os.replace(path, replaced)
+        try:
+            os.replace(staging, path)
+        except BaseException:
+            os.replace(replaced, path)
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        shutil.rmtree(replaced, ignore_errors=True)
+
+    @staticmethod
+    def _merge_ranges(ranges):
+        merged = []
+        for start, end in sorted(span for span in ranges if span[0] < span[1]):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    @staticmethod
+    def _read_meta(path):
+        try:
+            with open(os.path.join(path, CandleStore.META_FILE)) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if meta.get('version') == CandleStore.FORMAT_VERSION else None
+
+    @staticmethod
+    def _write_meta(path, meta):
+        # Written last and atomically: readers never see rows that are not fully on disk.
+        fd, temporary = tempfile.mkstemp(prefix='.meta-', dir=path)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({**meta, 'version': CandleStore.FORMAT_VERSION}, f)
+        os.replace(temporary, os.path.join(path, CandleStore.META_FILE))
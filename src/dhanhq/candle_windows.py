@@ -0,0 +1,104 @@
+"""
+    Requests and date windows of the historical candle APIs.
+
+    CandleWindows builds the payload of a candle series and splits a date range into the
+    windows the server accepts per request. It is shared by the range methods of the
+    historical data APIs, sync_candles and BulkDownloader.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import datetime
+
+
+class CandleWindows:
+    """Candle request payloads and the date windows they are fetched in."""
+
+    """Longest from_date/to_date range the server accepts per request, in days"""
+    INTRADAY_MAX_DAYS = 90
+    DAILY_MAX_DAYS = 365
+    EXPIRED_OPTIONS_MAX_DAYS = 30
+
+    """Interval of daily candles; intraday intervals are minutes"""
+    DAILY = 'D'
+
+    IST = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+
+    @staticmethod
+    def request(security_id, exchange_segment, instrument_type, interval, oi):
+        """
+        Return the request of a candle series.
+
+        Args:
+            security_id (str): The ID of the security.
+            exchange_segment (str): The exchange segment (e.g., NSE_EQ).
+            instrument_type (str): The type of instrument (e.g., EQUITY).
+            interval (str | int): 'D' for daily candles, or 1, 5, 15, 25 or 60 minutes.
+            oi (bool): Fetch Open Interest data.
+
+        Returns:
+            tuple: The endpoint, the payload without fromDate and toDate, and the window size in days.
+        """
+        payload = {
+            'securityId': security_id,
+            'exchangeSegment': exchange_segment,
+            'instrument': instrument_type,
+            'oi': oi,
+        }
+        if interval == CandleWindows.DAILY:
+            return '/charts/historical', {**payload, 'expiryCode': 0}, CandleWindows.DAILY_MAX_DAYS
+        return '/charts/intraday', {**payload, 'interval': interval}, CandleWindows.INTRADAY_MAX_DAYS
+
+    @staticmethod
+    def date_windows(from_date, to_date, max_days):
+        """
+        Split a range into consecutive windows of at most max_days, sharing their boundaries.
+
+        Dates stay dates (YYYY-MM-DD) and times stay times (YYYY-MM-DD HH:MM:SS), as given.
+
+        Args:
+            from_date (str | date | datetime): Start of the range.
+            to_date (str | date | datetime): End of the range.
+            max_days (int): Longest window in days.
+
+        Returns:
+            list: (from, to) strings of every window.
+        """
+        def parse(value):
+            if isinstance(value, datetime.datetime):
+                return value, True
+            if isinstance(value, datetime.date):
+                return datetime.datetime.combine(value, datetime.time()), False
+            return datetime.datetime.fromisoformat(str(value)), len(str(value)) > 10
+
+        start, start_has_time = parse(from_date)
+        end, end_has_time = parse(to_date)
+        if end < start:
+            raise ValueError(f'to_date {to_date} is before from_date {from_date}')
+        text_format = '%Y-%m-%d %H:%M:%S' if start_has_time or end_has_time else '%Y-%m-%d'
+        step = datetime.timedelta(days=max_days)
+        windows = []
+        while True:
+            stop = min(start + step, end)
+            windows.append((start.strftime(text_format), stop.strftime(text_format)))
+            if stop >= end:
+                return windows
+            start = stop
+
+    @staticmethod
+    def format_time(value):
+        """Return a datetime as 'YYYY-MM-DD' at midnight, else as 'YYYY-MM-DD HH:MM:SS'."""
+        if value.time() == datetime.time():
+            return value.strftime('%Y-%m-%d')
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+
+    @staticmethod
+    def today():
+        """Return today's IST midnight as a naive datetime."""
+        return datetime.datetime.combine(datetime.datetime.now(CandleWindows.IST).date(), datetime.time())
+
+    @staticmethod
+    def final_range(start, end):
+        """Clip a fetched range to today's IST midnight: today's candles are fetched again until the day is over."""
+        return start, min(end, CandleWindows.today())
@@ -0,0 +1,132 @@
+"""
+    Single-flight coalescing of identical concurrent DhanHQ REST requests.
+
+    While a market data or reference request is in flight, identical requests from other
+    threads (or tasks) wait for it instead of going to the server, and each receives its own
+    copy of the result. Reads of orders, trades, positions, holdings and funds are never shared,
+    so a read made after an order write always sees that write.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import threading
+from copy import deepcopy
+from json import dumps as json_dumps
+
+
+class _Call:
+    """A request in flight and the callers waiting for it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.error = None
+
+
+class RequestCoalescer:
+    """Shares one in-flight request among identical concurrent callers."""
+
+    """POST endpoints that only read data and so are safe to share"""
+    READ_ONLY_POST_ENDPOINTS = ('/optionchain', '/optionchain/expirylist', '/margincalculator',
+                                '/margincalculator/multi', '/globalstocks/margincalculator',
+                                '/globalstocks/transEstimate')
+    READ_ONLY_POST_PREFIXES = ('/marketfeed/', '/charts/')
+
+    """GET endpoints of reference data that order writes do not change"""
+    READ_ONLY_GET_ENDPOINTS = ('/globalstocks/marketstatus',)
+
+    def __init__(self):
+        self.shared = 0
+        self._calls = {}
+        self._tasks = {}
+        self._lock = threading.Lock()
+
+    def key(self, method, endpoint, payload=None):
+        """
+        Return the coalescing key of a request, or None if the request must not be shared.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint ignoring the base URL.
+            payload (dict): The request payload before encoding.
+
+        Returns:
+            tuple: (method, endpoint, canonical payload), or None.
+        """
+        if method == 'POST':
+            read_only = endpoint.startswith(RequestCoalescer.READ_ONLY_POST_PREFIXES)
+            if not (read_only or endpoint in RequestCoalescer.READ_ONLY_POST_ENDPOINTS):
+                return None
+        elif method != 'GET' or endpoint not in RequestCoalescer.READ_ONLY_GET_ENDPOINTS:
+            return None
+        canonical = json_dumps(payload, sort_keys=True, separators=(',', ':')) if payload else None
+        return method, endpoint, canonical
+
+    def do(self, key, send):
+        """
+        Send a request, or wait for the identical request already in flight.
+
+        Args:
+            key (tuple): A key returned by `key`.
+            send (callable): Sends the request and returns the parsed response.
+
+        Returns:
+            dict: The parsed response; callers that waited receive a copy.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return deepcopy(call.result)
+
+        try:
+            call.result = send()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                waiters = call.waiters
+            call.done.set()
+        # Waiters copy call.result after done is set, so the leader must not hand it out.
+        return deepcopy(call.result) if waiters else call.result
+
+    async def do_async(self, key, send):
+        """
+        Coroutine version of `do` for callers on one event loop.
+
+        Args:
+            key (tuple): A key returned by `key`.
+            send (callable): Returns a coroutine that sends the request.
+
+        Returns:
+            dict: The parsed response; callers that waited receive a copy.
+        """
+        import asyncio  # Imported here so that REST-only use does not load asyncio.
+
+        entry = self._tasks.get(key)
+        if entry is not None and entry[0].get_loop() is asyncio.get_running_loop():
+            entry[1] += 1
+            self.shared += 1
+            return deepcopy(await asyncio.shield(entry[0]))
+
+        entry = [asyncio.ensure_future(send()), 0]
+        self._tasks[key] = entry
+        try:
+            result = await asyncio.shield(entry[0])
+        finally:
+            if self._tasks.get(key) is entry:
+                del self._tasks[key]
+        return deepcopy(result) if entry[1] else result
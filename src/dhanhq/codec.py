@@ -0,0 +1,119 @@
+"""
+    JSON codec used for DhanHQ REST payloads, responses and websocket messages.
+
+    The fastest installed backend is selected on import: orjson, then ujson, then the
+    standard library. Call `use` to pick a backend explicitly.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import json
+
+
+class JSONCodec:
+    """A JSON backend. `dumps` returns str, `encode` returns UTF-8 bytes, `loads` takes str or bytes."""
+
+    def __init__(self, name, dumps, encode, loads):
+        self.name = name
+        self.dumps = dumps
+        self.encode = encode
+        self.loads = loads
+
+
+def _json_encode(obj):
+    return json.dumps(obj).encode('utf-8')
+
+
+def _stdlib_codec():
+    return JSONCodec('json', json.dumps, _json_encode, json.loads)
+
+
+def _orjson_codec():
+    import orjson
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def encode(obj):
+        try:
+            return orjson.dumps(obj, option=options)
+        except TypeError:
+            # Types orjson rejects (e.g. integers beyond 64 bits) still encode the stdlib way.
+            return _json_encode(obj)
+
+    def dumps(obj):
+        return encode(obj).decode('utf-8')
+
+    return JSONCodec('orjson', dumps, encode, orjson.loads)
+
+
+def _ujson_codec():
+    import ujson
+
+    def dumps(obj):
+        try:
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            return json.dumps(obj)
+
+    def encode(obj):
+        return dumps(obj).encode('utf-8')
+
+    return JSONCodec('ujson', dumps, encode, ujson.loads)
+
+
+"""Backends in order of preference"""
+BACKENDS = {
+    'orjson': _orjson_codec,
+    'ujson': _ujson_codec,
+    'json': _stdlib_codec,
+}
+
+_codec = None
+
+
+def use(name=None):
+    """
+    Select the JSON backend.
+
+    Args:
+        name (str, optional): 'orjson', 'ujson' or 'json'. The fastest installed backend if omitted.
+
+    Returns:
+        JSONCodec: The selected codec.
+    """
+    global _codec
+    if name is not None:
+        _codec = BACKENDS[name]()
+        return _codec
+    for factory in BACKENDS.values():
+        try:
+            _codec = factory()
+            return _codec
+        except ImportError:
+            continue
+    # Not reached: the standard library backend is always available.
+    return _codec
+
+
+def get_codec():
+    """Return the selected JSONCodec."""
+    return _codec
+
+
+def dumps(obj):
+    """Serialize obj to a JSON str, e.g. for websocket text frames."""
+    return _codec.dumps(obj)
+
+
+def encode(obj):
+    """Serialize obj to JSON as UTF-8 bytes, e.g. for HTTP request bodies."""
+    return _codec.encode(obj)
+
+
+def loads(data):
+    """Deserialize JSON from str or bytes."""
+    return _codec.loads(data)
+
+
+use()
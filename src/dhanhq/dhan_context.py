@@ -19,11 +19,19 @@ class DhanContext:
         and passes this to all the connection protocols like http and websocket that it is composed of.
     """
 
-    def __init__(self, client_id, access_token, disable_ssl=False, pool=None):
+    def __init__(self, client_id, access_token, disable_ssl=False, pool=None, **http_options):
+        """
+        Args:
+            client_id (str): The client ID of the Dhan account.
+            access_token (str): The access token for the Dhan API.
+            disable_ssl (bool): Flag to disable SSL.
+            pool (dict): Keyword arguments for the requests HTTPAdapter of the session.
+            **http_options: Further keyword arguments passed on to DhanHTTP, e.g. rate_limiter.
+        """
         try:
             self.client_id = client_id
             self.access_token = access_token
-            self.dhan_http = DhanHTTP(client_id, access_token, disable_ssl, pool)
+            self.dhan_http = DhanHTTP(client_id, access_token, disable_ssl, pool, **http_options)
             self.dhan_login = DhanLogin(client_id)
 
         except Exception as e:
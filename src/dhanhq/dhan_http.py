@@ -9,11 +9,21 @@
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from json import dumps as json_dumps, loads as json_loads
 
 import requests
 
+from dhanhq import codec
+from dhanhq.coalescer import RequestCoalescer
+from dhanhq.metrics import MetricsRegistry
+from dhanhq.prepared_order import OrderAckLog
+from dhanhq.rate_limiter import RateLimiter
+from dhanhq.response_cache import ResponseCache
+from dhanhq.retry import RetryPolicy
+
 
 class DhanHTTP:
     """Manages API keys, connection context, and HTTP requests"""
@@ -30,10 +40,41 @@ class DhanHTTP:
         PUT = 'PUT'
         DELETE = 'DELETE'
 
+    class RequestPriority(Enum):
+        """Constants for Request Priority"""
+        NORMAL = 'normal'
+        RISK_OFF = 'risk_off'
+
+    """Risk-reducing requests: kill switch activation and exiting all positions"""
+    RISK_OFF_REQUESTS = (('POST', '/killswitch?killSwitchStatus=ACTIVATE'), ('DELETE', '/positions'))
+
+    """Endpoint prefixes whose DELETE cancels an order"""
+    RISK_OFF_CANCEL_PREFIXES = ('/orders/', '/super/orders/', '/forever/orders/', '/globalstocks/orders/')
+
     HTTP_DEFAULT_TIME_OUT = 60
+    BATCH_DEFAULT_WORKERS = 10
+    KEEP_ALIVE_DEFAULT_INTERVAL = 20
+    PRIORITY_POOL_SIZE = 2
     API_BASE_URL = 'https://api.dhan.co/v2'
 
-    def __init__(self, client_id, access_token, disable_ssl=False, pool=None):
+    def __init__(self, client_id, access_token, disable_ssl=False, pool=None, rate_limiter=True,
+                 retry_policy=None, response_cache=None, coalesce_requests=True, metrics=None):
+        """
+        Args:
+            client_id (str): The client ID of the Dhan account.
+            access_token (str): The access token for the Dhan API.
+            disable_ssl (bool): Flag to disable SSL.
+            pool (dict): Keyword arguments for the requests HTTPAdapter of the session.
+            rate_limiter (RateLimiter | bool): Limiter scheduling requests under Dhan's rate limits.
+                True (default) uses Dhan's published limits, False disables client-side limiting.
+            retry_policy (RetryPolicy): Policy for retrying failed requests. None (default) disables retries.
+            response_cache (ResponseCache | bool): Cache for read-mostly endpoints. True uses the default
+                TTLs, None (default) disables caching.
+            coalesce_requests (bool): Let identical concurrent market data requests share one request
+                in flight. Order, position, holding and fund reads are always sent.
+            metrics (MetricsRegistry | bool): Registry recording per-endpoint latency, sizes and errors.
+                True creates one, None (default) disables metrics.
+        """
         self.client_id = client_id
         self.access_token = access_token
         self.base_url = DhanHTTP.API_BASE_URL
@@ -49,25 +90,300 @@ class DhanHTTP:
         if pool:
             reqadapter = requests.adapters.HTTPAdapter(**pool)
             self.session.mount("https://", reqadapter)
+        # Reserved for risk-reducing calls, so they never queue behind bulk requests for a connection.
+        self.priority_session = requests.Session()
+        self.priority_session.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=DhanHTTP.PRIORITY_POOL_SIZE))
+        if rate_limiter is True:
+            rate_limiter = RateLimiter()
+        self.rate_limiter = rate_limiter or None
+        self.retry_policy = retry_policy
+        if response_cache is True:
+            response_cache = ResponseCache()
+        self.response_cache = response_cache or None
+        self.coalescer = RequestCoalescer() if coalesce_requests else None
+        if metrics is True:
+            metrics = MetricsRegistry()
+        self.metrics = metrics or None
+        self.ack_log = OrderAckLog()
+        self._keep_alive_stop = None
+
+    def get_rate_limit_budget(self, family=None):
+        """
+        Return the requests that can be sent right now without waiting, per rate-limit family.
+
+        Args:
+            family (str, optional): One of the RateLimiter families, e.g. RateLimiter.ORDER.
+
+        Returns:
+            dict: Family to {window seconds: remaining requests}, or None if rate limiting is disabled.
+        """
+        if self.rate_limiter is None:
+            return None
+        return self.rate_limiter.remaining(family)
+
+    def get_cache_stats(self):
+        """
+        Return hit/miss counters of the response cache.
+
+        Returns:
+            dict: Cache counters, or None if caching is disabled.
+        """
+        if self.response_cache is None:
+            return None
+        return self.response_cache.stats()
+
+    def invalidate_cache(self, endpoints=None):
+        """
+        Drop cached responses, e.g. after a change made outside this client.
+
+        Args:
+            endpoints (iterable, optional): Endpoints to drop, e.g. ['/positions']; all if omitted.
+        """
+        if self.response_cache is not None:
+            self.response_cache.invalidate(endpoints)
+
+    def get_metrics(self):
+        """
+        Return per-endpoint request metrics; see MetricsRegistry.snapshot.
+
+        Returns:
+            dict: Metrics per 'METHOD /endpoint/template', or None if metrics are disabled.
+        """
+        if self.metrics is None:
+            return None
+        return self.metrics.snapshot()
+
+    def warm_up(self, connections=1):
+        """
+        Open pooled connections to the API host ahead of time, so that the next requests skip
+        DNS, TCP and TLS setup. Warm-up requests are not API calls and do not count against
+        rate limits.
+
+        Args:
+            connections (int): Number of connections to open concurrently; at most the session's
+                pool size (10 unless `pool` sets pool_maxsize) are kept.
+
+        Returns:
+            int: Number of connections that reached the host.
+        """
+        def touch(session):
+            try:
+                session.head(self.base_url, timeout=self.timeout).close()
+                return True
+            except Exception as e:
+                logging.warning('Exception in DhanHQConnection.warm_up: %s', e)
+                return False
+
+        # The priority lane is warmed too, but only connections of the main pool are counted.
+        sessions = [self.priority_session] + [self.session] * max(connections, 1)
+        with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+            return sum(list(executor.map(touch, sessions))[1:])
+
+    def start_keep_alive(self, interval=KEEP_ALIVE_DEFAULT_INTERVAL, connections=1):
+        """
+        Warm up now and then every `interval` seconds from a daemon thread, so that idle
+        connections are not closed by the server before the next order.
+
+        Args:
+            interval (float): Seconds between warm-ups; keep it below the server's idle timeout.
+            connections (int): Number of connections to keep warm.
+        """
+        self.stop_keep_alive()
+        stop = self._keep_alive_stop = threading.Event()
+        self.warm_up(connections)
+
+        def run():
+            while not stop.wait(interval):
+                self.warm_up(connections)
+
+        threading.Thread(target=run, name='dhanhq-keep-alive', daemon=True).start()
+
+    def stop_keep_alive(self):
+        """Stop the keep-alive thread, if running."""
+        if self._keep_alive_stop is not None:
+            self._keep_alive_stop.set()
+            self._keep_alive_stop = None
+
+    def post_encoded(self, endpoint, body, correlation_id=None):
+        """
+        Send an order whose payload is already encoded, and log its send-to-ack latency.
+
+        Args:
+            endpoint (str): The placement endpoint ignoring the base URL.
+            body (bytes): The encoded payload, including dhanClientId.
+            correlation_id (str, optional): The correlationId in the body, used by retries.
+
+        Returns:
+            dict: The response in dict format.
+        """
+        started = time.perf_counter()
+        result = self._send_cached(DhanHTTP.HttpMethods.POST, endpoint, body, correlation_id)
+        self.ack_log.record(endpoint, started, result, correlation_id)
+        return result
+
+    def execute_many(self, calls, max_workers=BATCH_DEFAULT_WORKERS):
+        """
+        Send independent requests concurrently over the shared session.
+
+        Requests still wait for their turn under the rate limiter, so a large batch takes as long
+        as Dhan's limits require, but no longer than the slowest request when within them.
+        Using more workers than the session's connection pool holds (10 unless `pool` sets
+        pool_maxsize) opens throwaway connections.
+
+        Args:
+            calls (iterable): Call descriptors (method, endpoint) or (method, endpoint, payload),
+                where method is an HttpMethods member or its name, e.g. ('GET', '/orders/123').
+            max_workers (int): Maximum number of requests in flight.
+
+        Returns:
+            list: The response dict of each call in input order. A call that could not be sent
+                has a failure response.
+        """
+        calls = list(calls)
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            return list(executor.map(self._execute_call, calls))
+
+    def _execute_call(self, call):
+        try:
+            method, endpoint, payload = DhanHTTP._parse_call(call)
+            return self._send_request(method, endpoint, payload)
+        except Exception as e:
+            logging.error('Exception in DhanHQConnection.execute_many %r: %s', call, e)
+            return {
+                'status': DhanHTTP.HttpResponseStatus.FAILURE.value,
+                'remarks': str(e),
+                'data': '',
+            }
+
+    @staticmethod
+    def _parse_call(call):
+        """Return (HttpMethods, endpoint, payload) of an execute_many call descriptor."""
+        method, endpoint, *rest = call
+        if len(rest) > 1:
+            raise ValueError(f'Call descriptor must be (method, endpoint[, payload]), got {call!r}')
+        if not isinstance(method, DhanHTTP.HttpMethods):
+            method = DhanHTTP.HttpMethods(method.upper())
+        return method, endpoint, rest[0] if rest else None
+
+    @staticmethod
+    def priority_of(method, endpoint):
+        """
+        Return the priority of a request. Risk-reducing requests (activating the kill switch,
+        exiting all positions and cancelling orders) use a reserved connection pool and are
+        never held back by the rate limiter.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint ignoring the base URL.
+
+        Returns:
+            RequestPriority: RISK_OFF or NORMAL.
+        """
+        if method == 'GET':
+            return DhanHTTP.RequestPriority.NORMAL
+        if (method, endpoint) in DhanHTTP.RISK_OFF_REQUESTS:
+            return DhanHTTP.RequestPriority.RISK_OFF
+        if method == 'DELETE' and endpoint.startswith(DhanHTTP.RISK_OFF_CANCEL_PREFIXES):
+            return DhanHTTP.RequestPriority.RISK_OFF
+        return DhanHTTP.RequestPriority.NORMAL
 
     def _send_request(self, method, endpoint, payload=None):
-        url = self.base_url + endpoint
+        correlation_id = None
         if payload:
             payload["dhanClientId"] = self.client_id
-            payload = json_dumps(payload)
+            correlation_id = payload.get("correlationId")
+        coalesce_key = None if self.coalescer is None else self.coalescer.key(method.value, endpoint, payload)
+        if payload:
+            payload = codec.encode(payload)
+        if coalesce_key is None:
+            return self._send_cached(method, endpoint, payload, correlation_id)
+        return self.coalescer.do(coalesce_key,
+                                 lambda: self._send_cached(method, endpoint, payload, correlation_id))
+
+    def _send_cached(self, method, endpoint, payload, correlation_id):
+        if self.response_cache is None:
+            return self._send_with_retry(method, endpoint, payload, correlation_id)
+
+        cache_key = self.response_cache.key(method.value, endpoint, payload)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            generation = self.response_cache.generation(cache_key)
+        result = self._send_with_retry(method, endpoint, payload, correlation_id)
+        if cache_key is not None:
+            self.response_cache.put(cache_key, result, generation)
+        else:
+            self.response_cache.invalidate_for_write(method.value, endpoint)
+        return result
+
+    def _send_with_retry(self, method, endpoint, payload, correlation_id):
+        attempt = 0
+        while True:
+            attempt += 1
+            result, retryable = self._send_once(method, endpoint, payload)
+            if not retryable or attempt >= self.retry_policy.max_attempts:
+                return result
+            retry_kind = self.retry_policy.retry_kind(method.value, endpoint, correlation_id)
+            if retry_kind is None:
+                return result
+            self.retry_policy.sleep(self.retry_policy.backoff(attempt))
+            if retry_kind == RetryPolicy.ORDER_PLACEMENT:
+                # Never send a placement twice: the first attempt may have reached the exchange.
+                lookup = self._send_request(DhanHTTP.HttpMethods.GET, RetryPolicy.correlation_endpoint(correlation_id))
+                outcome = RetryPolicy.placement_outcome(lookup)
+                if outcome == 'placed':
+                    return lookup
+                if outcome == 'unknown':
+                    return result
+            logging.warning('Retrying DhanHQConnection.%s %s, attempt %d', method.value, endpoint, attempt + 1)
+
+    def _send_once(self, method, endpoint, payload):
+        """
+        Send a single attempt of a request.
+
+        Returns:
+            tuple: The parsed response dict, and whether the retry policy allows retrying the failure.
+        """
+        risk_off = DhanHTTP.priority_of(method.value, endpoint) is DhanHTTP.RequestPriority.RISK_OFF
+        waited = 0.0
+        if self.rate_limiter is not None:
+            waited = self.rate_limiter.acquire(RateLimiter.classify(method.value, endpoint), risk_off)
+        session = self.priority_session if risk_off else self.session
+        started = time.perf_counter() if self.metrics is not None else None
         try:
-            response = getattr(self.session, method.value.lower())(url,
-                                                                   data=payload,
-                                                                   headers=self.header,
-                                                                   timeout=self.timeout)
-            return self._parse_response(response)
+            response = getattr(session, method.value.lower())(self.base_url + endpoint,
+                                                              data=payload,
+                                                              headers=self.header,
+                                                              timeout=self.timeout)
         except Exception as e:
             logging.error('Exception in DhanHQConnection.%s: %s', method.value.upper(), e)
+            if started is not None:
+                self.metrics.record(method.value, endpoint, time.perf_counter() - started,
+                                    MetricsRegistry.TRANSPORT_ERROR, len(payload or b''), rate_limit_wait=waited)
             return {
                 'status': DhanHTTP.HttpResponseStatus.FAILURE.value,
                 'remarks': str(e),
                 'data': '',
-            }
+            }, self.retry_policy is not None and self.retry_policy.is_retryable_exception(e)
+        retryable = self.retry_policy is not None and self.retry_policy.is_retryable_status(response.status_code)
+        result = self._parse_response(response)
+        if started is not None:
+            self._record_metrics(method, endpoint, started, payload, response, result, waited)
+        return result, retryable
+
+    def _record_metrics(self, method, endpoint, started, payload, response, result, waited):
+        remarks = result['remarks']
+        elapsed = getattr(response, 'elapsed', None)
+        self.metrics.record(method.value, endpoint, time.perf_counter() - started, response.status_code,
+                            request_bytes=len(payload or b''),
+                            response_bytes=len(response.content or b''),
+                            error_code=remarks.get('error_code') if isinstance(remarks, dict) else None,
+                            server_time=elapsed.total_seconds() if elapsed is not None else None,
+                            rate_limit_wait=waited)
 
     def _parse_response(self, response):
         """
@@ -83,7 +399,7 @@ class DhanHTTP:
             status = DhanHTTP.HttpResponseStatus.FAILURE.value
             remarks = ''
             data = ''
-            json_response = json_loads(response.content)
+            json_response = codec.loads(response.content)
             if (response.status_code >= 200) and (response.status_code <= 299):
                 status = DhanHTTP.HttpResponseStatus.SUCCESS.value
                 data = json_response
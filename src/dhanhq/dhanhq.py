@@ -11,9 +11,11 @@
 from datetime import datetime, timedelta, timezone
 
 
-from dhanhq import (Order, ForeverOrder, Portfolio, Statement, TraderControl, Security,
-                    HistoricalData, OptionChain, MarketFeed, Funds, SuperOrder,
+from dhanhq import (DhanHTTP, Order, ForeverOrder, Portfolio, Statement, TraderControl,
+                    Security, HistoricalData, OptionChain, Funds, SuperOrder,
                     ConditionalOrder, GlobalStocks)
+from dhanhq._market_feed import MarketFeed
+from dhanhq.batch import Batch
 
 
 class dhanhq(Order, ForeverOrder, Portfolio, Funds, Statement, TraderControl, Security,
@@ -62,6 +64,18 @@ class dhanhq(Order, ForeverOrder, Portfolio, Funds, Statement, TraderControl, Se
             parent.__init__(self,dhan_context)
         self.dhan_http = dhan_context.get_dhan_http()
 
+    def batch(self, max_workers=DhanHTTP.BATCH_DEFAULT_WORKERS):
+        """
+        Collect API calls to run concurrently, e.g. LTP baskets or per-order status checks.
+
+        Args:
+            max_workers (int): Maximum number of calls in flight.
+
+        Returns:
+            Batch: Context manager whose calls run, in parallel, when the block exits.
+        """
+        return Batch(max_workers)
+
     def convert_to_date_time(self, epoch):
         """
         Convert EPOCH time to Python datetime object in IST.
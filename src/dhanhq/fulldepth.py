@@ -11,7 +11,8 @@ import websockets
 import asyncio
 import struct
 from datetime import datetime, timezone
-import json
+
+from dhanhq import codec
 
 
 class FullDepth:
@@ -135,7 +136,7 @@ class FullDepth:
             disconnect_message = {
                 "RequestCode": 12
             }
-            await self.ws.send(json.dumps(disconnect_message))
+            await self.ws.send(codec.dumps(disconnect_message))
             header_message = self.create_header(feed_request_code=12, message_length=83, client_id=self.client_id)
             await self.ws.send(header_message)
         print("Connection closed!")
@@ -186,7 +187,7 @@ class FullDepth:
                         } for ex, token in batch
                     ]
                 }
-            await self.ws.send(json.dumps(subscription_message))
+            await self.ws.send(codec.dumps(subscription_message))
             print(f"Subscribed to {len(batch)} instruments with {self.depth_level} depth")
             print(subscription_message)
 
@@ -430,7 +431,7 @@ class FullDepth:
                         } for ex, token in batch
                     ]
                 }
-                asyncio.ensure_future(self.ws.send(json.dumps(subscription_message)))
+                asyncio.ensure_future(self.ws.send(codec.dumps(subscription_message)))
 
     def unsubscribe_symbols(self, symbols):
         """Function to unsubscribe symbols from connection when connection is already active."""
@@ -450,4 +451,4 @@ class FullDepth:
                         } for ex, token in batch
                     ]
                 }
-                asyncio.ensure_future(self.ws.send(json.dumps(unsubscription_message)))
+                asyncio.ensure_future(self.ws.send(codec.dumps(unsubscription_message)))
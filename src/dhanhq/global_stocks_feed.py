@@ -8,12 +8,13 @@
 """
 
 import asyncio
-import json
 import struct
 from datetime import datetime
 
 import websockets
 
+from dhanhq import codec
+
 
 class GlobalStocksFeed:
     # Constants
@@ -161,7 +162,7 @@ class GlobalStocksFeed:
         """Send a disconnect request and close the WebSocket connection."""
         if self.ws:
             try:
-                await self.ws.send(json.dumps({"requestCode": GlobalStocksFeed.Disconnect}))
+                await self.ws.send(codec.dumps({"requestCode": GlobalStocksFeed.Disconnect}))
             except Exception:
                 pass
             await self.ws.close()
@@ -210,7 +211,7 @@ class GlobalStocksFeed:
                     for exchange_segment, security_id in batch
                 ]
             }
-            await self.ws.send(json.dumps(message))
+            await self.ws.send(codec.dumps(message))
 
     async def subscribe_instruments(self):
         """Subscribe to all configured instruments on the open WebSocket."""
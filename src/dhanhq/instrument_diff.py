@@ -0,0 +1,181 @@
+"""
+    Differences between two instrument master snapshots.
+
+    InstrumentDiff matches the instruments of two snapshots by exchange segment and security ID
+    and records the added and removed instruments and the changed columns as arrays of row
+    numbers, so caches, subscriptions and indexes can be updated with the day's changes instead
+    of being rebuilt, and lot size or tick size changes can be audited.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class InstrumentDiff:
+    """Added, removed and changed instruments between an old and a new instrument master."""
+
+    """Columns that identify an instrument; all others are compared"""
+    KEY_COLUMNS = ('exchange_segment', 'security_id')
+
+    def __init__(self, old, new, added, removed, changed_old, changed_new, changed_mask, columns):
+        """
+        Args:
+            old (InstrumentMaster): The earlier snapshot.
+            new (InstrumentMaster): The later snapshot.
+            added (np.ndarray): Rows of `new` that are not in `old`.
+            removed (np.ndarray): Rows of `old` that are not in `new`.
+            changed_old (np.ndarray): Rows of `old` whose instrument changed.
+            changed_new (np.ndarray): The matching rows of `new`.
+            changed_mask (np.ndarray): Boolean array of changed instruments by compared columns.
+            columns (tuple): The compared columns.
+
+        Use `between` or `InstrumentMaster.diff` to build one.
+        """
+        self.old = old
+        self.new = new
+        self.added = added
+        self.removed = removed
+        self.changed_old = changed_old
+        self.changed_new = changed_new
+        self.changed_mask = changed_mask
+        self.columns = columns
+
+    def __repr__(self):
+        return (f'InstrumentDiff({len(self.added)} added, {len(self.removed)} removed, '
+                f'{len(self.changed_new)} changed)')
+
+    def __bool__(self):
+        return bool(len(self.added) or len(self.removed) or len(self.changed_new))
+
+    @classmethod
+    def between(cls, old, new):
+        """
+        Compare two snapshots of the instrument master.
+
+        Instruments are matched by exchange segment and security ID; of duplicate keys the first
+        row counts, as in the lookups.
+
+        Args:
+            old (InstrumentMaster): The earlier snapshot.
+            new (InstrumentMaster): The later snapshot.
+
+        Returns:
+            InstrumentDiff: The differences.
+        """
+        # One factorisation of both snapshots' keys; the rest is integer array work.
+        old_keys, new_keys = cls._keys(old), cls._keys(new)
+        codes = pd.factorize(np.concatenate([old_keys, new_keys]))[0]
+        old_codes, new_codes = codes[:len(old_keys)], codes[len(old_keys):]
+        old_first = cls._first_rows(old_codes, len(codes))
+        new_first = cls._first_rows(new_codes, len(codes))
+        old_rows = np.flatnonzero(old_first[old_codes] == np.arange(len(old_codes)))
+        new_rows = np.flatnonzero(new_first[new_codes] == np.arange(len(new_codes)))
+        in_old = old_first[new_codes[new_rows]]
+
+        matched = in_old >= 0
+        changed_new = new_rows[matched]
+        changed_old = in_old[matched]
+        columns = tuple(name for name in new.columns if name not in cls.KEY_COLUMNS and name in old.columns)
+        mask = np.zeros((len(changed_new), len(columns)), dtype=bool)
+        for position, name in enumerate(columns):
+            mask[:, position] = cls._differs(old.columns[name][changed_old], new.columns[name][changed_new])
+        changed = mask.any(axis=1)
+
+        removed = old_rows[new_first[old_codes[old_rows]] < 0]
+        return cls(old, new, new_rows[~matched], removed, changed_old[changed], changed_new[changed], mask[changed],
+                   columns)
+
+    @staticmethod
+    def _keys(master):
+        return master.columns['exchange_segment'] + ':' + master.columns['security_id']
+
+    @staticmethod
+    def _first_rows(codes, size):
+        # Row of the first occurrence of every key code, -1 where the key is absent.
+        first = np.full(size, -1, dtype=np.int64)
+        first[codes[::-1]] = np.arange(len(codes) - 1, -1, -1)
+        return first
+
+    @staticmethod
+    def _differs(old, new):
+        if old.dtype.kind == 'f':
+            return ~((old == new) | (np.isnan(old) & np.isnan(new)))
+        if old.dtype.kind == 'M':
+            return ~((old == new) | (np.isnat(old) & np.isnat(new)))
+        return old != new
+
+    def added_ids(self):
+        """
+        Return the keys of the added instruments.
+
+        Returns:
+            list: (exchange_segment, security_id) tuples.
+        """
+        return self._ids(self.new, self.added)
+
+    def removed_ids(self):
+        """
+        Return the keys of the removed instruments.
+
+        Returns:
+            list: (exchange_segment, security_id) tuples.
+        """
+        return self._ids(self.old, self.removed)
+
+    def changed_ids(self, column=None):
+        """
+        Return the keys of the changed instruments.
+
+        Args:
+            column (str, optional): Only instruments where this column changed, e.g. 'lot_size'.
+
+        Returns:
+            list: (exchange_segment, security_id) tuples.
+        """
+        return self._ids(self.new, self._changed_rows(column)[1])
+
+    def changes(self, column):
+        """
+        Return the old and new values of one column, e.g. to audit lot size changes.
+
+        Args:
+            column (str): The column, e.g. 'lot_size' or 'tick_size'.
+
+        Returns:
+            list: Dicts of exchange_segment, security_id, trading_symbol, old and new value.
+        """
+        old_rows, new_rows = self._changed_rows(column)
+        changes = []
+        for old_row, new_row in zip(old_rows.tolist(), new_rows.tolist()):
+            old, new = self.old.row(old_row), self.new.row(new_row)
+            changes.append({'exchange_segment': new['exchange_segment'], 'security_id': new['security_id'],
+                            'trading_symbol': new['trading_symbol'], 'old': old[column], 'new': new[column]})
+        return changes
+
+    def summary(self):
+        """
+        Count the differences.
+
+        Returns:
+            dict: Numbers of added, removed and changed instruments, and of changes per column.
+        """
+        summary = {'added': len(self.added), 'removed': len(self.removed), 'changed': len(self.changed_new)}
+        counts = self.changed_mask.sum(axis=0).tolist()
+        summary['columns'] = {name: count for name, count in zip(self.columns, counts) if count}
+        return summary
+
+    def _changed_rows(self, column):
+        if column is None:
+            return self.changed_old, self.changed_new
+        if column not in self.columns:
+            raise ValueError(f'Unknown column {column!r}. Choose one of {", ".join(self.columns)}.')
+        changed = self.changed_mask[:, self.columns.index(column)]
+        return self.changed_old[changed], self.changed_new[changed]
+
+    @staticmethod
+    def _ids(master, rows):
+        return list(zip(master.columns['exchange_segment'][rows].tolist(),
+                        master.columns['security_id'][rows].tolist()))
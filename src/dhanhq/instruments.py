@@ -0,0 +1,460 @@
+"""
+    Indexed in-memory instrument master.
+
+    InstrumentMaster normalises Dhan's compact, detailed and Global Stocks scrip master CSVs
+    into one set of typed columns and builds hash indexes over them, so resolving a symbol,
+    security ID, ISIN or option contract is a dictionary lookup instead of a DataFrame scan.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import datetime
+import math
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from dhanhq import scrip_master
+from dhanhq._security import Security
+from dhanhq.scrip_master_cache import ScripMasterCache
+
+
+class InstrumentMaster:
+    """Instrument master with constant time lookups by ID, symbol, ISIN and option contract."""
+
+    """Supported scrip master sources"""
+    COMPACT = scrip_master.COMPACT
+    DETAILED = scrip_master.DETAILED
+    GLOBAL = scrip_master.GLOBAL
+
+    SOURCE_URLS = {
+        COMPACT: Security.COMPACT_CSV_URL,
+        DETAILED: Security.DETAILED_CSV_URL,
+        GLOBAL: Security.GLOBAL_STOCKS_CSV_URL,
+    }
+
+    """Normalised columns and their numpy dtypes"""
+    COLUMNS = {
+        'exchange_segment': object,
+        'security_id': object,
+        'trading_symbol': object,
+        'display_name': object,
+        'symbol_name': object,
+        'underlying_symbol': object,
+        'isin': object,
+        'instrument': object,
+        'expiry': 'datetime64[D]',
+        'expiry_flag': object,
+        'strike': np.float64,
+        'option_type': object,
+        'lot_size': np.int64,
+        'tick_size': np.float64,
+    }
+
+    """Scrip master column for each normalised column, per source"""
+    SOURCE_COLUMNS = {
+        COMPACT: {
+            'exchange': 'SEM_EXM_EXCH_ID',
+            'segment': 'SEM_SEGMENT',
+            'security_id': 'SEM_SMST_SECURITY_ID',
+            'trading_symbol': 'SEM_TRADING_SYMBOL',
+            'display_name': 'SEM_CUSTOM_SYMBOL',
+            'symbol_name': 'SM_SYMBOL_NAME',
+            'instrument': 'SEM_INSTRUMENT_NAME',
+            'expiry': 'SEM_EXPIRY_DATE',
+            'expiry_flag': 'SEM_EXPIRY_FLAG',
+            'strike': 'SEM_STRIKE_PRICE',
+            'option_type': 'SEM_OPTION_TYPE',
+            'lot_size': 'SEM_LOT_UNITS',
+            'tick_size': 'SEM_TICK_SIZE',
+        },
+        DETAILED: {
+            'exchange': 'EXCH_ID',
+            'segment': 'SEGMENT',
+            'security_id': 'SECURITY_ID',
+            'trading_symbol': 'SYMBOL_NAME',
+            'display_name': 'DISPLAY_NAME',
+            'symbol_name': 'SYMBOL_NAME',
+            'underlying_symbol': 'UNDERLYING_SYMBOL',
+            'isin': 'ISIN',
+            'instrument': 'INSTRUMENT',
+            'expiry': 'SM_EXPIRY_DATE',
+            'expiry_flag': 'EXPIRY_FLAG',
+            'strike': 'STRIKE_PRICE',
+            'option_type': 'OPTION_TYPE',
+            'lot_size': 'LOT_SIZE',
+            'tick_size': 'TICK_SIZE',
+        },
+        GLOBAL: {
+            'exchange': 'EXCHANGE',
+            'security_id': 'SCRIP_CODE',
+            'trading_symbol': 'TRADING_SYMBOL',
+            'display_name': 'CUSTOM_SYMBOL',
+            'symbol_name': 'SYMBOL_NAME',
+            'underlying_symbol': 'SYMBOL',
+            'isin': 'ISIN_CODE',
+            'instrument': 'INSTRUMENT_NAME',
+            'lot_size': 'LOT_SIZE',
+            'tick_size': 'TICK_SIZE',
+        },
+    }
+
+    """Placeholders the scrip masters use for missing values"""
+    MISSING = ('', 'NA', 'XX', 'nan')
+
+    DERIVATIVE_PREFIXES = ('FUT', 'OPT')
+    OPTION_TYPES = ('CE', 'PE')
+
+    def __init__(self, columns):
+        """
+        Args:
+            columns (dict): Normalised column name to numpy array, all of the same length.
+                Use `from_frame`, `from_csv` or `fetch` to build one from a scrip master.
+        """
+        self.columns = {name: np.asarray(columns[name], dtype=dtype) for name, dtype in self.COLUMNS.items()}
+        self._length = len(self.columns['security_id'])
+        self.timings = {}
+        self._build_indexes()
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return f'InstrumentMaster({self._length} instruments)'
+
+    @classmethod
+    def from_frame(cls, frame, source=DETAILED):
+        """
+        Build a master from a scrip master DataFrame.
+
+        Args:
+            frame (pd.DataFrame): The CSV as returned by `fetch_security_list` or
+                `fetch_global_security_list`.
+            source (str): 'compact', 'detailed' or 'global'.
+
+        Returns:
+            InstrumentMaster: The indexed master.
+        """
+        return cls(cls.normalize(frame, source))
+
+    @classmethod
+    def from_csv(cls, path_or_buffer, source=DETAILED):
+        """
+        Build a master from a scrip master CSV file.
+
+        Args:
+            path_or_buffer (str | file): Path or file object of the CSV.
+            source (str): 'compact', 'detailed' or 'global'.
+
+        Returns:
+            InstrumentMaster: The indexed master.
+        """
+        return cls.from_frame(pd.read_csv(path_or_buffer, dtype=str, keep_default_na=False), source)
+
+    @classmethod
+    def fetch(cls, mode=DETAILED, include_global=False, cache=None, exchange_segments=None, instruments=None,
+              processes=None):
+        """
+        Download the scrip master(s) from Dhan and build a master.
+
+        The scrip masters are downloaded concurrently. Without a cache they are streamed to a
+        temporary directory and only the columns the master needs are parsed, with compact dtypes
+        and the filters applied per block. Per-source timings are kept in `timings`.
+
+        Args:
+            mode (str): 'compact' or 'detailed' Indian scrip master.
+            include_global (bool): Also load the Global Stocks (US) instruments.
+            cache (bool | str | ScripMasterCache): Load the scrip masters through the binary
+                on-disk cache (True for the default directory).
+            exchange_segments (list, optional): Only keep these exchange segments, e.g. ['NSE_FNO'].
+            instruments (list, optional): Only keep these instruments, e.g. ['OPTIDX'].
+            processes (bool | int, optional): Parse the CSVs in a process pool (True for one
+                process per source) while the other downloads are still running.
+
+        Returns:
+            InstrumentMaster: The indexed master.
+
+        Raises:
+            ValueError: If mode is not 'compact' or 'detailed'.
+            requests.HTTPError: If a download fails.
+        """
+        if mode not in (cls.COMPACT, cls.DETAILED):
+            raise ValueError("Invalid mode. Choose 'compact' or 'detailed'.")
+        scrip_master_cache = ScripMasterCache.resolve(cache)
+        sources = [mode, cls.GLOBAL] if include_global else [mode]
+        urls = {source: cls.SOURCE_URLS[source] for source in sources}
+        # The cache keeps every column of a source, so only direct downloads parse a subset.
+        columns = None if scrip_master_cache is not None else {
+            source: list(cls.SOURCE_COLUMNS[source].values()) for source in sources}
+        with tempfile.TemporaryDirectory(prefix='dhanhq-') as directory:
+            loaded = scrip_master.fetch_all(urls, directory, columns, exchange_segments, instruments,
+                                            scrip_master_cache, processes)
+
+        parts, timings = [], {}
+        for source, (frame, timing) in loaded.items():
+            start = time.perf_counter()
+            parts.append(cls.normalize(frame, source))
+            timing['normalize'] = time.perf_counter() - start
+            timing['total'] += timing['normalize']
+            timings[source] = timing
+        master = cls.concat(parts)
+        master.timings = timings
+        return master
+
+    @classmethod
+    def concat(cls, parts):
+        """
+        Build one master from several sets of normalised columns or masters.
+
+        Args:
+            parts (list): Column dicts as returned by `normalize`, or InstrumentMaster objects.
+
+        Returns:
+            InstrumentMaster: The indexed master.
+        """
+        parts = [part.columns if isinstance(part, InstrumentMaster) else part for part in parts]
+        return cls({name: np.concatenate([np.asarray(part[name], dtype=dtype) for part in parts])
+                    for name, dtype in cls.COLUMNS.items()})
+
+    @classmethod
+    def normalize(cls, frame, source=DETAILED):
+        """
+        Convert a scrip master DataFrame into normalised, typed columns.
+
+        Args:
+            frame (pd.DataFrame): The scrip master.
+            source (str): 'compact', 'detailed' or 'global'.
+
+        Returns:
+            dict: Normalised column name to numpy array.
+
+        Raises:
+            ValueError: If the source is unknown.
+        """
+        mapping = cls.SOURCE_COLUMNS.get(source)
+        if mapping is None:
+            raise ValueError(f"Invalid source {source!r}. Choose 'compact', 'detailed' or 'global'.")
+
+        def text(name):
+            column = mapping.get(name)
+            if column is None or column not in frame:
+                return pd.Series('', index=frame.index, dtype=object)
+            values = frame[column]
+            if values.dtype.kind in 'iu':
+                values = values.astype(str)
+            values = values.astype(object).fillna('')
+            return values.where(~values.isin(cls.MISSING), '')
+
+        def number(name):
+            column = mapping.get(name)
+            if column is None or column not in frame:
+                return pd.Series(np.nan, index=frame.index)
+            return pd.to_numeric(frame[column], errors='coerce')
+
+        instrument = text('instrument')
+        segment = scrip_master.exchange_segment(frame, source)
+
+        derivative = instrument.str.startswith(cls.DERIVATIVE_PREFIXES)
+        trading_symbol = text('trading_symbol')
+        underlying = text('underlying_symbol')
+        if source == cls.DETAILED:
+            # The detailed master names equities by UNDERLYING_SYMBOL and contracts by SYMBOL_NAME.
+            trading_symbol = trading_symbol.where(derivative | (underlying == ''), underlying)
+        if source == cls.COMPACT:
+            underlying = trading_symbol.copy()
+            underlying[derivative] = trading_symbol[derivative].str.partition('-')[0]
+
+        option_type = text('option_type')
+        strike = number('strike')
+        lot_size = number('lot_size').fillna(1)
+        expiry = pd.Series(pd.NaT, index=frame.index, dtype='datetime64[ns]')
+        expiry[derivative] = pd.to_datetime(text('expiry')[derivative].str[:10], errors='coerce', format='%Y-%m-%d')
+
+        return {
+            'exchange_segment': segment.to_numpy(dtype=object),
+            'security_id': text('security_id').to_numpy(dtype=object),
+            'trading_symbol': trading_symbol.to_numpy(dtype=object),
+            'display_name': text('display_name').to_numpy(dtype=object),
+            'symbol_name': text('symbol_name').to_numpy(dtype=object),
+            'underlying_symbol': underlying.to_numpy(dtype=object),
+            'isin': text('isin').to_numpy(dtype=object),
+            'instrument': instrument.to_numpy(dtype=object),
+            'expiry': expiry.to_numpy(dtype='datetime64[D]'),
+            'expiry_flag': text('expiry_flag').where(derivative, '').to_numpy(dtype=object),
+            'strike': strike.where(strike > 0).to_numpy(dtype=np.float64),
+            'option_type': option_type.where(option_type.isin(cls.OPTION_TYPES), '').to_numpy(dtype=object),
+            'lot_size': lot_size.to_numpy(dtype=np.int64),
+            'tick_size': number('tick_size').to_numpy(dtype=np.float64),
+        }
+
+    def _build_indexes(self):
+        # Filled back to front so that the first of duplicate keys wins, as in the option index.
+        segments = self.columns['exchange_segment'][::-1].tolist()
+        rows = range(self._length - 1, -1, -1)
+        self._by_id = dict(zip(zip(segments, self.columns['security_id'][::-1].tolist()), rows))
+        self._by_symbol = dict(zip(zip(segments, self.columns['trading_symbol'][::-1].tolist()), rows))
+
+        self._by_isin = {}
+        for row, isin in enumerate(self.columns['isin'].tolist()):
+            if isin:
+                self._by_isin.setdefault(isin, []).append(row)
+
+        self._by_option = {}
+        option_rows = np.flatnonzero(self.columns['option_type'] != '')
+        expiries = self.columns['expiry'][option_rows].tolist()
+        for row, underlying, expiry, strike, option_type in zip(
+                option_rows.tolist(), self.columns['underlying_symbol'][option_rows].tolist(), expiries,
+                self.columns['strike'][option_rows].tolist(), self.columns['option_type'][option_rows].tolist()):
+            if expiry is not None and not math.isnan(strike):
+                self._by_option.setdefault((underlying, expiry, strike, option_type), row)
+
+    def row(self, index):
+        """
+        Return one instrument as a dict of normalised columns.
+
+        Args:
+            index (int): Row number.
+
+        Returns:
+            dict: The instrument; missing strike and expiry are None.
+        """
+        instrument = {}
+        for name, column in self.columns.items():
+            value = column[index]
+            if isinstance(value, np.generic):
+                value = value.item()
+            if isinstance(value, float) and math.isnan(value):
+                value = None
+            instrument[name] = value
+        return instrument
+
+    def get(self, security_id, exchange_segment):
+        """
+        Look up an instrument by security ID.
+
+        Args:
+            security_id (str | int): The security ID.
+            exchange_segment (str): The exchange segment, e.g. 'NSE_EQ'. Security IDs are
+                only unique within a segment.
+
+        Returns:
+            dict: The instrument, or None if it is not listed.
+        """
+        row = self._by_id.get((exchange_segment, str(security_id)))
+        return None if row is None else self.row(row)
+
+    def by_symbol(self, trading_symbol, exchange_segment):
+        """
+        Look up an instrument by trading symbol.
+
+        Args:
+            trading_symbol (str): The trading symbol, e.g. 'RELIANCE' or 'NIFTY-Oct2026-25000-CE'.
+            exchange_segment (str): The exchange segment.
+
+        Returns:
+            dict: The instrument, or None if it is not listed.
+        """
+        row = self._by_symbol.get((exchange_segment, trading_symbol))
+        return None if row is None else self.row(row)
+
+    def by_isin(self, isin):
+        """
+        Look up the instruments of an ISIN, one per exchange it is listed on.
+
+        Args:
+            isin (str): The ISIN.
+
+        Returns:
+            list: The instruments; empty if none is listed.
+        """
+        return [self.row(row) for row in self._by_isin.get(isin, ())]
+
+    def option(self, underlying_symbol, expiry, strike, option_type):
+        """
+        Look up an option contract.
+
+        Args:
+            underlying_symbol (str): The underlying, e.g. 'NIFTY'.
+            expiry (str | date | datetime): The expiry date; strings as 'YYYY-MM-DD'.
+            strike (float): The strike price.
+            option_type (str): 'CE' or 'PE'.
+
+        Returns:
+            dict: The contract, or None if it is not listed.
+        """
+        row = self._by_option.get((underlying_symbol, self._expiry_key(expiry), float(strike), option_type))
+        return None if row is None else self.row(row)
+
+    def security_ids(self, trading_symbols, exchange_segment):
+        """
+        Resolve many trading symbols of one segment to security IDs.
+
+        Args:
+            trading_symbols (list): The trading symbols.
+            exchange_segment (str): The exchange segment.
+
+        Returns:
+            list: Security IDs in the same order; None for symbols that are not listed.
+        """
+        security_id = self.columns['security_id']
+        rows = (self._by_symbol.get((exchange_segment, symbol)) for symbol in trading_symbols)
+        return [None if row is None else security_id[row] for row in rows]
+
+    def diff(self, previous):
+        """
+        Compare this master with an earlier snapshot, e.g. yesterday's.
+
+        Args:
+            previous (InstrumentMaster): The earlier snapshot.
+
+        Returns:
+            InstrumentDiff: Instruments added and removed since, and those whose columns changed.
+        """
+        from dhanhq.instrument_diff import InstrumentDiff
+        return InstrumentDiff.between(previous, self)
+
+    def options_index(self, exchange_segments=None, as_of=None):
+        """
+        Build an index of the option contracts: expiries, strike ladders and expiry calendar.
+
+        Args:
+            exchange_segments (list, optional): Only index these segments, e.g. ['NSE_FNO'].
+            as_of (str | date, optional): The date this master was downloaded; today in IST by default.
+
+        Returns:
+            OptionsIndex: The index.
+        """
+        from dhanhq.options_index import OptionsIndex
+        return OptionsIndex.from_master(self, exchange_segments, as_of)
+
+    def symbol_search(self):
+        """
+        Build a prefix and fuzzy search index over the trading symbols, custom symbols and names.
+
+        Returns:
+            SymbolSearch: The index.
+        """
+        from dhanhq.symbol_search import SymbolSearch
+        return SymbolSearch.from_master(self)
+
+    def to_frame(self):
+        """
+        Return the normalised columns as a DataFrame.
+
+        Returns:
+            pd.DataFrame: One row per instrument.
+        """
+        return pd.DataFrame(self.columns)
+
+    @staticmethod
+    def _expiry_key(expiry):
+        if isinstance(expiry, datetime.datetime):
+            return expiry.date()
+        if isinstance(expiry, datetime.date):
+            return expiry
+        if isinstance(expiry, np.datetime64):
+            return expiry.astype('datetime64[D]').item()
+        return datetime.date.fromisoformat(str(expiry)[:10])
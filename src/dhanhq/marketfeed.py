@@ -11,7 +11,8 @@ import asyncio
 import struct
 from datetime import datetime, timezone
 from collections import defaultdict
-import json
+
+from dhanhq import codec
 
 
 class MarketFeed:
@@ -187,7 +188,7 @@ class MarketFeed:
                     "RequestCode": 12
                 }
                 try:
-                    await self.ws.send(json.dumps(disconnect_message))
+                    await self.ws.send(codec.dumps(disconnect_message))
                     header_message = self.create_header(feed_request_code=12, message_length=83, client_id=self.client_id)
                     await self.ws.send(header_message)
                 except Exception:
@@ -306,7 +307,7 @@ class MarketFeed:
                                 } for ex, token in batch
                             ]
                         }
-                        await self.ws.send(json.dumps(subscription_message))
+                        await self.ws.send(codec.dumps(subscription_message))
 
     def get_exchange_segment(self, exchange_code):
         """Convert numeric exchange code to string representation"""
@@ -576,7 +577,7 @@ class MarketFeed:
                                     } for ex, token in batch
                                 ]
                             }
-                            self._run_coroutine(self.ws.send(json.dumps(subscription_message)))
+                            self._run_coroutine(self.ws.send(codec.dumps(subscription_message)))
 
     def unsubscribe_symbols(self, symbols):
         """Function to unsubscribe symbols from connection when connection is already active."""
@@ -616,4 +617,4 @@ class MarketFeed:
                                     } for ex, token in batch
                                 ]
                             }
-                            self._run_coroutine(self.ws.send(json.dumps(unsubscription_message)))
+                            self._run_coroutine(self.ws.send(codec.dumps(unsubscription_message)))
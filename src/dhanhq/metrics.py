@@ -0,0 +1,232 @@
+"""
+    Per-endpoint request metrics for the DhanHQ REST APIs.
+
+    Records request counts, latency histograms, payload sizes, HTTP statuses and Dhan error
+    codes per endpoint template (ids collapsed, e.g. /orders/{id}), and exports them as a
+    snapshot dict or in Prometheus text format.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import bisect
+import re
+import threading
+
+_ID_SEGMENT = re.compile(r'\d')
+
+
+class _EndpointMetrics:
+    """Counters of one (method, endpoint template)."""
+
+    def __init__(self, bucket_count):
+        self.count = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.buckets = [0] * bucket_count
+        self.server_time_sum = 0.0
+        self.server_time_count = 0
+        self.rate_limit_wait_sum = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.statuses = {}
+        self.error_codes = {}
+
+
+class MetricsRegistry:
+    """Thread-safe registry of per-endpoint request metrics."""
+
+    """Upper bounds in seconds of the latency histogram buckets"""
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    """Path segments that are always ids, whatever they look like"""
+    ID_AFTER_SEGMENTS = ('external',)
+
+    """Status recorded for requests that failed before a response arrived"""
+    TRANSPORT_ERROR = 'transport_error'
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        Args:
+            buckets (tuple): Ascending upper bounds in seconds of the latency histogram buckets.
+        """
+        self.bucket_bounds = tuple(buckets)
+        self._endpoints = {}
+        self._templates = {}
+        self._lock = threading.Lock()
+
+    def endpoint_template(self, endpoint):
+        """
+        Return the endpoint with its query string dropped and id segments collapsed to {id}.
+
+        A segment is an id if it contains a digit (order ids, dates, ISINs, page numbers) or
+        follows one of ID_AFTER_SEGMENTS, e.g. /orders/external/{id}.
+
+        Args:
+            endpoint (str): The endpoint ignoring the base URL.
+
+        Returns:
+            str: The endpoint template, e.g. '/trades/{id}/{id}/{id}'.
+        """
+        template = self._templates.get(endpoint)
+        if template is None:
+            segments = endpoint.split('?', 1)[0].split('/')
+            for i, segment in enumerate(segments):
+                if _ID_SEGMENT.search(segment) or (i and segments[i - 1] in MetricsRegistry.ID_AFTER_SEGMENTS):
+                    segments[i] = '{id}'
+            template = '/'.join(segments)
+            if len(self._templates) < 4096:
+                self._templates[endpoint] = template
+        return template
+
+    def record(self, method, endpoint, latency, status, request_bytes=0, response_bytes=0, error_code=None,
+               server_time=None, rate_limit_wait=0.0):
+        """
+        Record one HTTP attempt.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint ignoring the base URL.
+            latency (float): Seconds from sending the request to having the parsed response.
+            status (int | str): The HTTP status code, or TRANSPORT_ERROR.
+            request_bytes (int): Size of the request body.
+            response_bytes (int): Size of the response body.
+            error_code (str, optional): Dhan error code of a failed response, e.g. 'DH-905'.
+            server_time (float, optional): Seconds until the response headers arrived.
+            rate_limit_wait (float): Seconds spent waiting for the rate limiter before sending.
+        """
+        key = (method, self.endpoint_template(endpoint))
+        bucket = bisect.bisect_left(self.bucket_bounds, latency)
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = _EndpointMetrics(len(self.bucket_bounds) + 1)
+            metrics.count += 1
+            metrics.latency_sum += latency
+            metrics.latency_max = max(metrics.latency_max, latency)
+            metrics.buckets[bucket] += 1
+            if server_time is not None:
+                metrics.server_time_sum += server_time
+                metrics.server_time_count += 1
+            metrics.rate_limit_wait_sum += rate_limit_wait
+            metrics.request_bytes += request_bytes
+            metrics.response_bytes += response_bytes
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            if error_code is not None:
+                metrics.error_codes[error_code] = metrics.error_codes.get(error_code, 0) + 1
+
+    def reset(self):
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self):
+        """
+        Return the recorded metrics.
+
+        Returns:
+            dict: 'METHOD /endpoint/template' to count, statuses, error_codes, payload sizes and a
+                latency summary (sum, mean, max and p50/p90/p99 estimated from the histogram).
+                server_time_mean is the mean time until response headers arrived, so
+                mean - server_time_mean approximates time spent reading and parsing the body.
+        """
+        with self._lock:
+            items = [(key, self._copy(metrics)) for key, metrics in self._endpoints.items()]
+        snapshot = {}
+        for (method, template), metrics in sorted(items):
+            snapshot[f'{method} {template}'] = {
+                'count': metrics.count,
+                'statuses': metrics.statuses,
+                'error_codes': metrics.error_codes,
+                'request_bytes': metrics.request_bytes,
+                'response_bytes': metrics.response_bytes,
+                'rate_limit_wait_sum': metrics.rate_limit_wait_sum,
+                'latency': {
+                    'sum': metrics.latency_sum,
+                    'mean': metrics.latency_sum / metrics.count,
+                    'max': metrics.latency_max,
+                    'p50': self._quantile(metrics, 0.5),
+                    'p90': self._quantile(metrics, 0.9),
+                    'p99': self._quantile(metrics, 0.99),
+                    'server_time_mean': (metrics.server_time_sum / metrics.server_time_count
+                                         if metrics.server_time_count else None),
+                },
+            }
+        return snapshot
+
+    def to_prometheus(self, prefix='dhanhq'):
+        """
+        Return the recorded metrics in Prometheus text exposition format.
+
+        Args:
+            prefix (str): Prefix of the metric names.
+
+        Returns:
+            str: The exposition text.
+        """
+        with self._lock:
+            items = sorted((key, self._copy(metrics)) for key, metrics in self._endpoints.items())
+        lines = [
+            f'# HELP {prefix}_requests_total HTTP requests sent, by response status.',
+            f'# TYPE {prefix}_requests_total counter',
+        ]
+        for (method, template), metrics in items:
+            for status, count in sorted(metrics.statuses.items(), key=lambda item: str(item[0])):
+                lines.append(f'{prefix}_requests_total{_labels(method, template, status=status)} {count}')
+
+        lines += [f'# HELP {prefix}_errors_total Failed responses, by Dhan error code.',
+                  f'# TYPE {prefix}_errors_total counter']
+        for (method, template), metrics in items:
+            for error_code, count in sorted(metrics.error_codes.items()):
+                lines.append(f'{prefix}_errors_total{_labels(method, template, error_code=error_code)} {count}')
+
+        lines += [f'# HELP {prefix}_request_duration_seconds Time from sending a request to its parsed response.',
+                  f'# TYPE {prefix}_request_duration_seconds histogram']
+        for (method, template), metrics in items:
+            cumulative = 0
+            for bound, count in zip(self.bucket_bounds + (float('inf'),), metrics.buckets):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{prefix}_request_duration_seconds_bucket{_labels(method, template, le=le)} '
+                             f'{cumulative}')
+            labels = _labels(method, template)
+            lines.append(f'{prefix}_request_duration_seconds_sum{labels} {metrics.latency_sum}')
+            lines.append(f'{prefix}_request_duration_seconds_count{labels} {metrics.count}')
+
+        for name, attribute, help_text in (
+                ('server_time_seconds_total', 'server_time_sum', 'Time until response headers arrived.'),
+                ('rate_limit_wait_seconds_total', 'rate_limit_wait_sum', 'Time spent waiting for the rate limiter.'),
+                ('request_bytes_total', 'request_bytes', 'Request body bytes sent.'),
+                ('response_bytes_total', 'response_bytes', 'Response body bytes received.')):
+            lines += [f'# HELP {prefix}_{name} {help_text}', f'# TYPE {prefix}_{name} counter']
+            for (method, template), metrics in items:
+                lines.append(f'{prefix}_{name}{_labels(method, template)} {getattr(metrics, attribute)}')
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _copy(metrics):
+        copy = _EndpointMetrics(0)
+        copy.__dict__.update(metrics.__dict__)
+        copy.buckets = list(metrics.buckets)
+        copy.statuses = dict(metrics.statuses)
+        copy.error_codes = dict(metrics.error_codes)
+        return copy
+
+    def _quantile(self, metrics, q):
+        """Estimate a latency quantile by interpolating inside its histogram bucket."""
+        rank = q * metrics.count
+        cumulative = 0
+        for i, count in enumerate(metrics.buckets):
+            if count and cumulative + count >= rank:
+                if i == len(self.bucket_bounds):
+                    return metrics.latency_max
+                lower = self.bucket_bounds[i - 1] if i else 0.0
+                upper = min(self.bucket_bounds[i], metrics.latency_max)
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return metrics.latency_max
+
+
+def _labels(method, template, **extra):
+    labels = {'method': method, 'endpoint': template, **extra}
+    return '{' + ','.join(f'{name}="{value}"' for name, value in labels.items()) + '}'
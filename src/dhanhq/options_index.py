@@ -0,0 +1,300 @@
+"""
+    Option contract index built from the instrument master.
+
+    OptionsIndex keeps, per underlying, the sorted expiry dates with their weekly/monthly
+    calendar, and per expiry the sorted strikes with the CE and PE security IDs. Resolving
+    the ATM strike for a spot price, a strike ladder around it or the date behind an
+    expiry code is a binary search instead of an expiry_list call or a DataFrame filter.
+    The master only lists contracts that had not expired when it was taken, so expiry codes
+    are only resolved for dates from then on.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from dhanhq.instruments import InstrumentMaster
+
+
+class OptionsIndex:
+    """Expiries, strike ladders and expiry calendar of every option underlying."""
+
+    """Constants for Expiry Flag, as used by expired_options_data"""
+    WEEK = 'WEEK'
+    MONTH = 'MONTH'
+
+    MONTHLY_FLAG = 'M'
+    IST = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+
+    def __init__(self, chains, calendars, as_of):
+        """
+        Args:
+            chains (dict): (underlying, expiry date) to (strikes, CE security IDs, PE security IDs)
+                arrays sorted by strike; '' where a strike has no contract of that type.
+            calendars (dict): Underlying to {WEEK: all expiries, MONTH: monthly expiries}, each a
+                sorted datetime64[D] array.
+            as_of (datetime.date): The date of the instrument master; expiries before it are not listed.
+
+        Use `from_master` to build one.
+        """
+        self.chains = chains
+        self.calendars = calendars
+        self.as_of = as_of
+
+    def __repr__(self):
+        return f'OptionsIndex({len(self.calendars)} underlyings, {len(self.chains)} expiries, as of {self.as_of})'
+
+    @classmethod
+    def from_master(cls, master, exchange_segments=None, as_of=None):
+        """
+        Build the index from the option contracts of an instrument master.
+
+        Args:
+            master (InstrumentMaster): The instrument master, preferably from the detailed scrip master.
+            exchange_segments (list, optional): Only index these segments, e.g. ['NSE_FNO']. Use it
+                when an underlying has options on more than one exchange.
+            as_of (str | date, optional): The date the master was downloaded; today in IST by default.
+                Pass it for an older snapshot, as expiries before it are missing from the master.
+
+        Returns:
+            OptionsIndex: The index.
+        """
+        as_of = cls._date(as_of)
+        columns = master.columns
+        mask = (columns['option_type'] != '') & ~np.isnat(columns['expiry']) & ~np.isnan(columns['strike'])
+        if exchange_segments is not None:
+            mask &= np.isin(columns['exchange_segment'], list(exchange_segments))
+        rows = np.flatnonzero(mask)
+        if not len(rows):
+            return cls({}, {}, as_of)
+
+        underlying_codes, underlyings = pd.factorize(columns['underlying_symbol'][rows], sort=True)
+        expiry = columns['expiry'][rows]
+        strike = columns['strike'][rows]
+        order = np.lexsort((strike, expiry, underlying_codes))
+        underlying_codes, expiry, strike = underlying_codes[order], expiry[order], strike[order]
+        security_id = columns['security_id'][rows][order]
+        put = columns['option_type'][rows][order] == 'PE'
+        monthly = columns['expiry_flag'][rows][order] == cls.MONTHLY_FLAG
+
+        chains = {}
+        expiries = {}
+        new_chain = (underlying_codes[1:] != underlying_codes[:-1]) | (expiry[1:] != expiry[:-1])
+        starts = np.flatnonzero(np.r_[True, new_chain])
+        for start, stop in zip(starts.tolist(), np.r_[starts[1:], len(rows)].tolist()):
+            underlying = underlyings[underlying_codes[start]]
+            date = expiry[start].item()
+            strikes, position = np.unique(strike[start:stop], return_inverse=True)
+            ids = {}
+            for option_type, is_type in (('CE', ~put[start:stop]), ('PE', put[start:stop])):
+                ids[option_type] = np.full(len(strikes), '', dtype=object)
+                # Assigned back to front so that the first contract of a duplicate strike wins.
+                ids[option_type][position[is_type][::-1]] = security_id[start:stop][is_type][::-1]
+            chains[(underlying, date)] = (strikes, ids['CE'], ids['PE'])
+            expiries.setdefault(underlying, []).append((expiry[start], monthly[start:stop].any()))
+
+        calendars = {underlying: cls._calendar(dates) for underlying, dates in expiries.items()}
+        return cls(chains, calendars, as_of)
+
+    @staticmethod
+    def _calendar(dates):
+        weekly = np.array([date for date, _ in dates], dtype='datetime64[D]')
+        flagged = np.array([is_monthly for _, is_monthly in dates], dtype=bool)
+        if not flagged.any():
+            # Without expiry flags the monthly expiry is the last expiry of each calendar month.
+            month = weekly.astype('datetime64[M]')
+            flagged = np.r_[month[1:] != month[:-1], True]
+        return {OptionsIndex.WEEK: weekly, OptionsIndex.MONTH: weekly[flagged]}
+
+    def underlyings(self):
+        """
+        Return the underlyings that have options.
+
+        Returns:
+            list: Underlying symbols, sorted.
+        """
+        return sorted(self.calendars)
+
+    def expiries(self, underlying, expiry_flag=None, after=None):
+        """
+        Return the expiry dates of an underlying.
+
+        Args:
+            underlying (str): The underlying, e.g. 'NIFTY'.
+            expiry_flag (str, optional): 'MONTH' for monthly expiries only.
+            after (str | date, optional): Only expiries on or after this date.
+
+        Returns:
+            list: datetime.date expiries, nearest first.
+        """
+        dates = self._dates(underlying, expiry_flag)
+        if after is not None:
+            dates = dates[np.searchsorted(dates, np.datetime64(self._date(after), 'D')):]
+        return dates.tolist()
+
+    def expiry_date(self, underlying, expiry_code=0, expiry_flag=WEEK, on=None):
+        """
+        Return the date behind an expiry code, as used by historical_daily_data and expired_options_data.
+
+        Args:
+            underlying (str): The underlying, e.g. 'NIFTY'.
+            expiry_code (int): 0 for the nearest expiry on or after `on`, 1 for the one after it, and so on.
+            expiry_flag (str): 'WEEK' to count every expiry, 'MONTH' to count monthly expiries only.
+            on (str | date, optional): Reference date; today in IST by default.
+
+        Returns:
+            datetime.date: The expiry, or None if the index does not reach that far or `on` is
+                before the date of the master.
+        """
+        start = self._start(underlying, expiry_flag, on)
+        if start is None:
+            return None
+        dates = self._dates(underlying, expiry_flag)
+        position = start + expiry_code
+        return dates[position].item() if 0 <= position < len(dates) else None
+
+    def next_expiry(self, underlying, expiry_flag=WEEK, on=None):
+        """
+        Return the nearest expiry on or after a date.
+
+        Args:
+            underlying (str): The underlying, e.g. 'NIFTY'.
+            expiry_flag (str): 'WEEK' for any expiry, 'MONTH' for the next monthly expiry.
+            on (str | date, optional): Reference date; today in IST by default.
+
+        Returns:
+            datetime.date: The expiry, or None if there is none or `on` is before the date of the master.
+        """
+        return self.expiry_date(underlying, 0, expiry_flag, on)
+
+    def expiry_calendar(self, underlying, on=None, count=4):
+        """
+        Map expiry codes to dates for both expiry flags.
+
+        Args:
+            underlying (str): The underlying, e.g. 'NIFTY'.
+            on (str | date, optional): Reference date; today in IST by default.
+            count (int): Number of expiry codes per flag.
+
+        Returns:
+            dict: {'WEEK': {0: date, 1: date, ...}, 'MONTH': {0: date, ...}}; codes beyond the
+                listed expiries are left out, and all of them if `on` is before the date of the master.
+        """
+        calendar = {}
+        for expiry_flag in (OptionsIndex.WEEK, OptionsIndex.MONTH):
+            start = self._start(underlying, expiry_flag, on)
+            dates = [] if start is None else self._dates(underlying, expiry_flag)[start:start + count].tolist()
+            calendar[expiry_flag] = dict(enumerate(dates))
+        return calendar
+
+    def strikes(self, underlying, expiry):
+        """
+        Return the strikes listed for an expiry.
+
+        Args:
+            underlying (str): The underlying, e.g. 'NIFTY'.
+            expiry (str | date): The expiry date.
+
+        Returns:
+            np.ndarray: Sorted strikes; empty if the expiry is not listed.
+        """
+        return self._chain(underlying, expiry)[0]
+
+    def atm_strike(self, underlying, expiry, spot):
+        """
+        Return the strike nearest to the spot price.
+
+        Args:
+            underlying (str): The underlying, e.g. 'NIFTY'.
+            expiry (str | date): The expiry date.
+            spot (float): The spot price.
+
+        Returns:
+            float: The ATM strike (the lower one when spot is exactly between two), or None if
+                the expiry is not listed.
+        """
+        strikes = self._chain(underlying, expiry)[0]
+        if not len(strikes):
+            return None
+        return float(strikes[self._atm_position(strikes, spot)])
+
+    def strike_ladder(self, underlying, expiry, spot, strikes_around=5):
+        """
+        Return the strikes around ATM with their CE and PE security IDs.
+
+        Args:
+            underlying (str): The underlying, e.g. 'NIFTY'.
+            expiry (str | date): The expiry date.
+            spot (float): The spot price.
+            strikes_around (int): Number of strikes on each side of ATM.
+
+        Returns:
+            list: Dicts of strike, offset (0 at ATM, negative below), CE and PE security IDs
+                (None if not listed), lowest strike first. Cut short at the ends of the chain.
+        """
+        strikes, calls, puts = self._chain(underlying, expiry)
+        if not len(strikes):
+            return []
+        atm = self._atm_position(strikes, spot)
+        ladder = []
+        for position in range(max(0, atm - strikes_around), min(len(strikes), atm + strikes_around + 1)):
+            ladder.append({
+                'strike': float(strikes[position]),
+                'offset': position - atm,
+                'CE': calls[position] or None,
+                'PE': puts[position] or None,
+            })
+        return ladder
+
+    def security_id(self, underlying, expiry, strike, option_type):
+        """
+        Return the security ID of an option contract.
+
+        Args:
+            underlying (str): The underlying, e.g. 'NIFTY'.
+            expiry (str | date): The expiry date.
+            strike (float): The strike price.
+            option_type (str): 'CE' or 'PE'.
+
+        Returns:
+            str: The security ID, or None if the contract is not listed.
+        """
+        strikes, calls, puts = self._chain(underlying, expiry)
+        position = np.searchsorted(strikes, strike)
+        if position == len(strikes) or strikes[position] != strike:
+            return None
+        return (calls if option_type == 'CE' else puts)[position] or None
+
+    def _dates(self, underlying, expiry_flag):
+        calendar = self.calendars.get(underlying)
+        if calendar is None:
+            return np.array([], dtype='datetime64[D]')
+        return calendar[expiry_flag or OptionsIndex.WEEK]
+
+    def _start(self, underlying, expiry_flag, on):
+        # Codes counted from before the master would skip the expiries that were gone from it.
+        on = self._date(on)
+        if on < self.as_of:
+            return None
+        return int(np.searchsorted(self._dates(underlying, expiry_flag), np.datetime64(on, 'D')))
+
+    def _chain(self, underlying, expiry):
+        empty = np.array([], dtype=np.float64)
+        return self.chains.get((underlying, self._date(expiry)), (empty, empty, empty))
+
+    @staticmethod
+    def _atm_position(strikes, spot):
+        position = int(np.searchsorted(strikes, spot))
+        if position == len(strikes) or (position > 0 and spot - strikes[position - 1] <= strikes[position] - spot):
+            return position - 1
+        return position
+
+    @staticmethod
+    def _date(value):
+        if value is None:
+            return datetime.datetime.now(OptionsIndex.IST).date()
+        return InstrumentMaster._expiry_key(value)
@@ -0,0 +1,166 @@
+"""
+    Panel of expired options data across strikes, option types and expiries.
+
+    OptionsPanel holds the result of HistoricalData.expired_options_sweep in one dense array
+    indexed by expiry code, option type, time, strike and field, so a volatility surface or the
+    history of one strike is an array slice instead of a loop over hundreds of responses. The
+    values are float32 by default, which halves the size of a year of 1 minute candles.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import numpy as np
+
+from dhanhq._historical_data import HistoricalData
+
+
+class OptionsPanel:
+    """Expired options data as an (expiry code, option type, time, strike, field) array."""
+
+    """Option types and the keys of their data in a rolling option response"""
+    CALL = 'CALL'
+    PUT = 'PUT'
+    RESPONSE_KEYS = {CALL: 'ce', PUT: 'pe'}
+
+    def __init__(self, timestamps, expiry_codes, option_types, strikes, fields, values, failures=()):
+        """
+        Args:
+            timestamps (np.ndarray): Epoch seconds of the time axis, sorted.
+            expiry_codes (tuple): The expiry codes of the first axis.
+            option_types (tuple): 'CALL' and/or 'PUT', the second axis.
+            strikes (tuple): Strikes relative to spot, e.g. ('ATM-1', 'ATM', 'ATM+1'), the fourth axis.
+            fields (tuple): The fields of the last axis, e.g. ('close', 'iv', 'oi').
+            values (np.ndarray): The data; NaN where a strike has no candle at a time.
+            failures (list): The requests of the sweep that failed, as dicts of expiry_code, option_type,
+                strike, from_date, to_date and remarks; their cells are NaN.
+
+        Use `from_responses` or HistoricalData.expired_options_sweep to build one.
+        """
+        self.timestamps = timestamps
+        self.expiry_codes = tuple(expiry_codes)
+        self.option_types = tuple(option_types)
+        self.strikes = tuple(strikes)
+        self.fields = tuple(fields)
+        self.values = values
+        self.failures = list(failures)
+
+    def __repr__(self):
+        return (f'OptionsPanel({len(self.timestamps)} times, {len(self.strikes)} strikes, {len(self.fields)} fields, '
+                f'expiry codes {list(self.expiry_codes)}, {"/".join(self.option_types)}, '
+                f'{len(self.failures)} failed requests)')
+
+    @classmethod
+    def from_responses(cls, responses, expiry_codes, option_types, strikes, fields, dtype=np.float32, failures=()):
+        """
+        Assemble the panel from rolling option responses.
+
+        Args:
+            responses (iterable): (expiry_code, option_type, strike, data) of every call, where data
+                is the 'data' of a successful expired_options_data response.
+            expiry_codes (list): The expiry codes, in panel order.
+            option_types (list): The option types, in panel order.
+            strikes (list): The strikes, in panel order.
+            fields (list): The fields, in panel order.
+            dtype (np.dtype): Type of the values (default: float32; float64 doubles the size).
+            failures (list, optional): The requests that failed; see `failures`.
+
+        Returns:
+            OptionsPanel: The panel.
+        """
+        parts = []
+        for expiry_code, option_type, strike, data in responses:
+            part = (data or {}).get(cls.RESPONSE_KEYS[option_type]) if isinstance(data, dict) else None
+            if part and len(part.get('timestamp') or []):
+                parts.append((expiry_codes.index(expiry_code), option_types.index(option_type),
+                              strikes.index(strike), part))
+        if parts:
+            timestamps = np.unique(np.concatenate([np.asarray(part['timestamp'], dtype=np.int64)
+                                                   for *_, part in parts]))
+        else:
+            timestamps = np.empty(0, dtype=np.int64)
+
+        values = np.full((len(expiry_codes), len(option_types), len(timestamps), len(strikes), len(fields)), np.nan,
+                         dtype=dtype)
+        for expiry, option, strike, part in parts:
+            rows = np.searchsorted(timestamps, np.asarray(part['timestamp'], dtype=np.int64))
+            for position, field in enumerate(fields):
+                column = part.get(field)
+                if column is not None and len(column) == len(rows):
+                    values[expiry, option, rows, strike, position] = np.asarray(column, dtype=np.float64)
+        return cls(timestamps, expiry_codes, option_types, strikes, fields, values, failures)
+
+    def get(self, field, option_type=CALL, expiry_code=None):
+        """
+        Return one field of all strikes over time, e.g. the implied volatility surface.
+
+        Args:
+            field (str): The field, e.g. 'iv' or 'close'.
+            option_type (str): 'CALL' or 'PUT'.
+            expiry_code (int, optional): The expiry code (default: the first one swept).
+
+        Returns:
+            np.ndarray: Array of shape (time, strike).
+        """
+        return self.values[self._expiry(expiry_code), self._option(option_type), :, :, self._field(field)]
+
+    def strike_data(self, strike, option_type=CALL, expiry_code=None):
+        """
+        Return every field of one strike over time.
+
+        Args:
+            strike (str | int): The strike, e.g. 'ATM+2' or 2.
+            option_type (str): 'CALL' or 'PUT'.
+            expiry_code (int, optional): The expiry code (default: the first one swept).
+
+        Returns:
+            dict: 'timestamp' and every field to an array over time.
+        """
+        strike = self.strike_name(strike)
+        if strike not in self.strikes:
+            raise ValueError(f'Strike {strike!r} was not swept. Choose one of {", ".join(self.strikes)}.')
+        values = self.values[self._expiry(expiry_code), self._option(option_type), :, self.strikes.index(strike)]
+        return {'timestamp': self.timestamps, **{field: values[:, i] for i, field in enumerate(self.fields)}}
+
+    def to_frame(self):
+        """
+        Return the panel as a DataFrame indexed by IST time with a (expiry code, option type,
+        strike, field) column index.
+
+        Returns:
+            pd.DataFrame: One row per time.
+        """
+        import pandas as pd
+
+        columns = pd.MultiIndex.from_product([self.expiry_codes, self.option_types, self.strikes, self.fields],
+                                             names=['expiry_code', 'option_type', 'strike', 'field'])
+        # (expiry, option, time, strike, field) -> (time, expiry, option, strike, field)
+        values = np.moveaxis(self.values, 2, 0).reshape(len(self.timestamps), -1)
+        local = (self.timestamps + HistoricalData.IST_OFFSET_SECONDS).astype('datetime64[s]')
+        index = pd.DatetimeIndex(local, name='timestamp').tz_localize(HistoricalData.IST)
+        return pd.DataFrame(values, index=index, columns=columns)
+
+    @staticmethod
+    def strike_name(strike):
+        """Return the strike parameter of expired_options_data for an offset from ATM, e.g. -2 -> 'ATM-2'."""
+        if isinstance(strike, str):
+            return strike.upper()
+        return 'ATM' if strike == 0 else f'ATM{int(strike):+d}'
+
+    def _expiry(self, expiry_code):
+        if expiry_code is None:
+            return 0
+        if expiry_code not in self.expiry_codes:
+            raise ValueError(f'Expiry code {expiry_code!r} was not swept. Choose one of {list(self.expiry_codes)}.')
+        return self.expiry_codes.index(expiry_code)
+
+    def _option(self, option_type):
+        if option_type not in self.option_types:
+            raise ValueError(f'Option type {option_type!r} was not swept. '
+                             f'Choose one of {", ".join(self.option_types)}.')
+        return self.option_types.index(option_type)
+
+    def _field(self, field):
+        if field not in self.fields:
+            raise ValueError(f'Field {field!r} was not swept. Choose one of {", ".join(self.fields)}.')
+        return self.fields.index(field)
@@ -8,9 +8,11 @@
 
 import asyncio
 import websockets
-import json
 from typing import Callable, Optional
 
+from dhanhq import codec
+from dhanhq.response_cache import ResponseCache
+
 
 class OrderUpdate:
     """
@@ -34,6 +36,7 @@ class OrderUpdate:
         """
         self.client_id = dhan_context.get_client_id()
         self.access_token = dhan_context.get_access_token()
+        self.dhan_http = dhan_context.get_dhan_http()
         self.order_feed_wss = "wss://api-order-update.dhan.co"
 
     async def connect_order_update(self):
@@ -52,21 +55,25 @@ class OrderUpdate:
                 "UserType": "SELF"
             }
 
-            await websocket.send(json.dumps(auth_message))
+            await websocket.send(codec.dumps(auth_message))
             print(f"Sent subscribe message: {auth_message}")
 
             async for message in websocket:
-                data = json.loads(message)
+                data = codec.loads(message)
                 self.handle_order_update(data)
 
     def handle_order_update(self, order_update):
         """
         Handles incoming order update messages.
 
+        Order alerts also drop cached funds, positions and holdings of the context's
+        DhanHTTP, since fills and exchange-side changes make them stale.
+
         Args:
             order_update (dict): The order update message received from the WebSocket.
         """
         if order_update.get('Type') == 'order_alert':
+            self.dhan_http.invalidate_cache(ResponseCache.ORDER_DEPENDENT_ENDPOINTS)
             if self.on_update and callable(self.on_update):
                 return self.on_update(order_update)
 
@@ -0,0 +1,113 @@
+"""
+    Pre-validated, pre-encoded order templates and order acknowledgement latency log.
+
+    A PreparedOrder holds the encoded JSON of every field that is fixed per instrument, so
+    placing it only appends quantity and prices to a byte string instead of building,
+    upper-casing and encoding a payload dict.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+
+from dhanhq import codec
+
+
+class PreparedOrder:
+    """The fixed part of an order, encoded once."""
+
+    def __init__(self, endpoint, fields, client_id):
+        """
+        Args:
+            endpoint (str): The placement endpoint, e.g. '/orders'.
+            fields (dict): Validated fields that do not change between placements.
+            client_id (str): The client ID of the Dhan account.
+        """
+        self.endpoint = endpoint
+        self.fields = dict(fields)
+        # Encoded object without its closing brace; placements append the variable fields.
+        self._prefix = codec.encode({**self.fields, 'dhanClientId': client_id})[:-1]
+
+    def __repr__(self):
+        return f'PreparedOrder({self.endpoint!r}, {self.fields!r})'
+
+    def encode(self, numbers, correlation_id=None):
+        """
+        Return the request body with the variable fields appended.
+
+        Args:
+            numbers (tuple): (name, value) pairs; int values are encoded as integers, others as floats.
+            correlation_id (str, optional): The order tag.
+
+        Returns:
+            bytes: The encoded payload.
+
+        Raises:
+            ValueError: If a value is not a finite number.
+        """
+        parts = [self._prefix]
+        for name, value in numbers:
+            if isinstance(value, int):
+                parts.append(b',"%s":%d' % (name, value))
+            else:
+                value = float(value)
+                if not math.isfinite(value):
+                    raise ValueError(f"{name.decode()} must be a finite number.")
+                parts.append(b',"%s":%s' % (name, repr(value).encode()))
+        if correlation_id:
+            parts.append(b',"correlationId":' + codec.encode(correlation_id))
+        parts.append(b'}')
+        return b''.join(parts)
+
+
+class OrderAckLog:
+    """Bounded log of send-to-acknowledgement latencies of placed orders."""
+
+    DEFAULT_MAXLEN = 1000
+
+    def __init__(self, maxlen=DEFAULT_MAXLEN):
+        """
+        Args:
+            maxlen (int): Number of most recent orders kept.
+        """
+        self._entries = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, started, response, correlation_id=None):
+        """
+        Record the outcome of one placement.
+
+        Args:
+            endpoint (str): The placement endpoint.
+            started (float): time.perf_counter() when placement began; the latency includes any
+                rate-limiter wait and retries.
+            response (dict): The parsed response.
+            correlation_id (str, optional): The order tag.
+        """
+        latency = time.perf_counter() - started
+        data = response.get('data')
+        entry = {
+            'endpoint': endpoint,
+            'order_id': data.get('orderId') if isinstance(data, dict) else None,
+            'correlation_id': correlation_id,
+            'status': response.get('status'),
+            'latency': latency,
+            'sent_at': time.time() - latency,
+        }
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self):
+        """
+        Return the logged placements, oldest first.
+
+        Returns:
+            list: Dicts of endpoint, order_id, correlation_id, status, latency (seconds) and
+                sent_at (epoch seconds).
+        """
+        with self._lock:
+            return list(self._entries)
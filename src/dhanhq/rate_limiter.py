@@ -0,0 +1,231 @@
+"""
+    Client-side rate limiting for the DhanHQ REST APIs.
+
+    Dhan enforces separate limits per family of APIs (orders, historical data, market quotes,
+    option chain and everything else). RateLimiter keeps one set of token buckets per family
+    and makes callers wait for their turn instead of letting the server throttle them.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import copy
+import math
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate` requests every `per` seconds.
+
+    The bucket is tracked as a theoretical arrival time (GCRA), which lets callers reserve
+    a future slot: reservations are handed out strictly in the order they are made.
+    """
+
+    def __init__(self, rate, per):
+        self.rate = rate
+        self.per = per
+        self.interval = per / rate
+        self.tolerance = self.interval * (rate - 1)
+        self._tat = float('-inf')
+
+    def earliest(self, now):
+        """Return the earliest time at or after `now` when a token is available."""
+        return max(now, self._tat - self.tolerance)
+
+    def consume(self, at):
+        """Take one token at time `at`."""
+        self._tat = max(self._tat, at) + self.interval
+
+    def remaining(self, now):
+        """Return the number of tokens that can be taken right now without waiting."""
+        backlog = max(self._tat, now) - now
+        return max(0, math.floor((self.tolerance - backlog) / self.interval + 1e-9) + 1)
+
+
+class Reservation:
+    """A slot reserved for one request; a priority request may push it back until it is due."""
+
+    def __init__(self, family, priority):
+        self.family = family
+        self.priority = priority
+        self.at = None
+
+
+class RateLimiter:
+    """
+    Schedules requests under Dhan's per-family rate limits.
+
+    Each family has one token bucket per window (second, minute, hour, day). A request
+    reserves a token in every bucket of its family at the earliest time all of them allow,
+    so concurrent callers are served first come, first served at the maximum allowed rate.
+    Reservations that are not due yet stay queued, so a priority request can take the
+    earliest slot ahead of them without the family ever going over its limits.
+    """
+
+    """Endpoint families with separate limits"""
+    ORDER = 'order'
+    DATA = 'data'
+    QUOTE = 'quote'
+    OPTION_CHAIN = 'option_chain'
+    NON_TRADING = 'non_trading'
+
+    """Limits per family as (requests, seconds) windows"""
+    DEFAULT_LIMITS = {
+        ORDER: ((10, 1), (250, 60), (1000, 3600), (7000, 86400)),
+        DATA: ((5, 1), (100000, 86400)),
+        QUOTE: ((1, 1),),
+        OPTION_CHAIN: ((1, 3),),
+        NON_TRADING: ((20, 1),),
+    }
+
+    ORDER_ENDPOINT_PREFIXES = ('/orders', '/super/orders', '/forever/orders', '/alerts/orders',
+                               '/globalstocks/orders')
+
+    def __init__(self, limits=None, clock=time.monotonic, sleep=time.sleep):
+        """
+        Args:
+            limits (dict): Family to tuple of (requests, seconds) windows. Families missing
+                here fall back to DEFAULT_LIMITS.
+            clock (callable): Monotonic clock in seconds.
+            sleep (callable): Function used to wait for a reserved slot.
+        """
+        limits = {**RateLimiter.DEFAULT_LIMITS, **(limits or {})}
+        self.buckets = {family: [TokenBucket(rate, per) for rate, per in windows]
+                        for family, windows in limits.items()}
+        self.clock = clock
+        self.sleep = sleep
+        self._pending = {family: [] for family in self.buckets}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def classify(method, endpoint):
+        """
+        Return the rate-limit family of a request.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint ignoring the base URL.
+
+        Returns:
+            str: One of ORDER, DATA, QUOTE, OPTION_CHAIN or NON_TRADING.
+        """
+        path = endpoint.split('?', 1)[0]
+        if path.startswith('/charts/'):
+            return RateLimiter.DATA
+        if path.startswith('/marketfeed/'):
+            return RateLimiter.QUOTE
+        if path == '/optionchain':
+            return RateLimiter.OPTION_CHAIN
+        if method != 'GET' and path.startswith(RateLimiter.ORDER_ENDPOINT_PREFIXES):
+            return RateLimiter.ORDER
+        return RateLimiter.NON_TRADING
+
+    def book(self, family, priority=False):
+        """
+        Reserve the next slot for a request of the given family.
+
+        Args:
+            family (str): The rate-limit family.
+            priority (bool): Take the earliest slot the limits allow, ahead of queued requests,
+                which are pushed back by one slot each.
+
+        Returns:
+            Reservation: The reservation; ask `delay` when it is due, as a priority request may move it.
+        """
+        reservation = Reservation(family, priority)
+        with self._lock:
+            now = self.clock()
+            if family not in self.buckets:
+                reservation.at = now
+                return reservation
+            self._settle(family, now)
+            pending = self._pending[family]
+            if priority:
+                pending.insert(sum(1 for queued in pending if queued.priority), reservation)
+            else:
+                pending.append(reservation)
+            self._schedule(family, now)
+            self._settle(family, now)
+        return reservation
+
+    def delay(self, reservation):
+        """
+        Return the seconds left until a reservation is due; 0 once the request may be sent.
+        """
+        with self._lock:
+            now = self.clock()
+            self._settle(reservation.family, now)
+            return max(0.0, reservation.at - now)
+
+    def reserve(self, family, priority=False):
+        """
+        Reserve the next slot for a request of the given family.
+
+        A later priority request may still push the slot back; callers that wait for it should
+        use `acquire`, or `book` and `delay`.
+
+        Args:
+            family (str): The rate-limit family.
+            priority (bool): Go ahead of queued requests; see `book`.
+
+        Returns:
+            float: Seconds the caller has to wait before sending the request.
+        """
+        return self.delay(self.book(family, priority))
+
+    def acquire(self, family, priority=False):
+        """
+        Block until a request of the given family may be sent.
+
+        Args:
+            family (str): The rate-limit family.
+            priority (bool): Go ahead of queued requests; see `book`.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        reservation = self.book(family, priority)
+        waited, slot = 0.0, None
+        # Sleep again only if a priority request pushed the slot back meanwhile.
+        while (delay := self.delay(reservation)) > 0 and reservation.at != slot:
+            slot = reservation.at
+            self.sleep(delay)
+            waited += delay
+        return waited
+
+    def _schedule(self, family, now):
+        # Lay the queued reservations out in order after the requests already sent.
+        buckets = [copy.copy(bucket) for bucket in self.buckets[family]]
+        for reservation in self._pending[family]:
+            reservation.at = max(bucket.earliest(now) for bucket in buckets)
+            for bucket in buckets:
+                bucket.consume(reservation.at)
+        return buckets
+
+    def _settle(self, family, now):
+        # Reservations that are due can no longer move; charge them to the buckets.
+        pending = self._pending.get(family)
+        while pending and pending[0].at <= now:
+            reservation = pending.pop(0)
+            for bucket in self.buckets[family]:
+                bucket.consume(reservation.at)
+
+    def remaining(self, family=None):
+        """
+        Return the budget that can be spent right now without waiting.
+
+        Args:
+            family (str, optional): Limit the result to one family.
+
+        Returns:
+            dict: Family to {window seconds: remaining requests}, or the inner dict if a family is given.
+        """
+        with self._lock:
+            now = self.clock()
+            budget = {}
+            for name in self.buckets:
+                self._settle(name, now)
+                budget[name] = {bucket.per: bucket.remaining(now) for bucket in self._schedule(name, now)}
+        return budget[family] if family is not None else budget
@@ -0,0 +1,186 @@
+"""
+    Response cache for read-mostly DhanHQ REST endpoints.
+
+    Successful responses of the configured endpoints are kept for a per-endpoint TTL in a
+    size-bounded LRU. Writes that change funds, positions or holdings drop the dependent
+    entries, so reads never serve data older than the client's own last action. Every endpoint
+    has a generation that invalidation bumps, and a response read under an older generation, i.e.
+    one still in flight when a write landed, is not cached.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of successful responses with per-endpoint TTLs."""
+
+    """Seconds a response stays fresh, per endpoint"""
+    DEFAULT_TTLS = {
+        '/fundlimit': 2,
+        '/holdings': 10,
+        '/positions': 2,
+        '/optionchain/expirylist': 300,
+        '/globalstocks/marketstatus': 10,
+        '/globalstocks/fundlimit': 2,
+        '/globalstocks/holdings': 10,
+    }
+
+    """Cached endpoints that go stale when an order changes"""
+    ORDER_DEPENDENT_ENDPOINTS = ('/fundlimit', '/positions', '/holdings')
+
+    """Write endpoint prefixes and the cached endpoints they invalidate"""
+    INVALIDATIONS = (
+        ('/orders', ORDER_DEPENDENT_ENDPOINTS),
+        ('/super/orders', ORDER_DEPENDENT_ENDPOINTS),
+        ('/forever/orders', ORDER_DEPENDENT_ENDPOINTS),
+        ('/positions', ORDER_DEPENDENT_ENDPOINTS),
+        ('/globalstocks/orders', ('/globalstocks/fundlimit', '/globalstocks/holdings')),
+    )
+
+    DEFAULT_MAXSIZE = 256
+
+    def __init__(self, ttls=None, maxsize=DEFAULT_MAXSIZE, clock=time.monotonic):
+        """
+        Args:
+            ttls (dict): Endpoint to TTL in seconds. Replaces DEFAULT_TTLS when given.
+            maxsize (int): Maximum number of cached responses.
+            clock (callable): Monotonic clock in seconds.
+        """
+        self.ttls = dict(ResponseCache.DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def key(self, method, endpoint, payload=None):
+        """
+        Return the cache key of a request, or None if the request is not cacheable.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint ignoring the base URL.
+            payload (str): The encoded request payload.
+
+        Returns:
+            tuple: (method, endpoint, payload), or None.
+        """
+        if method not in ('GET', 'POST') or endpoint.split('?', 1)[0] not in self.ttls:
+            return None
+        return method, endpoint, payload
+
+    def get(self, key):
+        """
+        Return a copy of the fresh response cached under key, or None.
+
+        Args:
+            key (tuple): A key returned by `key`.
+
+        Returns:
+            dict: The cached response, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self.clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return deepcopy(entry[2])
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def generation(self, key):
+        """
+        Return the generation of the endpoint of key, to pass to `put` once its response arrives.
+
+        Args:
+            key (tuple): A key returned by `key`.
+
+        Returns:
+            int: The number of times the endpoint was invalidated.
+        """
+        with self._lock:
+            return self._generations.get(key[1].split('?', 1)[0], 0)
+
+    def put(self, key, response, generation=None):
+        """
+        Cache a response if it is successful and no invalidation happened while it was fetched.
+
+        Args:
+            key (tuple): A key returned by `key`.
+            response (dict): The parsed response.
+            generation (int, optional): The `generation` of key when the request was sent.
+        """
+        if response.get('status') != 'success':
+            return
+        path = key[1].split('?', 1)[0]
+        with self._lock:
+            if generation is not None and generation != self._generations.get(path, 0):
+                return
+            self._entries[key] = (self.clock() + self.ttls[path], path, deepcopy(response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoints=None):
+        """
+        Drop cached responses.
+
+        Args:
+            endpoints (iterable, optional): Endpoints to drop; all responses if omitted.
+        """
+        with self._lock:
+            if endpoints is None:
+                endpoints = set(self.ttls) | {entry[1] for entry in self._entries.values()}
+                dropped = list(self._entries)
+            else:
+                endpoints = set(endpoints)
+                dropped = [key for key, entry in self._entries.items() if entry[1] in endpoints]
+            for key in dropped:
+                del self._entries[key]
+            for endpoint in endpoints:
+                self._generations[endpoint] = self._generations.get(endpoint, 0) + 1
+            self.invalidations += len(dropped)
+
+    def invalidate_for_write(self, method, endpoint):
+        """
+        Drop the cached responses that a write request makes stale.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint ignoring the base URL.
+        """
+        if method == 'GET':
+            return
+        for prefix, endpoints in ResponseCache.INVALIDATIONS:
+            if endpoint.startswith(prefix):
+                self.invalidate(endpoints)
+                return
+
+    def stats(self):
+        """
+        Return cache counters.
+
+        Returns:
+            dict: hits, misses, evictions, invalidations and current size.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'size': len(self._entries),
+            }
@@ -0,0 +1,123 @@
+"""
+    Retry policy for the DhanHQ REST APIs.
+
+    Idempotent reads are retried with jittered exponential backoff on transport errors and
+    retryable status codes. Order placements are retried only when they carry a correlation
+    id, and only after checking that the first attempt did not already create the order.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import random
+import time
+
+import requests
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is sent again."""
+
+    """Kinds of retry"""
+    IDEMPOTENT = 'idempotent'
+    ORDER_PLACEMENT = 'order_placement'
+
+    RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+    IDEMPOTENT_METHODS = ('GET',)
+
+    """Error codes of a correlation id lookup that mean no order carries the id"""
+    ORDER_NOT_FOUND_ERROR_CODES = ('DH-906',)
+
+    """Placement endpoints whose correlationId can be looked up via /orders/external/{correlationId}"""
+    ORDER_PLACEMENT_ENDPOINTS = ('/orders', '/orders/slicing', '/super/orders', '/forever/orders')
+
+    RETRYABLE_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                            ConnectionError, TimeoutError, EOFError)
+
+    def __init__(self, max_attempts=3, backoff_base=0.25, backoff_max=4.0,
+                 retry_status_codes=RETRYABLE_STATUS_CODES, idempotent_methods=IDEMPOTENT_METHODS,
+                 retry_order_placement=True, sleep=time.sleep, rng=random.random):
+        """
+        Args:
+            max_attempts (int): Total attempts per request, including the first one.
+            backoff_base (float): Backoff ceiling in seconds before the first retry; doubles per retry.
+            backoff_max (float): Upper bound of the backoff ceiling in seconds.
+            retry_status_codes (tuple): HTTP status codes that are retried.
+            idempotent_methods (tuple): HTTP methods that are safe to send again as they are.
+            retry_order_placement (bool): Retry order placements that carry a correlation id.
+            sleep (callable): Function used to wait between attempts.
+            rng (callable): Source of uniform random numbers in [0, 1) used for jitter.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_status_codes = tuple(retry_status_codes)
+        self.idempotent_methods = tuple(idempotent_methods)
+        self.retry_order_placement = retry_order_placement
+        self.sleep = sleep
+        self.rng = rng
+
+    def backoff(self, attempt):
+        """
+        Return the delay before the next attempt, using full jitter.
+
+        Args:
+            attempt (int): The number of attempts made so far (1 after the first failure).
+
+        Returns:
+            float: Seconds to wait.
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return self.rng() * ceiling
+
+    def is_retryable_status(self, status_code):
+        """Return True if a response with this status code may be retried."""
+        return status_code in self.retry_status_codes
+
+    def is_retryable_exception(self, exception):
+        """Return True if the request failed in transport and may be retried."""
+        return isinstance(exception, RetryPolicy.RETRYABLE_EXCEPTIONS)
+
+    def retry_kind(self, method, endpoint, correlation_id=None):
+        """
+        Return how a request may be retried.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint ignoring the base URL.
+            correlation_id (str, optional): The correlationId sent with the request.
+
+        Returns:
+            str: IDEMPOTENT, ORDER_PLACEMENT, or None if the request must not be retried.
+        """
+        if method in self.idempotent_methods:
+            return RetryPolicy.IDEMPOTENT
+        if not (self.retry_order_placement and correlation_id):
+            return None
+        if method == 'POST' and endpoint in RetryPolicy.ORDER_PLACEMENT_ENDPOINTS:
+            return RetryPolicy.ORDER_PLACEMENT
+        return None
+
+    @staticmethod
+    def correlation_endpoint(correlation_id):
+        """Return the endpoint that looks up an order by its correlation id."""
+        return f'/orders/external/{correlation_id}'
+
+    @staticmethod
+    def placement_outcome(lookup_response):
+        """
+        Interpret a correlation id lookup made before retrying a placement.
+
+        Args:
+            lookup_response (dict): The response of the /orders/external/{correlationId} lookup.
+
+        Returns:
+            str: 'placed' if the order exists, 'absent' if the server explicitly reports no such
+                order, or 'unknown' for any other failure, e.g. a rate limit or server error.
+        """
+        if lookup_response['status'] == 'success':
+            return 'placed' if lookup_response['data'] else 'absent'
+        remarks = lookup_response['remarks']
+        if isinstance(remarks, dict) and remarks.get('error_code') in RetryPolicy.ORDER_NOT_FOUND_ERROR_CODES:
+            return 'absent'
+        return 'unknown'
@@ -0,0 +1,320 @@
+"""
+    Streaming download and selective parsing of the scrip master CSVs.
+
+    The scrip master is written to disk chunk by chunk as it arrives and parsed in blocks of
+    rows, keeping only the requested columns and the rows that pass the filters. Known columns
+    get compact dtypes (categoricals for codes, int32 IDs, float32 sizes) instead of the object
+    and float64 columns pandas would infer. Security IDs stay strings if any of them is blank
+    or not a number.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import requests
+from pandas.api.types import union_categoricals
+
+COMPACT = 'compact'
+DETAILED = 'detailed'
+GLOBAL = 'global'
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+PARSE_CHUNK_ROWS = 50000
+
+"""Start method of the parser processes; the download threads are running when they start, so they are not forked"""
+PARSER_START_METHOD = 'spawn'
+
+"""Exchange segment for (exchange, segment) codes of the Indian scrip masters"""
+SEGMENTS = {
+    ('NSE', 'E'): 'NSE_EQ',
+    ('NSE', 'D'): 'NSE_FNO',
+    ('NSE', 'C'): 'NSE_CURRENCY',
+    ('NSE', 'I'): 'IDX_I',
+    ('BSE', 'E'): 'BSE_EQ',
+    ('BSE', 'D'): 'BSE_FNO',
+    ('BSE', 'C'): 'BSE_CURRENCY',
+    ('BSE', 'I'): 'IDX_I',
+    ('MCX', 'M'): 'MCX_COMM',
+    ('MCX', 'I'): 'IDX_I',
+}
+GLOBAL_SEGMENT = 'INX_EQ'
+
+"""Exchange and segment code columns, per source"""
+SEGMENT_COLUMNS = {
+    COMPACT: ('SEM_EXM_EXCH_ID', 'SEM_SEGMENT'),
+    DETAILED: ('EXCH_ID', 'SEGMENT'),
+    GLOBAL: (),
+}
+
+"""Instrument column, per source"""
+INSTRUMENT_COLUMNS = {
+    COMPACT: 'SEM_INSTRUMENT_NAME',
+    DETAILED: 'INSTRUMENT',
+    GLOBAL: 'INSTRUMENT_NAME',
+}
+
+"""Security ID column, per source; parsed as text and turned into int32 when every ID is a number"""
+ID_COLUMNS = {
+    COMPACT: 'SEM_SMST_SECURITY_ID',
+    DETAILED: 'SECURITY_ID',
+    GLOBAL: None,
+}
+
+"""Compact dtypes of the known columns, per source; other columns are inferred"""
+DTYPES = {
+    COMPACT: {
+        'SEM_EXM_EXCH_ID': 'category',
+        'SEM_SEGMENT': 'category',
+        'SEM_SMST_SECURITY_ID': str,
+        'SEM_INSTRUMENT_NAME': 'category',
+        'SEM_LOT_UNITS': np.float32,
+        'SEM_EXPIRY_DATE': 'category',
+        'SEM_STRIKE_PRICE': np.float64,
+        'SEM_OPTION_TYPE': 'category',
+        'SEM_TICK_SIZE': np.float32,
+        'SEM_EXPIRY_FLAG': 'category',
+        'SEM_EXCH_INSTRUMENT_TYPE': 'category',
+        'SEM_SERIES': 'category',
+    },
+    DETAILED: {
+        'EXCH_ID': 'category',
+        'SEGMENT': 'category',
+        'SECURITY_ID': str,
+        'INSTRUMENT': 'category',
+        'UNDERLYING_SYMBOL': 'category',
+        'INSTRUMENT_TYPE': 'category',
+        'SERIES': 'category',
+        'LOT_SIZE': np.float32,
+        'SM_EXPIRY_DATE': 'category',
+        'STRIKE_PRICE': np.float64,
+        'OPTION_TYPE': 'category',
+        'TICK_SIZE': np.float32,
+        'EXPIRY_FLAG': 'category',
+        'BRACKET_FLAG': 'category',
+        'COVER_FLAG': 'category',
+        'ASM_GSM_FLAG': 'category',
+        'ASM_GSM_CATEGORY': 'category',
+        'BUY_SELL_INDICATOR': 'category',
+    },
+    GLOBAL: {
+        'EXCHANGE': 'category',
+        'SEGMENT': 'category',
+        'CUSTOM_EXCH': 'category',
+        'INSTRUMENT_NAME': 'category',
+        'TICK_SIZE': np.float32,
+        'LOT_SIZE': np.float32,
+    },
+}
+
+
+def download(url, filename, chunk_size=DOWNLOAD_CHUNK_SIZE, headers=None):
+    """
+    Stream a CSV to disk without holding the whole response in memory.
+
+    Args:
+        url (str): The CSV URL.
+        filename (str): Where to save it.
+        chunk_size (int): Bytes written per chunk.
+        headers (dict, optional): Request headers, e.g. If-None-Match for a conditional download.
+
+    Returns:
+        requests.Response: The closed response, for its status code and headers. Nothing is
+            written when a conditional download is answered with 304 Not Modified.
+
+    Raises:
+        requests.HTTPError: If the download fails.
+    """
+    conditional = {'headers': headers} if headers else {}
+    with requests.get(url, stream=True, **conditional) as response:
+        if response.status_code == 304:
+            return response
+        response.raise_for_status()
+        with open(filename, 'wb') as f:
+            for chunk in response.iter_content(chunk_size):
+                f.write(chunk)
+    return response
+
+
+def exchange_segment(frame, source):
+    """
+    Return the API exchange segment (e.g. 'NSE_FNO') of every row.
+
+    Args:
+        frame (pd.DataFrame): Scrip master rows including the exchange and segment columns.
+        source (str): 'compact', 'detailed' or 'global'.
+
+    Returns:
+        pd.Series: The exchange segments; '' for unknown codes.
+    """
+    if source == GLOBAL:
+        return pd.Series(GLOBAL_SEGMENT, index=frame.index, dtype=object)
+    exchange, segment = SEGMENT_COLUMNS[source]
+    codes = {f'{exchange_code}:{segment_code}': name for (exchange_code, segment_code), name in SEGMENTS.items()}
+    keys = frame[exchange].astype(str) + ':' + frame[segment].astype(str)
+    return keys.map(codes).fillna('').astype(object)
+
+
+def select(frame, source, columns=None, exchange_segments=None, instruments=None, row_filter=None):
+    """
+    Keep the rows that pass the filters, and the requested columns.
+
+    Args:
+        frame (pd.DataFrame): Scrip master rows.
+        source (str): 'compact', 'detailed' or 'global'.
+        columns (list, optional): Columns to keep.
+        exchange_segments (list, optional): Keep only these exchange segments, e.g. ['NSE_FNO'].
+        instruments (list, optional): Keep only these instruments, e.g. ['OPTIDX', 'OPTSTK'].
+        row_filter (callable, optional): Takes the rows, returns a boolean mask of rows to keep.
+
+    Returns:
+        pd.DataFrame: The selected rows and columns.
+    """
+    mask = None
+    if exchange_segments is not None:
+        mask = exchange_segment(frame, source).isin(list(exchange_segments)).to_numpy()
+    if instruments is not None:
+        matches = frame[INSTRUMENT_COLUMNS[source]].isin(list(instruments)).to_numpy()
+        mask = matches if mask is None else mask & matches
+    if row_filter is not None:
+        matches = np.asarray(row_filter(frame), dtype=bool)
+        mask = matches if mask is None else mask & matches
+    if mask is not None:
+        frame = frame[mask]
+    if columns is not None:
+        frame = frame[[column for column in columns if column in frame]]
+    return frame
+
+
+def read(filename, source, columns=None, exchange_segments=None, instruments=None, row_filter=None,
+         chunksize=PARSE_CHUNK_ROWS):
+    """
+    Parse a scrip master CSV block by block with compact dtypes, filtering rows as it goes.
+
+    Args:
+        filename (str): Path of the CSV.
+        source (str): 'compact', 'detailed' or 'global'.
+        columns (list, optional): Columns to parse; all columns by default.
+        exchange_segments (list, optional): Keep only these exchange segments, e.g. ['NSE_FNO'].
+        instruments (list, optional): Keep only these instruments, e.g. ['OPTIDX'].
+        row_filter (callable, optional): Takes a block of rows, returns a boolean mask of rows to keep.
+        chunksize (int): Rows parsed per block.
+
+    Returns:
+        pd.DataFrame: The selected rows and columns.
+
+    Raises:
+        ValueError: If the source is unknown.
+    """
+    if source not in DTYPES:
+        raise ValueError(f"Invalid source {source!r}. Choose 'compact', 'detailed' or 'global'.")
+    header = list(pd.read_csv(filename, nrows=0).columns)
+    wanted = header if columns is None else [column for column in header if column in set(columns)]
+    needed = set(wanted)
+    if exchange_segments is not None:
+        needed.update(SEGMENT_COLUMNS[source])
+    if instruments is not None:
+        needed.add(INSTRUMENT_COLUMNS[source])
+    usecols = header if row_filter is not None else [column for column in header if column in needed]
+    dtypes = {column: dtype for column, dtype in DTYPES[source].items() if column in usecols}
+
+    blocks = [_with_ids(select(block, source, wanted, exchange_segments, instruments, row_filter), source)
+              for block in pd.read_csv(filename, usecols=usecols, dtype=dtypes, chunksize=chunksize)]
+    if not blocks:
+        return _with_ids(pd.read_csv(filename, usecols=wanted, dtype=dtypes, nrows=0), source)
+    frame = _concat(blocks)
+    column = ID_COLUMNS[source]
+    if column in frame and frame[column].dtype.kind not in 'iu':
+        # Blocks with a blank or text ID keep strings; the IDs of the others are turned back into strings.
+        frame[column] = frame[column].map(lambda value: value if pd.isna(value) else str(value))
+    return frame
+
+
+def fetch_all(urls, directory, columns=None, exchange_segments=None, instruments=None, cache=None,
+              processes=None):
+    """
+    Download and parse several scrip masters concurrently, one thread per source.
+
+    Each source is streamed to disk on its own thread and parsed as soon as it is complete,
+    on the same thread or, with `processes`, in a process pool so that parsing one CSV does
+    not hold the GIL while the others are still downloading.
+
+    Args:
+        urls (dict): Source ('compact', 'detailed' or 'global') to CSV URL, for the sources to load.
+        directory (str): Where to save the CSVs.
+        columns (dict, optional): Columns to parse, per source; all columns by default.
+        exchange_segments (list, optional): Keep only these exchange segments, e.g. ['NSE_FNO'].
+        instruments (list, optional): Keep only these instruments, e.g. ['OPTIDX'].
+        cache (ScripMasterCache, optional): Load through the binary on-disk cache instead.
+        processes (bool | int, optional): Parse in a pool of this many processes (True for one per source).
+
+    Returns:
+        dict: Source to (pd.DataFrame, timings), where timings has the download, parse and total
+            seconds and the number of rows. Download and parse are None when loaded through the cache.
+
+    Raises:
+        requests.HTTPError: If a download fails.
+    """
+    columns = columns or {}
+    parser = None
+    if processes and cache is None:
+        parser = ProcessPoolExecutor(max_workers=len(urls) if processes is True else processes,
+                                     mp_context=multiprocessing.get_context(PARSER_START_METHOD))
+
+    def load(source):
+        start = time.perf_counter()
+        if cache is not None:
+            frame = select(cache.load(source, urls[source]), source, columns.get(source), exchange_segments,
+                           instruments)
+            return frame, {'download': None, 'parse': None, 'total': time.perf_counter() - start, 'rows': len(frame)}
+        filename = os.path.join(directory, f'{source}.csv')
+        download(urls[source], filename)
+        downloaded = time.perf_counter()
+        arguments = (filename, source, columns.get(source), exchange_segments, instruments)
+        frame = read(*arguments) if parser is None else parser.submit(read, *arguments).result()
+        end = time.perf_counter()
+        return frame, {'download': downloaded - start, 'parse': end - downloaded, 'total': end - start,
+                       'rows': len(frame)}
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            futures = {source: executor.submit(load, source) for source in urls}
+            return {source: future.result() for source, future in futures.items()}
+    finally:
+        if parser is not None:
+            parser.shutdown()
+
+
+def _with_ids(frame, source):
+    # Security IDs as int32 if all of them are numbers that fit, else left as strings.
+    column = ID_COLUMNS[source]
+    if column not in frame:
+        return frame
+    ids = pd.to_numeric(frame[column], errors='coerce')
+    info = np.iinfo(np.int32)
+    if ids.notna().all() and (ids % 1 == 0).all() and ids.between(info.min, info.max).all():
+        frame[column] = ids.astype(np.int32)
+    return frame
+
+
+def _concat(blocks):
+    # pd.concat turns categoricals with different categories into object columns.
+    columns = {}
+    for column in blocks[0].columns:
+        parts = [block[column] for block in blocks]
+        if isinstance(parts[0].dtype, pd.CategoricalDtype):
+            # Blocks where a column is all missing get empty categories of another dtype.
+            filled = [part.cat.categories for part in parts if len(part.cat.categories)]
+            if filled:
+                empty = pd.CategoricalDtype(filled[0][:0])
+                parts = [part if len(part.cat.categories) else part.astype(empty) for part in parts]
+            columns[column] = pd.Series(union_categoricals(parts))
+        else:
+            columns[column] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(columns)
@@ -0,0 +1,295 @@
+"""
+    Persistent binary cache of the scrip master CSVs.
+
+    Parsed scrip masters are stored column by column as .npy files: numeric columns as
+    native arrays that are memory-mapped on load, text columns dictionary-encoded as codes
+    plus one NUL-separated UTF-8 buffer of their distinct values (JSON for object columns that
+    hold more than strings). A cached list is reused for the rest of the (IST) day and
+    afterwards refreshed with a conditional request, so it is only downloaded, streamed to a
+    temporary file, and parsed again when Dhan publishes a new copy.
+
+    Every write goes to a directory of its own and is published by atomically replacing the
+    small <name>.json file that points to it, so readers never see a half-written list and
+    concurrent writers do not trip over each other.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import glob
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import requests
+
+from dhanhq import scrip_master
+
+
+class ScripMasterCache:
+    """On-disk cache of parsed scrip masters, refreshed once a day or when the server copy changes."""
+
+    DEFAULT_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'dhanhq')
+    IST = timezone(timedelta(hours=5, minutes=30))
+    FORMAT_VERSION = 3
+
+    """Encodings of the distinct values of text columns"""
+    TEXT = 'text'
+    JSON = 'json'
+
+    def __init__(self, directory=None, clock=None):
+        """
+        Args:
+            directory (str): Directory holding the cached lists (default ~/.cache/dhanhq).
+            clock (callable): Returns the current aware datetime; defaults to now in IST.
+        """
+        self.directory = directory or ScripMasterCache.DEFAULT_DIRECTORY
+        self.clock = clock or (lambda: datetime.now(ScripMasterCache.IST))
+
+    @staticmethod
+    def resolve(cache):
+        """
+        Turn the `cache` argument of the fetch helpers into a cache.
+
+        Args:
+            cache (bool | str | ScripMasterCache): True for the default directory, a directory
+                path, a cache, or None/False for no caching.
+
+        Returns:
+            ScripMasterCache: The cache, or None.
+        """
+        if cache is None or cache is False:
+            return None
+        if isinstance(cache, ScripMasterCache):
+            return cache
+        return ScripMasterCache(None if cache is True else cache)
+
+    def today(self):
+        """Return today's date in IST as 'YYYY-MM-DD'."""
+        return self.clock().astimezone(ScripMasterCache.IST).date().isoformat()
+
+    def load(self, name, url):
+        """
+        Return the parsed scrip master, downloading it only if the cache is stale and the
+        server copy has changed.
+
+        Args:
+            name (str): Cache entry name, e.g. 'compact'.
+            url (str): CSV URL.
+
+        Returns:
+            pd.DataFrame: The scrip master as parsed by pd.read_csv.
+
+        Raises:
+            requests.RequestException: If the list has to be downloaded and the download fails
+                while nothing is cached.
+        """
+        meta = self.read_meta(name)
+        if meta is not None and meta.get('url') != url:
+            meta = None
+        if meta is not None and meta.get('date') == self.today():
+            cached = self.read(name)
+            if cached is not None:
+                return cached
+            meta = None
+
+        headers = self._conditional_headers(meta)
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(prefix=f'.{name}-', suffix='.csv', dir=self.directory)
+        os.close(fd)
+        try:
+            try:
+                response = scrip_master.download(url, temporary, headers=headers)
+            except requests.RequestException as e:
+                cached = self.read(name) if meta is not None else None
+                if cached is None:
+                    raise
+                logging.warning('Could not refresh the %s scrip master, using the cached copy of %s: %s',
+                                name, meta.get('date'), e)
+                return cached
+
+            if response.status_code == 304:
+                cached = self._revalidated(name, meta)
+                if cached is not None:
+                    return cached
+                # The server copy is unchanged but the cached one cannot be read: fetch it whole.
+                response = scrip_master.download(url, temporary)
+
+            frame = pd.read_csv(temporary)
+        finally:
+            os.remove(temporary)
+        self.write(name, frame, {
+            'url': url,
+            'date': self.today(),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        })
+        return frame
+
+    def read_meta(self, name):
+        """
+        Return the metadata of a cached list.
+
+        Args:
+            name (str): Cache entry name.
+
+        Returns:
+            dict: url, date, etag, last_modified, rows, columns as (name, dtype, layout) and the
+                data directory, or None if nothing usable is cached.
+        """
+        try:
+            with open(self._meta_path(name)) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if meta.get('version') == ScripMasterCache.FORMAT_VERSION else None
+
+    def read(self, name):
+        """
+        Load a cached list.
+
+        Args:
+            name (str): Cache entry name.
+
+        Returns:
+            pd.DataFrame: The cached list, or None if nothing usable is cached.
+        """
+        meta = self.read_meta(name)
+        while meta is not None:
+            try:
+                return self._read_columns(meta)
+            except (OSError, ValueError) as e:
+                latest = self.read_meta(name)
+                if latest is not None and latest.get('data') != meta.get('data'):
+                    # Replaced by a newer copy while it was read.
+                    meta = latest
+                    continue
+                logging.warning('Ignoring the cached %s scrip master: %s', name, e)
+                return None
+        return None
+
+    def write(self, name, frame, meta):
+        """
+        Store a parsed list, replacing any cached copy.
+
+        Args:
+            name (str): Cache entry name.
+            frame (pd.DataFrame): The parsed list.
+            meta (dict): url, date, etag and last_modified of the download.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=f'{name}-', dir=self.directory)
+        try:
+            columns = []
+            for i, column in enumerate(frame.columns):
+                values = frame[column]
+                if values.dtype.kind in 'biufcmM':
+                    np.save(os.path.join(staging, f'{i}.npy'), values.to_numpy())
+                    columns.append([column, values.dtype.str, {'rows': len(values)}])
+                else:
+                    layout = self._write_text(os.path.join(staging, f'{i}.npy'), values)
+                    columns.append([column, 'object' if values.dtype == object else 'str', layout])
+            previous = self.read_meta(name)
+            self._write_meta(name, {**meta, 'rows': len(frame), 'columns': columns,
+                                    'data': os.path.basename(staging)})
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        if previous is not None:
+            shutil.rmtree(os.path.join(self.directory, previous['data']), ignore_errors=True)
+
+    def clear(self, name=None):
+        """
+        Delete one cached list, or all of them.
+
+        Args:
+            name (str, optional): Cache entry name.
+        """
+        if name is None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            return
+        if os.path.exists(self._meta_path(name)):
+            os.remove(self._meta_path(name))
+        for path in glob.glob(os.path.join(glob.escape(self.directory), f'{glob.escape(name)}-*')):
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _revalidated(self, name, meta):
+        """Return the cached copy the server reported unchanged and date it today, or None if it cannot be read."""
+        cached = self.read(name)
+        latest = self.read_meta(name)
+        # Not dated if a newer copy was written meanwhile.
+        if cached is not None and latest is not None and latest.get('data') == meta.get('data'):
+            self._write_meta(name, {**meta, 'date': self.today()})
+        return cached
+
+    @staticmethod
+    def _conditional_headers(meta):
+        if meta is None:
+            return {}
+        headers = {'If-None-Match': meta.get('etag'), 'If-Modified-Since': meta.get('last_modified')}
+        return {header: value for header, value in headers.items() if value}
+
+    def _read_columns(self, meta):
+        path = os.path.join(self.directory, meta['data'])
+        columns = {}
+        for i, (column, dtype, layout) in enumerate(meta['columns']):
+            if dtype in ('str', 'object'):
+                values = self._read_text(os.path.join(path, f'{i}.npy'), dtype, layout)
+            else:
+                values = np.asarray(np.load(os.path.join(path, f'{i}.npy'), mmap_mode='r'))
+                if values.dtype.str != dtype:
+                    raise ValueError(f'column {column!r} is {values.dtype.str} instead of {dtype}')
+            if len(values) != layout['rows']:
+                raise ValueError(f'column {column!r} has {len(values)} rows instead of {layout["rows"]}')
+            columns[column] = values
+        return pd.DataFrame(columns, copy=False)
+
+    def _meta_path(self, name):
+        return os.path.join(self.directory, f'{name}.json')
+
+    def _write_meta(self, name, meta):
+        # Written next to the pointer and moved over it, so readers see the old or the new copy.
+        fd, staging = tempfile.mkstemp(prefix=f'.{name}-', suffix='.json', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({**meta, 'version': ScripMasterCache.FORMAT_VERSION}, f)
+            os.replace(staging, self._meta_path(name))
+        except BaseException:
+            os.remove(staging)
+            raise
+
+    @staticmethod
+    def _write_text(path, values):
+        """Store a text column; return its layout: rows, encoding and number of distinct values."""
+        # Dictionary-encoded: codes index the distinct values, -1 marks a missing value.
+        codes, uniques = pd.factorize(values)
+        np.save(path, codes.astype(np.int32))
+        uniques = [value.item() if isinstance(value, np.generic) else value for value in uniques]
+        if all(isinstance(value, str) for value in uniques):
+            encoding, encoded = ScripMasterCache.TEXT, '\0'.join(uniques)
+        else:
+            encoding, encoded = ScripMasterCache.JSON, json.dumps(uniques, default=str)
+        np.save(path[:-len('.npy')] + '.values.npy', np.frombuffer(encoded.encode('utf-8'), dtype=np.uint8))
+        return {'rows': len(codes), 'encoding': encoding, 'values': len(uniques)}
+
+    @staticmethod
+    def _read_text(path, dtype, layout):
+        codes = np.load(path, mmap_mode='r')
+        encoded = np.load(path[:-len('.npy')] + '.values.npy', mmap_mode='r').tobytes().decode('utf-8')
+        if layout['encoding'] == ScripMasterCache.JSON:
+            uniques = json.loads(encoded)
+        else:
+            # The count tells one empty string apart from no values at all.
+            uniques = encoded.split('\0') if layout['values'] else []
+        if len(uniques) != layout['values']:
+            raise ValueError(f'{path} holds {len(uniques)} distinct values instead of {layout["values"]}')
+        # A trailing NaN serves the -1 codes of missing values.
+        values = np.empty(len(uniques) + 1, dtype=object)
+        values[:-1] = uniques
+        values[-1] = np.nan
+        return pd.Series(values[codes], dtype=None if dtype == 'object' else dtype, copy=False)
@@ -0,0 +1,375 @@
+"""
+    Memory-mapped instrument master shared by several processes.
+
+    SharedInstrumentMaster writes an InstrumentMaster once into a single read-only file of
+    fixed-width columns. Text is stored as int32 codes into one sorted string table, and
+    lookups run against sorted key arrays with binary search. Every process that attaches
+    maps the same file, so the operating system keeps a single copy in its page cache and
+    attaching costs no parsing and no copying.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import datetime
+import json
+import os
+import struct
+import tempfile
+from bisect import bisect_left
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: builds are not serialized, but still replace the file atomically.
+    fcntl = None
+
+import numpy as np
+import pandas as pd
+
+from dhanhq.instruments import InstrumentMaster
+from dhanhq.scrip_master_cache import ScripMasterCache
+
+
+class _StringTable:
+    """Sorted UTF-8 strings read straight from the mapped buffers."""
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, code):
+        return self.data[self.offsets[code]:self.offsets[code + 1]].tobytes()
+
+    def text(self, code):
+        return self[code].decode('utf-8')
+
+    def code(self, text):
+        """Return the code of a string, or None if it is not in the table."""
+        target = text.encode('utf-8')
+        code = bisect_left(self, target)
+        return code if code < len(self) and self[code] == target else None
+
+
+class SharedInstrumentMaster:
+    """Read-only instrument master backed by a memory-mapped file."""
+
+    MAGIC = b'DHANIM01'
+    FORMAT_VERSION = 2
+    ALIGNMENT = 64
+
+    DEFAULT_PATH = os.path.join(ScripMasterCache.DEFAULT_DIRECTORY, 'instruments.bin')
+
+    TEXT_COLUMNS = ('exchange_segment', 'security_id', 'trading_symbol', 'display_name', 'symbol_name',
+                    'underlying_symbol', 'isin', 'instrument', 'expiry_flag', 'option_type')
+
+    """Expiry is stored as days since 1970-01-01, strikes in option keys in 1/10000ths"""
+    NO_EXPIRY = np.iinfo(np.int32).min
+    STRIKE_SCALE = 10000
+    EXPIRY_BITS = 20
+
+    def __init__(self, path):
+        """
+        Attach to a master written by `build`.
+
+        Args:
+            path (str): Path of the file.
+
+        Raises:
+            ValueError: If the file is not an instrument master of this format version.
+        """
+        self.path = path
+        self._buffer = np.memmap(path, dtype=np.uint8, mode='r')
+        if self._buffer[:8].tobytes() != SharedInstrumentMaster.MAGIC:
+            raise ValueError(f'{path} is not a shared instrument master.')
+        header_size, = struct.unpack('<Q', self._buffer[8:16].tobytes())
+        self.header = json.loads(self._buffer[16:16 + header_size].tobytes())
+        if self.header.get('version') != SharedInstrumentMaster.FORMAT_VERSION:
+            raise ValueError(f'{path} was written by an incompatible version.')
+        self.arrays = {name: np.frombuffer(self._buffer, dtype=dtype, count=count, offset=offset)
+                       for name, (dtype, offset, count) in self.header['arrays'].items()}
+        self.strings = _StringTable(self.arrays['strings.offsets'], self.arrays['strings.data'])
+        self._length = self.header['rows']
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return f'SharedInstrumentMaster({self.path!r}, {self._length} instruments)'
+
+    @property
+    def date(self):
+        """The day (IST, 'YYYY-MM-DD') the master was built."""
+        return self.header.get('date')
+
+    @classmethod
+    def build(cls, master, path=DEFAULT_PATH, date=None):
+        """
+        Write an InstrumentMaster to a file that processes can attach to.
+
+        The file is written next to its destination and moved into place, so processes that
+        attach while it is rebuilt see either the old or the new master.
+
+        Args:
+            master (InstrumentMaster): The master to share.
+            path (str): Destination file.
+            date (str, optional): Day the master belongs to; today in IST by default.
+
+        Returns:
+            SharedInstrumentMaster: The master attached to the new file.
+        """
+        columns = master.columns
+        # Sorting by str matches sorting the UTF-8 bytes, which is the order lookups search in.
+        uniques = pd.Index(sorted(set().union(*(columns[name].tolist() for name in cls.TEXT_COLUMNS))),
+                           dtype=object)
+        encoded = [text.encode('utf-8') for text in uniques]
+        arrays = {
+            'strings.offsets': np.concatenate([[0], np.cumsum([len(text) for text in encoded])]).astype(np.int64),
+            'strings.data': np.frombuffer(b''.join(encoded), dtype=np.uint8),
+        }
+        for name in cls.TEXT_COLUMNS:
+            arrays[name] = uniques.get_indexer(columns[name]).astype(np.int32)
+
+        expiry = columns['expiry']
+        arrays['expiry'] = np.where(np.isnat(expiry), cls.NO_EXPIRY, expiry.astype(np.int64)).astype(np.int32)
+        arrays['strike'] = columns['strike'].astype(np.float64)
+        arrays['lot_size'] = columns['lot_size'].astype(np.int32)
+        arrays['tick_size'] = columns['tick_size'].astype(np.float64)
+
+        segment = arrays['exchange_segment'].astype(np.int64) << 32
+        cls._add_index(arrays, 'id', segment | arrays['security_id'])
+        cls._add_index(arrays, 'symbol', segment | arrays['trading_symbol'])
+        listed = np.flatnonzero(columns['isin'] != '')
+        cls._add_index(arrays, 'isin', arrays['isin'][listed].astype(np.int64), listed)
+
+        options = np.flatnonzero((columns['option_type'] != '') & ~np.isnat(expiry) & ~np.isnan(columns['strike']))
+        key1, key2 = cls._option_keys(arrays['underlying_symbol'][options], arrays['expiry'][options],
+                                      arrays['strike'][options], columns['option_type'][options] == 'PE')
+        order = np.lexsort((key2, key1))
+        arrays['index.option.key1'] = key1[order]
+        arrays['index.option.key2'] = key2[order]
+        arrays['index.option.rows'] = options[order].astype(np.int32)
+
+        cls._write(path, arrays, {'rows': len(master), 'date': date or ScripMasterCache().today()})
+        return cls(path)
+
+    @classmethod
+    def open(cls, path=DEFAULT_PATH, mode=InstrumentMaster.DETAILED, include_global=False, cache=None,
+             exchange_segments=None, instruments=None):
+        """
+        Attach to today's shared master, building it first if it is missing or from an earlier day.
+
+        Processes that open a missing or stale master at the same time wait for the first one
+        to build it, under a lock on the sibling <path>.lock file, and then attach to its file.
+
+        Args:
+            path (str): Path of the shared file.
+            mode (str): 'compact' or 'detailed' Indian scrip master, used when building.
+            include_global (bool): Include the Global Stocks (US) instruments when building.
+            cache (bool | str | ScripMasterCache): Load the scrip masters through the binary cache.
+            exchange_segments (list, optional): Only include these exchange segments when building.
+            instruments (list, optional): Only include these instruments when building.
+
+        Returns:
+            SharedInstrumentMaster: The attached master.
+        """
+        today = ScripMasterCache().today()
+        shared = cls._attach(path, today)
+        if shared is not None:
+            return shared
+        with cls._build_lock(path):
+            # Another process may have built it while this one waited for the lock.
+            shared = cls._attach(path, today)
+            if shared is not None:
+                return shared
+            master = InstrumentMaster.fetch(mode, include_global, cache, exchange_segments, instruments)
+            return cls.build(master, path, today)
+
+    def row(self, index):
+        """
+        Return one instrument as a dict, with the same keys as InstrumentMaster.row.
+
+        Args:
+            index (int): Row number.
+
+        Returns:
+            dict: The instrument; missing strike and expiry are None.
+        """
+        arrays = self.arrays
+        instrument = {name: self.strings.text(arrays[name][index]) for name in self.TEXT_COLUMNS}
+        expiry = int(arrays['expiry'][index])
+        strike = float(arrays['strike'][index])
+        instrument.update({
+            'expiry': None if expiry == self.NO_EXPIRY else datetime.date(1970, 1, 1) + datetime.timedelta(expiry),
+            'strike': None if np.isnan(strike) else strike,
+            'lot_size': int(arrays['lot_size'][index]),
+            'tick_size': float(arrays['tick_size'][index]),
+        })
+        return {name: instrument[name] for name in InstrumentMaster.COLUMNS}
+
+    def get(self, security_id, exchange_segment):
+        """
+        Look up an instrument by security ID.
+
+        Args:
+            security_id (str | int): The security ID.
+            exchange_segment (str): The exchange segment, e.g. 'NSE_EQ'.
+
+        Returns:
+            dict: The instrument, or None if it is not listed.
+        """
+        row = self._find_row('id', exchange_segment, str(security_id))
+        return None if row is None else self.row(row)
+
+    def by_symbol(self, trading_symbol, exchange_segment):
+        """
+        Look up an instrument by trading symbol.
+
+        Args:
+            trading_symbol (str): The trading symbol.
+            exchange_segment (str): The exchange segment.
+
+        Returns:
+            dict: The instrument, or None if it is not listed.
+        """
+        row = self._find_row('symbol', exchange_segment, trading_symbol)
+        return None if row is None else self.row(row)
+
+    def by_isin(self, isin):
+        """
+        Look up the instruments of an ISIN, one per exchange it is listed on.
+
+        Args:
+            isin (str): The ISIN.
+
+        Returns:
+            list: The instruments; empty if none is listed.
+        """
+        code = self.strings.code(isin) if isin else None
+        if code is None:
+            return []
+        keys = self.arrays['index.isin.keys']
+        start, stop = np.searchsorted(keys, code, 'left'), np.searchsorted(keys, code, 'right')
+        return [self.row(row) for row in self.arrays['index.isin.rows'][start:stop].tolist()]
+
+    def option(self, underlying_symbol, expiry, strike, option_type):
+        """
+        Look up an option contract.
+
+        Args:
+            underlying_symbol (str): The underlying, e.g. 'NIFTY'.
+            expiry (str | date | datetime): The expiry date; strings as 'YYYY-MM-DD'.
+            strike (float): The strike price.
+            option_type (str): 'CE' or 'PE'.
+
+        Returns:
+            dict: The contract, or None if it is not listed.
+        """
+        code = self.strings.code(underlying_symbol)
+        if code is None or option_type not in InstrumentMaster.OPTION_TYPES:
+            return None
+        days = (InstrumentMaster._expiry_key(expiry) - datetime.date(1970, 1, 1)).days
+        key1, key2 = self._option_keys(np.array([code]), np.array([days]), np.array([float(strike)]),
+                                       np.array([option_type == 'PE']))
+        key1s = self.arrays['index.option.key1']
+        start, stop = np.searchsorted(key1s, key1[0], 'left'), np.searchsorted(key1s, key1[0], 'right')
+        key2s = self.arrays['index.option.key2'][start:stop]
+        i = np.searchsorted(key2s, key2[0])
+        if i == len(key2s) or key2s[i] != key2[0]:
+            return None
+        return self.row(int(self.arrays['index.option.rows'][start + i]))
+
+    def security_ids(self, trading_symbols, exchange_segment):
+        """
+        Resolve many trading symbols of one segment to security IDs.
+
+        Args:
+            trading_symbols (list): The trading symbols.
+            exchange_segment (str): The exchange segment.
+
+        Returns:
+            list: Security IDs in the same order; None for symbols that are not listed.
+        """
+        security_ids = self.arrays['security_id']
+        rows = (self._find_row('symbol', exchange_segment, symbol) for symbol in trading_symbols)
+        return [None if row is None else self.strings.text(security_ids[row]) for row in rows]
+
+    def _find_row(self, index, exchange_segment, text):
+        segment, code = self.strings.code(exchange_segment), self.strings.code(text)
+        if segment is None or code is None:
+            return None
+        key = segment << 32 | code
+        keys = self.arrays[f'index.{index}.keys']
+        i = np.searchsorted(keys, key)
+        if i == len(keys) or keys[i] != key:
+            return None
+        return int(self.arrays[f'index.{index}.rows'][i])
+
+    @classmethod
+    def _attach(cls, path, date):
+        """Return the master of the file if it is usable and of the given day, else None."""
+        try:
+            shared = cls(path)
+        except (OSError, ValueError):
+            return None
+        return shared if shared.date == date else None
+
+    @staticmethod
+    @contextmanager
+    def _build_lock(path):
+        """Hold an exclusive lock on <path>.lock, shared by every process building the same file."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path + '.lock', 'a') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    @classmethod
+    def _option_keys(cls, underlying, expiry, strike, put):
+        key1 = underlying.astype(np.int64) << cls.EXPIRY_BITS | expiry.astype(np.int64)
+        key2 = np.rint(strike * cls.STRIKE_SCALE).astype(np.int64) << 1 | put.astype(np.int64)
+        return key1, key2
+
+    @staticmethod
+    def _add_index(arrays, name, keys, rows=None):
+        order = np.argsort(keys, kind='stable')
+        arrays[f'index.{name}.keys'] = keys[order]
+        arrays[f'index.{name}.rows'] = (order if rows is None else rows[order]).astype(np.int32)
+
+    @classmethod
+    def _write(cls, path, arrays, meta):
+        offsets = {}
+        size = 0
+        for name, array in arrays.items():
+            offsets[name] = size
+            size += -(-array.nbytes // cls.ALIGNMENT) * cls.ALIGNMENT
+        # Arrays follow the header; grow the space reserved for it until the header fits.
+        start = cls.ALIGNMENT
+        while True:
+            layout = {name: [array.dtype.str, start + offsets[name], len(array)] for name, array in arrays.items()}
+            header = json.dumps({'version': cls.FORMAT_VERSION, **meta, 'arrays': layout}).encode()
+            if 16 + len(header) <= start:
+                break
+            start = -(-(16 + len(header)) // cls.ALIGNMENT) * cls.ALIGNMENT
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        handle, staging = tempfile.mkstemp(prefix='.instruments-', dir=directory)
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                f.write(cls.MAGIC + struct.pack('<Q', len(header)) + header)
+                for name, array in arrays.items():
+                    f.seek(layout[name][1])
+                    f.write(np.ascontiguousarray(array).tobytes())
+                f.truncate(start + size)
+            os.replace(staging, path)
+        except BaseException:
+            os.unlink(staging)
+            raise
@@ -0,0 +1,230 @@
+"""
+    Type-ahead symbol search over the instrument master.
+
+    SymbolSearch keeps the trading symbols, custom symbols and symbol names of every instrument
+    in one sorted array, so the instruments whose symbol starts with a query are found with a
+    binary search instead of a str.contains scan. Names of equities, indices and Global Stocks
+    are also indexed by word, and can be matched fuzzily through a trigram index. Searches in
+    some exchange segments use a partition of the index per segment.
+
+    :copyright: (c) 2026 by Dhan.
+    :license: see LICENSE for details.
+"""
+
+import bisect
+import heapq
+
+import numpy as np
+import pandas as pd
+
+
+class SymbolSearch:
+    """Prefix and fuzzy search over trading symbols, custom symbols and symbol names."""
+
+    """Searched columns, best match first"""
+    FIELDS = ('trading_symbol', 'display_name', 'symbol_name')
+
+    DEFAULT_LIMIT = 10
+    MIN_SIMILARITY = 0.4
+
+    def __init__(self, master, keys, offsets, rows, word_keys, word_offsets, word_rows, fuzzy_codes):
+        """
+        Args:
+            master: The instrument master the row numbers refer to.
+            keys (np.ndarray): Sorted, upper-cased symbols.
+            offsets (np.ndarray): keys[i] covers rows[offsets[i]:offsets[i + 1]].
+            rows (np.ndarray): Row numbers, grouped by key, best field first.
+            word_keys, word_offsets, word_rows: The same for the words of names.
+            fuzzy_codes (np.ndarray): Positions in keys that fuzzy matching considers.
+
+        Use `from_master` to build one.
+        """
+        self.master = master
+        self.keys = keys
+        self.offsets = offsets
+        self.rows = rows
+        self.word_keys = word_keys
+        self.word_offsets = word_offsets
+        self.word_rows = word_rows
+        self.fuzzy_codes = fuzzy_codes
+        self._segments = {}
+        self._trigrams = None
+
+    def __repr__(self):
+        return f'SymbolSearch({len(self.keys)} symbols, {len(self.word_keys)} words)'
+
+    @classmethod
+    def from_master(cls, master):
+        """
+        Build the search index of an instrument master.
+
+        Args:
+            master (InstrumentMaster): The instrument master.
+
+        Returns:
+            SymbolSearch: The index.
+        """
+        columns = master.columns
+        count = len(columns['trading_symbol'])
+        derivative = ~np.isnat(columns['expiry'])
+
+        keys, fields, rows = [], [], []
+        for field, name in enumerate(cls.FIELDS):
+            keys.append(columns[name])
+            fields.append(np.full(count, field, dtype=np.int8))
+            rows.append(np.arange(count))
+        keys, fields, rows = np.concatenate(keys), np.concatenate(fields), np.concatenate(rows)
+        keys, offsets, rows, codes = cls._group(pd.Series(keys).str.upper().to_numpy(dtype=object), fields, rows)
+        fuzzy_codes = np.unique(codes[~derivative[rows]])
+
+        # Names of non-derivatives from their second word on, e.g. 'INDUSTRIES LTD' and 'LTD' of
+        # 'RELIANCE INDUSTRIES LTD'. Derivative names would only add expiry and strike words.
+        words, word_fields, word_rows = [], [], []
+        for field, name in enumerate(cls.FIELDS[1:], 1):
+            for row in np.flatnonzero(~derivative).tolist():
+                parts = columns[name][row].upper().split()
+                for start in range(1, len(parts)):
+                    words.append(' '.join(parts[start:]))
+                    word_fields.append(field)
+                    word_rows.append(row)
+        word_keys, word_offsets, word_rows, _ = cls._group(
+            np.array(words, dtype=object), np.array(word_fields, dtype=np.int8), np.array(word_rows, dtype=np.int64))
+        return cls(master, keys, offsets, rows, word_keys, word_offsets, word_rows, fuzzy_codes)
+
+    @staticmethod
+    def _group(keys, fields, rows):
+        present = keys != ''
+        keys, fields, rows = keys[present], fields[present], rows[present]
+        codes, uniques = pd.factorize(keys, sort=True)
+        order = np.lexsort((rows, fields, codes))
+        offsets = np.r_[0, np.cumsum(np.bincount(codes, minlength=len(uniques)))]
+        return np.asarray(uniques, dtype=object), offsets, rows[order], codes[order]
+
+    def search(self, query, limit=DEFAULT_LIMIT, exchange_segments=None, fuzzy=False):
+        """
+        Return the instruments whose symbol or name starts with the query.
+
+        Symbols that start with the query come first, in alphabetical order, so an exact match
+        ranks above longer symbols; then names with a word that starts with the query; then,
+        with `fuzzy`, the closest names of equities, indices and Global Stocks.
+
+        Args:
+            query (str): What the user typed, case-insensitive.
+            limit (int): Maximum number of instruments.
+            exchange_segments (list, optional): Only return these segments, e.g. ['NSE_EQ']. The first
+                search in a segment indexes it.
+            fuzzy (bool): Fill up the results with fuzzy matches when there are too few prefix matches.
+
+        Returns:
+            list: Instrument dicts, best match first.
+        """
+        query = ' '.join(str(query).upper().split())
+        if not query or limit <= 0:
+            return []
+        segments = None if exchange_segments is None else sorted(set(exchange_segments))
+        found = {}
+        self._collect(found, self._matches(False, query, segments), limit, None)
+        if len(found) < limit:
+            self._collect(found, self._matches(True, query, segments), limit, None)
+        if fuzzy and len(found) < limit:
+            self._collect(found, self._fuzzy_rows(query), limit, segments)
+        return [self.master.row(row) for row in found]
+
+    def fuzzy(self, query, limit=DEFAULT_LIMIT, exchange_segments=None):
+        """
+        Return the equities, indices and Global Stocks whose symbol or name is closest to the query.
+
+        Similarity is the share of three-letter sequences the query and the symbol have in common,
+        so typos and missing letters still match, e.g. 'RELAINCE' finds RELIANCE.
+
+        Args:
+            query (str): What the user typed, case-insensitive.
+            limit (int): Maximum number of instruments.
+            exchange_segments (list, optional): Only return these segments, e.g. ['NSE_EQ'].
+
+        Returns:
+            list: Instrument dicts, most similar first.
+        """
+        query = ' '.join(str(query).upper().split())
+        if not query or limit <= 0:
+            return []
+        found = {}
+        self._collect(found, self._fuzzy_rows(query), limit,
+                      None if exchange_segments is None else set(exchange_segments))
+        return [self.master.row(row) for row in found]
+
+    @staticmethod
+    def _prefix(keys, offsets, rows, query):
+        start = bisect.bisect_left(keys, query)
+        stop = bisect.bisect_left(keys, query + '\uffff', start)
+        return rows[offsets[start]:offsets[stop]]
+
+    def _matches(self, words, query, segments):
+        rows = self.word_rows if words else self.rows
+        if segments is None:
+            keys, offsets = (self.word_keys, self.word_offsets) if words else (self.keys, self.offsets)
+            return self._prefix(keys, offsets, rows, query)
+        # Positions in rows keep the order of the whole index, so merging them ranks like an unfiltered search.
+        positions = heapq.merge(*(self._prefix(*self._segment_index(segment)[words], query) for segment in segments))
+        return (rows[position] for position in positions)
+
+    def _segment_index(self, segment):
+        # Built on first use of a segment; (keys, offsets, positions) of the symbols, then of the words.
+        index = self._segments.get(segment)
+        if index is None:
+            exchange_segment = self.master.columns['exchange_segment']
+            index = self._segments[segment] = (
+                self._partition(self.keys, self.offsets, self.rows, exchange_segment, segment),
+                self._partition(self.word_keys, self.word_offsets, self.word_rows, exchange_segment, segment))
+        return index
+
+    @staticmethod
+    def _partition(keys, offsets, rows, exchange_segment, segment):
+        positions = np.flatnonzero(exchange_segment[rows] == segment)
+        counts = np.diff(np.searchsorted(positions, offsets))
+        present = counts > 0
+        return keys[present], np.r_[0, np.cumsum(counts[present])], positions
+
+    def _collect(self, found, rows, limit, segments):
+        exchange_segment = self.master.columns['exchange_segment']
+        for row in rows:
+            row = int(row)
+            if row in found or (segments is not None and exchange_segment[row] not in segments):
+                continue
+            found[row] = None
+            if len(found) == limit:
+                return
+
+    def _fuzzy_rows(self, query):
+        postings, sizes = self._trigram_index()
+        grams = self._grams(query)
+        matches = [postings[gram] for gram in grams if gram in postings]
+        if not matches:
+            return
+        candidates, shared = np.unique(np.concatenate(matches), return_counts=True)
+        # Dice coefficient of the trigram sets.
+        similarity = 2 * shared / (len(grams) + sizes[candidates])
+        keep = similarity >= self.MIN_SIMILARITY
+        candidates, similarity = candidates[keep], similarity[keep]
+        for position in np.lexsort((candidates, -similarity)):
+            code = self.fuzzy_codes[candidates[position]]
+            yield from self.rows[self.offsets[code]:self.offsets[code + 1]]
+
+    def _trigram_index(self):
+        # Built on first use; prefix search does not need it.
+        if self._trigrams is None:
+            postings = {}
+            sizes = np.empty(len(self.fuzzy_codes), dtype=np.int32)
+            for position, key in enumerate(self.keys[self.fuzzy_codes].tolist()):
+                grams = self._grams(key)
+                sizes[position] = len(grams)
+                for gram in grams:
+                    postings.setdefault(gram, []).append(position)
+            self._trigrams = ({gram: np.array(positions, dtype=np.int32) for gram, positions in postings.items()},
+                              sizes)
+        return self._trigrams
+
+    @staticmethod
+    def _grams(key):
+        padded = f'  {key} '
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
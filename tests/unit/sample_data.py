@@ -0,0 +1,53 @@
+"""Sample instrument masters and a fake candle server shared by the unit tests"""
+
+import datetime
+
+from dhanhq.candle_store import CandleStore
+
+COMPACT_CSV = """SEM_EXM_EXCH_ID,SEM_SEGMENT,SEM_SMST_SECURITY_ID,SEM_INSTRUMENT_NAME,SEM_EXPIRY_CODE,\
+SEM_TRADING_SYMBOL,SEM_LOT_UNITS,SEM_CUSTOM_SYMBOL,SEM_EXPIRY_DATE,SEM_STRIKE_PRICE,SEM_OPTION_TYPE,SEM_TICK_SIZE,SEM_EXPIRY_FLAG,\
+SEM_EXCH_INSTRUMENT_TYPE,SEM_SERIES,SM_SYMBOL_NAME
+NSE,E,2885,EQUITY,0,RELIANCE,1.0,Reliance Industries,,-0.01,XX,5.0,NA,ES,EQ,RELIANCE INDUSTRIES LTD
+BSE,E,500325,EQUITY,0,RELIANCE,1.0,Reliance Industries,,-0.01,XX,5.0,NA,ES,A,RELIANCE INDUSTRIES LTD
+NSE,I,13,INDEX,0,NIFTY,1.0,Nifty 50,,-0.01,XX,5.0,NA,INDEX,X,NIFTY
+NSE,D,35001,OPTIDX,0,NIFTY-Oct2026-25000-CE,75.0,NIFTY 27 OCT 25000 CALL,2026-10-27 14:30:00,25000.0,CE,5.0,W,OP,NA,
+NSE,D,35002,OPTIDX,0,NIFTY-Oct2026-25000-PE,75.0,NIFTY 27 OCT 25000 PUT,2026-10-27 14:30:00,25000.0,PE,5.0,W,OP,NA,
+NSE,D,35100,FUTIDX,0,NIFTY-Oct2026-FUT,75.0,NIFTY OCT FUT,2026-10-27 14:30:00,-0.01,XX,10.0,M,FUT,NA,
+MCX,M,4321,FUTCOM,0,CRUDEOIL-Nov2026-FUT,100.0,CRUDEOIL NOV FUT,2026-11-19 23:30:00,-0.01,XX,100.0,M,FUT,NA,
+"""
+
+DETAILED_CSV = """EXCH_ID,SEGMENT,SECURITY_ID,ISIN,INSTRUMENT,UNDERLYING_SECURITY_ID,UNDERLYING_SYMBOL,SYMBOL_NAME,\
+DISPLAY_NAME,INSTRUMENT_TYPE,SERIES,LOT_SIZE,SM_EXPIRY_DATE,STRIKE_PRICE,OPTION_TYPE,TICK_SIZE,EXPIRY_FLAG
+NSE,E,2885,INE002A01018,EQUITY,,RELIANCE,RELIANCE INDUSTRIES LTD,Reliance Industries,ES,EQ,1,,-0.01,XX,0.05,NA
+BSE,E,500325,INE002A01018,EQUITY,,RELIANCE,RELIANCE INDUSTRIES LTD,Reliance Industries,ES,A,1,,-0.01,XX,0.05,NA
+NSE,D,35001,NA,OPTIDX,13,NIFTY,NIFTY-Oct2026-25000-CE,NIFTY 27 OCT 25000 CALL,OP,NA,75,2026-10-27,25000,CE,0.05,W
+"""
+
+GLOBAL_CSV = """EXCHANGE,SEGMENT,SCRIP_CODE,ISIN_CODE,SYMBOL,SYMBOL_NAME,EXCH_SYMBOL,CUSTOM_SYMBOL,TRADING_SYMBOL,\
+FRACTION,CUSTOM_EXCH,INSTRUMENT_NAME,TICK_SIZE,LOT_SIZE,UPPER_LIMIT,LOWER_LIMIT,UPDATE_DATE
+NASDAQ,E,AAPL,US0378331005,AAPL,Apple Inc,AAPL,Apple,AAPL,1,NASDAQ,EQUITY,0.01,1,0,0,2026-10-16
+"""
+
+
+def daily_epoch(day):
+    return int(datetime.datetime.fromisoformat(day).replace(tzinfo=CandleStore.IST).timestamp())
+
+
+def daily_candles(days, close=None):
+    return {'timestamp': [daily_epoch(day) for day in days], 'open': [1.0] * len(days),
+            'close': close or [float(i) for i in range(len(days))]}
+
+
+class Server:
+    """Daily candles for every day from fromDate up to, not including, toDate."""
+
+    def __init__(self):
+        self.payloads = []
+
+    def __call__(self, method, endpoint, payload=None):
+        self.payloads.append(payload)
+        start = datetime.date.fromisoformat(payload['fromDate'][:10])
+        days = (datetime.date.fromisoformat(payload['toDate'][:10]) - start).days
+        dates = [(start + datetime.timedelta(days=day)).isoformat() for day in range(days)]
+        closes = [float(daily_epoch(date)) for date in dates]
+        return {'status': 'success', 'remarks': '', 'data': daily_candles(dates, closes)}
@@ -0,0 +1,183 @@
+import asyncio
+import gzip
+import json
+from unittest.mock import AsyncMock, patch
+
+from dhanhq.async_dhan_http import AsyncDhanHTTP
+from dhanhq.dhan_http import DhanHTTP
+from dhanhq.retry import RetryPolicy
+
+
+async def _start_server(responder):
+    """Start a local HTTP/1.1 server; returns (server, base_url, state) where state records traffic."""
+    state = {'connections': 0, 'requests': []}
+
+    async def handle(reader, writer):
+        state['connections'] += 1
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                lines = head.decode('latin-1').split('\r\n')
+                method, target, _ = lines[0].split(' ')
+                headers = {}
+                for line in lines[1:]:
+                    if line:
+                        name, _, value = line.partition(':')
+                        headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                state['requests'].append((method, target, headers, body))
+                response = responder(method, target, body)
+                if response is None:
+                    # Drop the connection without answering, as if it broke after the request arrived.
+                    writer.close()
+                    return
+                writer.write(response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f'http://127.0.0.1:{port}/v2', state
+
+
+def _json_response(status, data, extra_headers=''):
+    body = json.dumps(data).encode()
+    return (f'HTTP/1.1 {status} OK\r\nContent-Type: application/json\r\n{extra_headers}'
+            f'Content-Length: {len(body)}\r\n\r\n').encode() + body
+
+
+def _make_client(base_url):
+    client = AsyncDhanHTTP("test_client_id", "test_access_token")
+    client.base_url = base_url
+    return client
+
+
+class TestAsyncDhanHTTP:
+    def test_get_success_reuses_keep_alive_connection(self):
+        async def scenario():
+            server, base_url, state = await _start_server(lambda m, t, b: _json_response(200, {"ok": t}))
+            async with server, _make_client(base_url) as client:
+                first = await client.get('/orders')
+                second = await client.get('/positions')
+            return first, second, state
+
+        first, second, state = asyncio.run(scenario())
+        assert first['status'] == DhanHTTP.HttpResponseStatus.SUCCESS.value
+        assert first['data'] == {"ok": "/v2/orders"}
+        assert second['data'] == {"ok": "/v2/positions"}
+        assert state['connections'] == 1
+        assert state['requests'][0][2]['access-token'] == "test_access_token"
+
+    def test_post_adds_client_id_to_payload(self):
+        async def scenario():
+            server, base_url, state = await _start_server(lambda m, t, b: _json_response(200, json.loads(b)))
+            async with server, _make_client(base_url) as client:
+                response = await client.post('/orders', {"key": "value"})
+            return response, state
+
+        response, state = asyncio.run(scenario())
+        assert state['requests'][0][0] == 'POST'
+        assert response['data'] == {"key": "value", "dhanClientId": "test_client_id"}
+
+    def test_error_response_is_parsed(self):
+        async def scenario():
+            server, base_url, _ = await _start_server(
+                lambda m, t, b: _json_response(400, {"errorCode": "DH-905", "errorType": "Input_Exception",
+                                                     "errorMessage": "bad"}))
+            async with server, _make_client(base_url) as client:
+                return await client.delete('/orders/1')
+
+        response = asyncio.run(scenario())
+        assert response['status'] == DhanHTTP.HttpResponseStatus.FAILURE.value
+        assert response['remarks']['error_code'] == "DH-905"
+
+    def test_chunked_and_gzip_responses(self):
+        payload = gzip.compress(json.dumps({"data": [1, 2, 3]}).encode())
+
+        def responder(method, target, body):
+            return (b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\nContent-Encoding: gzip\r\n\r\n'
+                    + f'{len(payload):x}\r\n'.encode() + payload + b'\r\n0\r\n\r\n')
+
+        async def scenario():
+            server, base_url, _ = await _start_server(responder)
+            async with server, _make_client(base_url) as client:
+                return await client.get('/holdings')
+
+        response = asyncio.run(scenario())
+        assert response['data'] == {"data": [1, 2, 3]}
+
+    def test_concurrent_requests_are_bounded_by_pool_size(self):
+        async def scenario():
+            server, base_url, state = await _start_server(lambda m, t, b: _json_response(200, {}))
+            client = AsyncDhanHTTP("test_client_id", "test_access_token", pool_size=3)
+            client.base_url = base_url
+            async with server, client:
+                responses = await asyncio.gather(*(client.get(f'/orders/{i}') for i in range(20)))
+            return responses, state
+
+        responses, state = asyncio.run(scenario())
+        assert all(r['status'] == 'success' for r in responses)
+        assert state['connections'] <= 3
+        assert len(state['requests']) == 20
+
+    def test_connection_failure_returns_failure_dict(self):
+        async def scenario():
+            server, base_url, _ = await _start_server(lambda m, t, b: b'')
+            server.close()
+            await server.wait_closed()
+            async with _make_client(base_url) as client:
+                return await client.get('/orders')
+
+        response = asyncio.run(scenario())
+        assert response['status'] == DhanHTTP.HttpResponseStatus.FAILURE.value
+        assert response['data'] == ''
+
+    def test_tagged_placement_retry_checks_correlation_id(self):
+        client = AsyncDhanHTTP("test_client_id", "test_access_token", rate_limiter=False,
+                               retry_policy=RetryPolicy(backoff_base=0))
+        failure = {'status': 'failure', 'remarks': 'timed out', 'data': ''}
+        existing = {'status': 'success', 'remarks': '', 'data': {'orderId': '1'}}
+        with patch.object(AsyncDhanHTTP, '_send_once', new_callable=AsyncMock) as mock_send_once:
+            mock_send_once.side_effect = [(failure, True), (existing, False)]
+            response = asyncio.run(client.post('/orders', {"correlationId": "tag-1"}))
+        assert response == existing
+        assert mock_send_once.await_args_list[1][0][:2] == (DhanHTTP.HttpMethods.GET, '/orders/external/tag-1')
+
+    def test_tagged_placement_is_not_resent_when_lookup_is_rate_limited(self):
+        client = AsyncDhanHTTP("test_client_id", "test_access_token", rate_limiter=False,
+                               retry_policy=RetryPolicy(backoff_base=0))
+        failure = {'status': 'failure', 'remarks': 'timed out', 'data': ''}
+        rate_limited = {'status': 'failure', 'remarks': {'error_code': 'DH-904'}, 'data': ''}
+        with patch.object(AsyncDhanHTTP, '_send_once', new_callable=AsyncMock) as mock_send_once:
+            mock_send_once.side_effect = [(failure, True), (rate_limited, False)]
+            response = asyncio.run(client.post('/orders', {"correlationId": "tag-1"}))
+        assert response == failure
+        assert mock_send_once.await_count == 2
+
+    def _drop_second_request(self, method):
+        def responder(m, t, b):
+            return None if len(state['requests']) == 2 else _json_response(200, {"ok": t})
+
+        async def scenario():
+            nonlocal state
+            server, base_url, state = await _start_server(responder)
+            async with server, _make_client(base_url) as client:
+                await client.get('/orders')
+                if method == 'GET':
+                    return await client.get('/positions'), state
+                return await client.post('/orders', {"securityId": "1333"}), state
+
+        state = None
+        return asyncio.run(scenario())
+
+    def test_dropped_keep_alive_connection_resends_get(self):
+        response, state = self._drop_second_request('GET')
+        assert response['status'] == DhanHTTP.HttpResponseStatus.SUCCESS.value
+        assert [request[1] for request in state['requests']] == ['/v2/orders', '/v2/positions', '/v2/positions']
+        assert state['connections'] == 2
+
+    def test_dropped_keep_alive_connection_does_not_resend_order(self):
+        response, state = self._drop_second_request('POST')
+        assert response['status'] == DhanHTTP.HttpResponseStatus.FAILURE.value
+        assert [request[0] for request in state['requests']] == ['GET', 'POST']
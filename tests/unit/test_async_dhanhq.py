@@ -0,0 +1,68 @@
+import asyncio
+import inspect
+from unittest.mock import AsyncMock, patch
+
+from dhanhq import AsyncDhanHQ, DhanContext, dhanhq
+from dhanhq.dhan_http import DhanHTTP
+
+
+def _async_dhan():
+    return AsyncDhanHQ(DhanContext("test_client_id", "test_access_token"))
+
+
+class TestAsyncDhanHQ:
+    def test_exposes_every_public_dhanhq_method_as_coroutine(self):
+        for name, value in inspect.getmembers(dhanhq):
+            if name.startswith('_') or not callable(value) or name in AsyncDhanHQ.SYNC_METHODS:
+                continue
+            if name in AsyncDhanHQ.EXCLUDED_METHODS:
+                assert not hasattr(AsyncDhanHQ, name), name
+                continue
+            assert inspect.iscoroutinefunction(getattr(AsyncDhanHQ, name)), name
+
+    def test_constants_are_copied(self):
+        assert AsyncDhanHQ.NSE == dhanhq.NSE
+        assert AsyncDhanHQ.BUY == dhanhq.BUY
+
+    @patch("dhanhq.async_dhan_http.AsyncDhanHTTP._send_request", new_callable=AsyncMock)
+    def test_get_order_list(self, mock_send_request):
+        mock_send_request.return_value = {'status': 'success', 'remarks': '', 'data': []}
+        response = asyncio.run(_async_dhan().get_order_list())
+        mock_send_request.assert_awaited_once_with(DhanHTTP.HttpMethods.GET, '/orders')
+        assert response['status'] == 'success'
+
+    @patch("dhanhq.async_dhan_http.AsyncDhanHTTP._send_request", new_callable=AsyncMock)
+    def test_place_order_builds_same_payload(self, mock_send_request):
+        asyncio.run(_async_dhan().place_order("1333", "nse_eq", "buy", 1, "limit", "cnc", 100))
+        method, endpoint, payload = mock_send_request.await_args[0]
+        assert method == DhanHTTP.HttpMethods.POST
+        assert endpoint == '/orders'
+        assert payload['exchangeSegment'] == 'NSE_EQ'
+        assert payload['transactionType'] == 'BUY'
+
+    @patch("dhanhq.async_dhan_http.AsyncDhanHTTP._send_request", new_callable=AsyncMock)
+    def test_validation_failure_is_returned_without_request(self, mock_send_request):
+        response = asyncio.run(_async_dhan().historical_daily_data("1", "NSE_EQ", "EQUITY", "a", "b", 9))
+        assert response['status'] == 'failure'
+        mock_send_request.assert_not_awaited()
+
+    @patch("dhanhq.async_dhan_http.AsyncDhanHTTP._send_request", new_callable=AsyncMock)
+    def test_post_processing_method_runs_through_loop_bridge(self, mock_send_request):
+        mock_send_request.return_value = {'status': 'success', 'remarks': '', 'data': {}}
+        response = asyncio.run(_async_dhan().generate_tpin())
+        mock_send_request.assert_awaited_once_with(DhanHTTP.HttpMethods.GET, '/edis/tpin')
+        assert response['remarks'] == 'OTP sent'
+
+    def test_convert_to_date_time_is_plain_function(self):
+        assert _async_dhan().convert_to_date_time(0).year == 1970
+
+    def test_candle_conversions_are_plain_functions(self):
+        arrays = _async_dhan().candles_as_arrays({'timestamp': [0], 'close': [1]})
+        assert str(arrays['timestamp'][0]) == '1970-01-01T05:30:00'
+
+    @patch("dhanhq.async_dhan_http.AsyncDhanHTTP._send_request", new_callable=AsyncMock)
+    def test_candle_result_is_converted(self, mock_send_request):
+        mock_send_request.return_value = {'status': 'success', 'remarks': '', 'data': {'timestamp': [0]}}
+        response = asyncio.run(_async_dhan().historical_daily_data("1", "NSE_EQ", "EQUITY", "2026-01-01",
+                                                                   "2026-01-02", result='frame'))
+        assert len(response['data']) == 1
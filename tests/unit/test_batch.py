@@ -0,0 +1,91 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+from dhanhq import Batch
+from dhanhq.async_dhan_http import AsyncDhanHTTP
+from dhanhq.dhan_http import DhanHTTP
+
+
+def _slow_send_request(self, method, endpoint, payload=None):
+    time.sleep(0.05 if endpoint.endswith('/1') else 0.01)
+    data = {'method': method.value, 'endpoint': endpoint, 'payload': payload}
+    return {'status': 'success', 'remarks': '', 'data': data}
+
+
+class TestDhanHTTP_ExecuteMany:
+    @patch.object(DhanHTTP, '_send_request', _slow_send_request)
+    def test_results_keep_input_order_and_calls_overlap(self):
+        dhan_http = DhanHTTP("test_client_id", "test_access_token")
+        calls = [('GET', f'/orders/{i}') for i in range(10)]
+        started = time.perf_counter()
+        results = dhan_http.execute_many(calls)
+        elapsed = time.perf_counter() - started
+        assert [result['data']['endpoint'] for result in results] == [f'/orders/{i}' for i in range(10)]
+        assert elapsed < 0.14
+
+    @patch.object(DhanHTTP, '_send_request', _slow_send_request)
+    def test_descriptors_accept_method_enum_and_payload(self):
+        dhan_http = DhanHTTP("test_client_id", "test_access_token")
+        results = dhan_http.execute_many([(DhanHTTP.HttpMethods.POST, '/marketfeed/ltp', {"NSE_EQ": [1333]}),
+                                          ('delete', '/orders/7')])
+        assert results[0]['data'] == {'method': 'POST', 'endpoint': '/marketfeed/ltp',
+                                      'payload': {"NSE_EQ": [1333]}}
+        assert results[1]['data']['method'] == 'DELETE'
+
+    @patch.object(DhanHTTP, '_send_request', _slow_send_request)
+    def test_invalid_descriptor_fails_only_its_item(self):
+        dhan_http = DhanHTTP("test_client_id", "test_access_token")
+        results = dhan_http.execute_many([('GET', '/orders/1'), ('PATCH', '/orders/2'), ('GET',)])
+        assert [result['status'] for result in results] == ['success', 'failure', 'failure']
+
+    def test_empty_batch(self):
+        assert DhanHTTP("test_client_id", "test_access_token").execute_many([]) == []
+
+    def test_async_execute_many(self):
+        client = AsyncDhanHTTP("test_client_id", "test_access_token")
+
+        async def send_request(method, endpoint, payload=None):
+            await asyncio.sleep(0.01)
+            return {'status': 'success', 'remarks': '', 'data': endpoint}
+
+        with patch.object(client, '_send_request', new=AsyncMock(side_effect=send_request)):
+            results = asyncio.run(client.execute_many([('GET', f'/orders/{i}') for i in range(5)] + [('PUT',)],
+                                                      max_workers=2))
+        assert [result['data'] for result in results[:5]] == [f'/orders/{i}' for i in range(5)]
+        assert results[5]['status'] == 'failure'
+
+
+class TestDhanhq_Batch:
+    @patch("dhanhq.dhan_http.DhanHTTP.get")
+    def test_calls_run_on_exit_in_order(self, mock_get, dhanhq_obj):
+        mock_get.side_effect = lambda endpoint: {'status': 'success', 'remarks': '', 'data': endpoint}
+        with dhanhq_obj.batch(max_workers=4) as batch:
+            for order_id in ('11', '12', '13'):
+                batch.add(dhanhq_obj.get_order_by_id, order_id)
+            assert batch.results is None
+        assert [result['data'] for result in batch.results] == ['/orders/11', '/orders/12', '/orders/13']
+
+    def test_raising_call_becomes_failure_response(self):
+        def boom():
+            raise RuntimeError('boom')
+
+        batch = Batch()
+        batch.add(boom)
+        batch.add(lambda: 'ok')
+        results = batch.execute()
+        assert results[0]['status'] == 'failure'
+        assert results[0]['remarks'] == 'boom'
+        assert results[1] == 'ok'
+        assert len(batch) == 0
+
+    def test_calls_are_skipped_when_block_raises(self):
+        calls = []
+        try:
+            with Batch() as batch:
+                batch.add(calls.append, 1)
+                raise ValueError
+        except ValueError:
+            pass
+        assert calls == []
+        assert batch.results is None
@@ -0,0 +1,139 @@
+import datetime
+import io
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from dhanhq import BulkDownloader, CandleStore, InstrumentMaster, RetryPolicy
+from dhanhq.candle_windows import CandleWindows
+from dhanhq.dhan_http import DhanHTTP
+from sample_data import COMPACT_CSV, Server
+
+SECURITIES = [('1333', 'NSE_EQ', 'EQUITY'), ('2885', 'NSE_EQ', 'EQUITY'), ('13', 'IDX_I', 'INDEX')]
+FAILURE = {'status': 'failure', 'remarks': {'error_code': 'DH-904'}, 'data': ''}
+EXPIRED = {'status': 'failure', 'remarks': {'error_code': 'DH-901'}, 'data': ''}
+INVALID = {'status': 'failure', 'remarks': {'error_code': 'DH-905'}, 'data': ''}
+NETWORK = {'status': 'failure', 'remarks': 'Read timed out.', 'data': ''}
+
+
+class FlakyServer(Server):
+    """Fails the first requests of some securities, or all of them with `always`."""
+
+    def __init__(self, failures, always=(), response=FAILURE):
+        super().__init__()
+        self.failures = dict(failures)
+        self.always = set(always)
+        self.response = response
+        self.lock = threading.Lock()
+
+    def __call__(self, method, endpoint, payload=None):
+        with self.lock:
+            security_id = payload['securityId']
+            if security_id in self.always or self.failures.get(security_id, 0) > 0:
+                self.failures[security_id] = self.failures.get(security_id, 0) - 1
+                return self.response
+            return super().__call__(method, endpoint, payload)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CandleStore(str(tmp_path))
+
+
+def _no_wait():
+    return RetryPolicy(max_attempts=3, sleep=lambda seconds: None)
+
+
+class TestBulkDownloader:
+    def test_downloads_every_security_into_the_store(self, store, dhanhq_obj):
+        server = Server()
+        results = []
+        with patch.object(DhanHTTP, '_send_request', server):
+            stats = dhanhq_obj.bulk_download(SECURITIES, '2024-01-01', '2026-01-01', store=store,
+                                             progress=lambda result, stats: results.append(result))
+        assert stats['done'] == 3 and stats['failed'] == 0 and stats['skipped'] == 0
+        assert stats['requests'] == 9 and stats['candles'] == 3 * 731
+        assert stats['candles_per_second'] > 0
+        assert sorted(result['security_id'] for result in results) == ['13', '1333', '2885']
+        assert all(result['windows'] == 3 and result['candles'] == 731 for result in results)
+        timestamps = store.read('2885', 'NSE_EQ', 'EQUITY', 'D')['timestamp']
+        assert len(timestamps) == 731 and (timestamps[1:] > timestamps[:-1]).all()
+
+    def test_resumes_from_checkpoint(self, store, dhanhq_obj):
+        server = Server()
+        with patch.object(DhanHTTP, '_send_request', server):
+            dhanhq_obj.bulk_download(SECURITIES[:2], '2025-01-01', '2025-06-01', interval=5, store=store)
+            stats = dhanhq_obj.bulk_download(SECURITIES, '2025-01-01', '2025-06-01', interval=5, store=store)
+        assert stats['skipped'] == 2 and stats['done'] == 1
+        assert [payload['securityId'] for payload in server.payloads[4:]] == ['13', '13']
+        with open(BulkDownloader(dhanhq_obj, store).checkpoint_path(5)) as f:
+            lines = [json.loads(line) for line in f]
+        assert lines[0] == {'from_date': '2025-01-01', 'to_date': '2025-06-01', 'interval': 5, 'oi': False}
+        assert {line['key'] for line in lines[1:]} == {'NSE_EQ:1333', 'NSE_EQ:2885', 'IDX_I:13'}
+
+    def test_interrupted_security_fetches_only_missing_windows(self, store, dhanhq_obj):
+        # The store already covers the first window, e.g. from a run that crashed after it.
+        server = Server()
+        with patch.object(DhanHTTP, '_send_request', server):
+            dhanhq_obj.sync_candles('1333', 'NSE_EQ', 'EQUITY', '2024-01-01', '2024-12-31', store=store)
+            dhanhq_obj.bulk_download(SECURITIES[:1], '2024-01-01', '2026-01-01', store=store)
+        assert [(p['fromDate'], p['toDate']) for p in server.payloads[1:]] == [
+            ('2024-12-31', '2025-12-31'), ('2025-12-31', '2026-01-01')]
+        assert len(store.read('1333', 'NSE_EQ', 'EQUITY', 'D')['timestamp']) == 731
+
+    def test_failed_windows_are_retried(self, store, dhanhq_obj):
+        server = FlakyServer({'1333': 2}, always={'2885'})
+        with patch.object(DhanHTTP, '_send_request', server):
+            stats = BulkDownloader(dhanhq_obj, store, retry_policy=_no_wait()).run(
+                SECURITIES, '2025-01-01', '2025-03-01')
+            assert stats['done'] == 2 and stats['failed'] == 1 and stats['retries'] == 4
+            assert store.read_meta('2885', 'NSE_EQ', 'EQUITY', 'D') is None
+
+            server.always.clear()
+            stats = BulkDownloader(dhanhq_obj, store, retry_policy=_no_wait()).run(
+                SECURITIES, '2025-01-01', '2025-03-01')
+        assert stats['skipped'] == 2 and stats['done'] == 1 and stats['requests'] == 1
+
+    @pytest.mark.parametrize('response, requests', [(NETWORK, 3), (INVALID, 1)])
+    def test_only_transient_errors_are_retried(self, store, dhanhq_obj, response, requests):
+        server = FlakyServer({}, always={'1333'}, response=response)
+        with patch.object(DhanHTTP, '_send_request', server):
+            stats = BulkDownloader(dhanhq_obj, store, retry_policy=_no_wait()).run(
+                SECURITIES[:1], '2025-01-01', '2025-03-01')
+        assert stats['failed'] == 1 and stats['requests'] == requests and stats['retries'] == requests - 1
+
+    def test_range_reaching_today_is_not_checkpointed(self, store, dhanhq_obj):
+        today = CandleWindows.today().date()
+        from_date, to_date = today - datetime.timedelta(days=10), today + datetime.timedelta(days=1)
+        server = Server()
+        with patch.object(DhanHTTP, '_send_request', server):
+            stats = dhanhq_obj.bulk_download(SECURITIES[:2], from_date, to_date, store=store)
+            assert stats['done'] == 2
+            stats = dhanhq_obj.bulk_download(SECURITIES[:2], from_date, to_date, store=store)
+        assert stats['done'] == 2 and stats['skipped'] == 0
+        # The second run fetches only today again.
+        assert [(p['fromDate'], p['toDate']) for p in server.payloads[2:]] == [
+            (today.isoformat(), to_date.isoformat())] * 2
+        with open(BulkDownloader(dhanhq_obj, store).checkpoint_path('D')) as f:
+            assert len(f.readlines()) == 1
+
+    def test_expired_token_stops_the_run(self, store, dhanhq_obj):
+        server = FlakyServer({}, always={'1333', '2885', '13'}, response=EXPIRED)
+        with patch.object(DhanHTTP, '_send_request', server):
+            stats = BulkDownloader(dhanhq_obj, store, max_workers=1, retry_policy=_no_wait()).run(
+                SECURITIES, '2025-01-01', '2025-03-01')
+        assert stats['stopped'] == {'error_code': 'DH-901'}
+        assert stats['requests'] == 1 and stats['done'] == 0 and stats['failed'] == 0
+
+    def test_securities_of_instrument_master(self):
+        master = InstrumentMaster.from_csv(io.StringIO(COMPACT_CSV), InstrumentMaster.COMPACT)
+        securities = BulkDownloader.securities(master, exchange_segments=['NSE_EQ', 'IDX_I'])
+        assert ('2885', 'NSE_EQ', 'EQUITY') in securities
+        assert all(segment in ('NSE_EQ', 'IDX_I') for _, segment, _ in securities)
+        assert BulkDownloader.securities(master, instruments=['OPTIDX'])[0][2] == 'OPTIDX'
+
+    def test_invalid_interval(self, store, dhanhq_obj):
+        with pytest.raises(ValueError):
+            BulkDownloader(dhanhq_obj, store).run(SECURITIES, '2025-01-01', datetime.date(2025, 3, 1), interval=3)
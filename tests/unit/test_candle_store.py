@@ -0,0 +1,150 @@
+import datetime
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from dhanhq.candle_store import CandleStore
+from dhanhq.dhan_http import DhanHTTP
+from sample_data import Server, daily_candles as _candles, daily_epoch as _epoch
+
+KEY = ('1333', 'NSE_EQ', 'EQUITY', 'D')
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CandleStore(str(tmp_path))
+
+
+class TestCandleStore:
+    def test_append_and_read_memory_mapped(self, store):
+        store.append(*KEY, candles=_candles(['2026-01-01', '2026-01-02']), covered=[('2026-01-01', '2026-01-03')])
+        store.append(*KEY, candles=_candles(['2026-01-03']), covered=[('2026-01-03', '2026-01-04')])
+        candles = store.read(*KEY)
+        assert isinstance(candles['close'], np.memmap)
+        assert candles['timestamp'].tolist() == [_epoch('2026-01-01'), _epoch('2026-01-02'), _epoch('2026-01-03')]
+        assert candles['close'].tolist() == [0.0, 1.0, 0.0]
+        assert store.read(*KEY, from_date='2026-01-02', to_date='2026-01-03')['timestamp'].tolist() == [
+            _epoch('2026-01-02')]
+        assert store.read_meta(*KEY)['fields'] == ['timestamp', 'open', 'close']
+
+    def test_backfill_is_merged_and_new_candles_win(self, store):
+        store.append(*KEY, candles=_candles(['2026-01-05', '2026-01-06'], [5.0, 6.0]))
+        store.append(*KEY, candles=_candles(['2026-01-06', '2026-01-01'], [60.0, 1.0]))
+        candles = store.read(*KEY)
+        assert candles['timestamp'].tolist() == [_epoch('2026-01-01'), _epoch('2026-01-05'), _epoch('2026-01-06')]
+        assert candles['close'].tolist() == [1.0, 5.0, 60.0]
+
+    def test_refetched_tail_is_swapped_in_without_changing_earlier_reads(self, store):
+        store.append(*KEY, candles=_candles(['2026-01-01', '2026-01-02', '2026-01-03']),
+                     covered=[('2026-01-01', '2026-01-04')])
+        before = store.read(*KEY)
+        store.append(*KEY, candles=_candles(['2026-01-03', '2026-01-02', '2026-01-04', '2026-01-04'],
+                                            [30.0, 20.0, 0.0, 40.0]), covered=[('2026-01-02', '2026-01-05')])
+        assert before['close'].tolist() == [0.0, 1.0, 2.0]
+        candles = store.read(*KEY)
+        assert candles['timestamp'].tolist() == [_epoch(day) for day in
+                                                 ('2026-01-01', '2026-01-02', '2026-01-03', '2026-01-04')]
+        assert candles['close'].tolist() == [0.0, 20.0, 30.0, 40.0]
+        assert os.path.getsize(os.path.join(store.path(*KEY), 'close.bin')) == 4 * 8
+        assert store.coverage(*KEY) == [(datetime.datetime(2026, 1, 1), datetime.datetime(2026, 1, 5))]
+
+    def test_interrupted_tail_replacement_keeps_the_stored_series(self, store):
+        store.append(*KEY, candles=_candles(['2026-01-01', '2026-01-02']), covered=[('2026-01-01', '2026-01-03')])
+
+        def interrupted(path, meta):
+            # Interrupted after writing the new candles, before recording them.
+            raise OSError('disk full')
+        with patch.object(CandleStore, '_write_meta', staticmethod(interrupted)), pytest.raises(OSError):
+            store.append(*KEY, candles=_candles(['2026-01-02'], [20.0]), covered=[('2026-01-02', '2026-01-03')])
+        assert store.read(*KEY)['close'].tolist() == [0.0, 1.0]
+        assert store.coverage(*KEY) == [(datetime.datetime(2026, 1, 1), datetime.datetime(2026, 1, 3))]
+        assert os.listdir(os.path.dirname(store.path(*KEY))) == ['D']
+
+    def test_counts_are_stored_as_integers(self, store, dhanhq_obj):
+        store.append(*KEY, candles={**_candles(['2026-01-01', '2026-01-02']), 'volume': [100, None]})
+        store.append(*KEY, candles=_candles(['2026-01-03']))
+        candles = store.read(*KEY)
+        assert candles['volume'].dtype == np.int64 and candles['volume'].tolist() == [100, 0, 0]
+        assert dhanhq_obj.candles_as_arrays(candles)['volume'].dtype == np.int64
+
+    def test_failed_rewrite_keeps_the_old_series(self, store):
+        store.append(*KEY, candles=_candles(['2026-01-05', '2026-01-06'], [5.0, 6.0]))
+        replace = os.replace
+
+        def fail_on_staging(source, destination):
+            if os.path.basename(source).startswith('.rewrite-') and not source.endswith('-replaced'):
+                raise OSError('rename failed')
+            replace(source, destination)
+        with patch('os.replace', fail_on_staging), pytest.raises(OSError):
+            store.append(*KEY, candles=_candles(['2026-01-01'], [1.0]))
+        assert store.read(*KEY)['close'].tolist() == [5.0, 6.0]
+        assert os.listdir(os.path.dirname(store.path(*KEY))) == ['D']
+
+    def test_coverage_and_missing_ranges(self, store):
+        store.append(*KEY, candles={}, covered=[('2026-01-10', '2026-01-20'), ('2026-01-01', '2026-01-05')])
+        store.append(*KEY, candles={}, covered=[('2026-01-05', '2026-01-07')])
+        day = datetime.datetime.fromisoformat
+        assert store.coverage(*KEY) == [(day('2026-01-01'), day('2026-01-07')), (day('2026-01-10'), day('2026-01-20'))]
+        assert store.missing(*KEY, from_date='2025-12-30', to_date=datetime.date(2026, 1, 25)) == [
+            (day('2025-12-30'), day('2026-01-01')), (day('2026-01-07'), day('2026-01-10')),
+            (day('2026-01-20'), day('2026-01-25'))]
+        assert store.missing(*KEY, from_date='2026-01-02', to_date='2026-01-06') == []
+        assert store.read(*KEY)['timestamp'].tolist() == []
+
+    def test_interrupted_append_is_ignored(self, store):
+        store.append(*KEY, candles=_candles(['2026-01-01']))
+        with open(os.path.join(store.path(*KEY), 'close.bin'), 'ab') as f:
+            f.write(b'\x01\x02\x03')
+        store.append(*KEY, candles=_candles(['2026-01-02'], [2.0]))
+        assert store.read(*KEY)['close'].tolist() == [0.0, 2.0]
+
+    def test_series_are_kept_apart(self, store):
+        store.append('1333', 'NSE_EQ', 'EQUITY', 5, candles=_candles(['2026-01-01']))
+        store.append('1333', 'NSE_EQ', 'EQUITY', 5, True, candles=_candles(['2026-01-01', '2026-01-02']))
+        assert len(store.read('1333', 'NSE_EQ', 'EQUITY', 5)['timestamp']) == 1
+        assert len(store.read('1333', 'NSE_EQ', 'EQUITY', 5, True)['timestamp']) == 2
+        store.clear('1333', 'NSE_EQ', 'EQUITY', 5, True)
+        assert store.read_meta('1333', 'NSE_EQ', 'EQUITY', 5, True) is None
+
+
+class TestSyncCandles:
+    def test_only_missing_ranges_are_fetched(self, store, dhanhq_obj):
+        server = Server()
+        with patch.object(DhanHTTP, '_send_request', server):
+            response = dhanhq_obj.sync_candles('1333', 'NSE_EQ', 'EQUITY', '2025-01-01', '2025-03-01', store=store)
+            assert response['status'] == 'success'
+            assert len(response['data']['timestamp']) == 59
+            assert len(server.payloads) == 1
+
+            response = dhanhq_obj.sync_candles('1333', 'NSE_EQ', 'EQUITY', '2025-02-01', '2025-03-01', store=store)
+            assert len(response['data']['close']) == 28
+            assert len(server.payloads) == 1
+
+            response = dhanhq_obj.sync_candles('1333', 'NSE_EQ', 'EQUITY', '2024-12-01', '2025-04-01', store=store)
+        assert [(p['fromDate'], p['toDate']) for p in server.payloads[1:]] == [
+            ('2024-12-01', '2025-01-01'), ('2025-03-01', '2025-04-01')]
+        timestamps = response['data']['timestamp']
+        assert len(timestamps) == 121 and np.all(np.diff(timestamps) > 0)
+        assert response['data']['close'].tolist() == [float(t) for t in timestamps]
+
+    def test_today_is_fetched_again(self, store, dhanhq_obj):
+        server = Server()
+        today = datetime.datetime.now(CandleStore.IST).date()
+        with patch.object(DhanHTTP, '_send_request', server):
+            dhanhq_obj.sync_candles('13', 'IDX_I', 'INDEX', today - datetime.timedelta(days=3),
+                                    today + datetime.timedelta(days=1), interval=5, store=store)
+            dhanhq_obj.sync_candles('13', 'IDX_I', 'INDEX', today - datetime.timedelta(days=3),
+                                    today + datetime.timedelta(days=1), interval=5, store=store)
+        assert server.payloads[1]['fromDate'] == today.isoformat()
+        assert server.payloads[1]['interval'] == 5
+        assert len(store.read('13', 'IDX_I', 'INDEX', 5)['timestamp']) == 4
+
+    def test_failure_is_not_recorded(self, store, dhanhq_obj):
+        failure = {'status': 'failure', 'remarks': {'error_code': 'DH-904'}, 'data': ''}
+        with patch.object(DhanHTTP, '_send_request', return_value=failure):
+            assert dhanhq_obj.sync_candles(*KEY[:3], '2025-01-01', '2025-02-01', store=store) == failure
+        assert store.read_meta(*KEY) is None
+        assert dhanhq_obj.sync_candles(*KEY[:3], '2025-01-01', '2025-02-01', interval=2,
+                                       store=store)['status'] == 'failure'
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from dhanhq.coalescer import RequestCoalescer
+from dhanhq.dhan_http import DhanHTTP
+
+
+def _slow_response(*args, **kwargs):
+    time.sleep(0.1)
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"data": {"last_price": 24500.5}}'
+    return response
+
+
+class TestRequestCoalescer:
+    def test_key_is_independent_of_payload_order(self):
+        coalescer = RequestCoalescer()
+        assert coalescer.key('POST', '/optionchain', {"a": 1, "b": 2}) == \
+            coalescer.key('POST', '/optionchain', {"b": 2, "a": 1})
+
+    def test_only_reads_are_coalesced(self):
+        coalescer = RequestCoalescer()
+        assert coalescer.key('GET', '/globalstocks/marketstatus') == ('GET', '/globalstocks/marketstatus', None)
+        assert coalescer.key('POST', '/marketfeed/ltp', {"NSE_EQ": [1333]}) is not None
+        assert coalescer.key('POST', '/orders', {"securityId": "1333"}) is None
+        assert coalescer.key('DELETE', '/orders/1') is None
+
+    def test_trading_state_reads_are_not_coalesced(self):
+        coalescer = RequestCoalescer()
+        for endpoint in ('/orders', '/orders/1', '/positions', '/holdings', '/fundlimit', '/trades/',
+                         '/super/orders', '/globalstocks/orders', '/globalstocks/fundlimit'):
+            assert coalescer.key('GET', endpoint) is None
+
+    def test_concurrent_callers_share_one_call(self):
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+        calls = []
+
+        def send():
+            calls.append(1)
+            release.wait()
+            return {'status': 'success', 'data': [1]}
+
+        key = coalescer.key('POST', '/marketfeed/ltp', {"NSE_EQ": [1333]})
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(coalescer.do, key, send) for _ in range(4)]
+            while coalescer.shared < 3:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert all(result == {'status': 'success', 'data': [1]} for result in results)
+        assert len({id(result) for result in results}) == 4
+
+    def test_error_is_raised_to_every_waiter(self):
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+
+        def send():
+            release.wait()
+            raise ValueError('boom')
+
+        key = coalescer.key('POST', '/marketfeed/ltp', {"NSE_EQ": [1333]})
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(coalescer.do, key, send) for _ in range(2)]
+            while coalescer.shared < 1:
+                time.sleep(0.001)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError):
+                    future.result()
+
+    def test_async_callers_share_one_task(self):
+        coalescer = RequestCoalescer()
+        calls = []
+
+        async def send():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {'status': 'success', 'data': [1]}
+
+        async def scenario():
+            key = coalescer.key('POST', '/optionchain', {"UnderlyingScrip": 13})
+            return await asyncio.gather(*(coalescer.do_async(key, send) for _ in range(3)))
+
+        results = asyncio.run(scenario())
+        assert len(calls) == 1
+        assert len({id(result) for result in results}) == 3
+
+
+class TestDhanHTTP_Coalescing:
+    @patch("requests.Session.post", side_effect=_slow_response)
+    def test_identical_option_chain_calls_share_one_request(self, mock_post):
+        dhan_http = DhanHTTP("test_client_id", "test_access_token", rate_limiter=False)
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(
+                lambda _: dhan_http.post('/optionchain', {"UnderlyingScrip": 13, "UnderlyingSeg": "IDX_I",
+                                                          "Expiry": "2026-10-29"}), range(5)))
+        assert mock_post.call_count == 1
+        assert all(result['data'] == {"data": {"last_price": 24500.5}} for result in results)
+
+    @patch("requests.Session.post", side_effect=_slow_response)
+    def test_order_placements_are_never_coalesced(self, mock_post):
+        dhan_http = DhanHTTP("test_client_id", "test_access_token", rate_limiter=False)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: dhan_http.post('/orders', {"securityId": "1333"}), range(3)))
+        assert mock_post.call_count == 3
+
+    @patch("requests.Session.post", side_effect=_slow_response)
+    def test_coalescing_can_be_disabled(self, mock_post):
+        dhan_http = DhanHTTP("test_client_id", "test_access_token", rate_limiter=False, coalesce_requests=False)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: dhan_http.post('/marketfeed/ltp', {"NSE_EQ": [1333]}), range(3)))
+        assert mock_post.call_count == 3
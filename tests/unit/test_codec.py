@@ -0,0 +1,38 @@
+import importlib.util
+
+import pytest
+
+from dhanhq import codec
+
+INSTALLED_BACKENDS = [name for name in codec.BACKENDS if name == 'json' or importlib.util.find_spec(name)]
+
+
+@pytest.fixture
+def restore_codec():
+    selected = codec.get_codec().name
+    yield
+    codec.use(selected)
+
+
+@pytest.mark.usefixtures('restore_codec')
+class TestCodec:
+    def test_fastest_installed_backend_is_selected(self):
+        assert codec.use().name == INSTALLED_BACKENDS[0]
+
+    @pytest.mark.parametrize('backend', INSTALLED_BACKENDS)
+    def test_round_trip(self, backend):
+        codec.use(backend)
+        document = {"securityId": "1333", "price": 1428.5, "quantity": 10, "tags": ["a/b", "नमस्ते"], "amo": None}
+        assert isinstance(codec.encode(document), bytes)
+        assert isinstance(codec.dumps(document), str)
+        assert codec.loads(codec.encode(document)) == document
+        assert codec.loads(codec.dumps(document)) == document
+
+    @pytest.mark.parametrize('backend', INSTALLED_BACKENDS)
+    def test_values_outside_backend_support_fall_back_to_stdlib(self, backend):
+        codec.use(backend)
+        assert codec.loads(codec.encode({1: 2 ** 70})) == {"1": 2 ** 70}
+
+    def test_unknown_backend_is_rejected(self):
+        with pytest.raises(KeyError):
+            codec.use('simplejson')
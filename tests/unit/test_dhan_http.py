@@ -1,10 +1,12 @@
-import json
+import time
 from unittest.mock import patch
 
 import pytest
 import requests
 
+from dhanhq import codec
 from dhanhq.dhan_http import DhanHTTP
+from dhanhq.rate_limiter import RateLimiter
 
 @pytest.fixture
 def dhan_http():
@@ -68,7 +70,7 @@ class TestDhan_Private_SendRequest:
         dhan_http._send_request(DhanHTTP.HttpMethods.POST, endpoint, payload)
         mock_requests_session_post.assert_called_once_with(
             dhan_http.base_url + endpoint,
-            data=json.dumps({**payload, "dhanClientId": dhan_http.client_id}),
+            data=codec.encode({**payload, "dhanClientId": dhan_http.client_id}),
             headers=dhan_http.header,
             timeout=dhan_http.timeout,
         )
@@ -119,3 +121,54 @@ class TestDhan_CRUD_Methods:
         payload = {"key": "value"}
         dhan_http.post(endpoint,payload)
         mock_send_request.assert_called_once_with(DhanHTTP.HttpMethods.POST, endpoint, payload)
+
+class TestDhan_WarmUp:
+    @patch("requests.Session.head")
+    def test_warm_up_opens_connections_without_api_calls(self, mock_head, dhan_http):
+        assert dhan_http.warm_up(connections=3) == 3
+        assert mock_head.call_count == 4
+        mock_head.assert_called_with(dhan_http.base_url, timeout=dhan_http.timeout)
+        assert dhan_http.get_rate_limit_budget()['order'][1] == 10
+
+    @patch("requests.Session.head", side_effect=requests.exceptions.ConnectionError("down"))
+    def test_warm_up_failure_is_not_raised(self, mock_head, dhan_http):
+        assert dhan_http.warm_up() == 0
+
+    @patch("requests.Session.head")
+    def test_keep_alive_repeats_until_stopped(self, mock_head, dhan_http):
+        dhan_http.start_keep_alive(interval=0.01)
+        time.sleep(0.1)
+        dhan_http.stop_keep_alive()
+        calls = mock_head.call_count
+        assert calls >= 3
+        time.sleep(0.05)
+        assert mock_head.call_count <= calls + 1
+
+class TestDhan_PriorityLane:
+    @pytest.mark.parametrize("method, endpoint, priority", [
+        ('POST', '/killswitch?killSwitchStatus=ACTIVATE', DhanHTTP.RequestPriority.RISK_OFF),
+        ('POST', '/killswitch?killSwitchStatus=DEACTIVATE', DhanHTTP.RequestPriority.NORMAL),
+        ('DELETE', '/positions', DhanHTTP.RequestPriority.RISK_OFF),
+        ('DELETE', '/orders/112', DhanHTTP.RequestPriority.RISK_OFF),
+        ('DELETE', '/super/orders/112/ENTRY_LEG', DhanHTTP.RequestPriority.RISK_OFF),
+        ('DELETE', '/pnlExit', DhanHTTP.RequestPriority.NORMAL),
+        ('POST', '/orders', DhanHTTP.RequestPriority.NORMAL),
+        ('GET', '/positions', DhanHTTP.RequestPriority.NORMAL),
+    ])
+    def test_priority_of(self, method, endpoint, priority):
+        assert DhanHTTP.priority_of(method, endpoint) is priority
+
+    def test_risk_off_calls_use_reserved_session_and_jump_the_queue(self):
+        sleeps = []
+        dhan_http = DhanHTTP("test_client_id", "test_access_token",
+                             rate_limiter=RateLimiter({RateLimiter.ORDER: ((1, 60),)}, sleep=sleeps.append))
+        dhan_http.rate_limiter.reserve(RateLimiter.ORDER)
+        dhan_http.rate_limiter.reserve(RateLimiter.ORDER)
+        with patch.object(dhan_http.priority_session, 'delete') as mock_priority_delete, \
+                patch.object(dhan_http.session, 'delete') as mock_delete:
+            dhan_http.delete('/orders/112')
+        mock_priority_delete.assert_called_once()
+        mock_delete.assert_not_called()
+        # The cancel takes the queued order's slot instead of going over the limit.
+        assert sleeps == [pytest.approx(60, abs=1)]
+        assert dhan_http.rate_limiter.reserve(RateLimiter.ORDER) == pytest.approx(180, abs=1)
@@ -1,7 +1,26 @@
+import datetime
+import threading
+import time
 from unittest.mock import patch
+import numpy as np
 import pytest
+from dhanhq.candle_windows import CandleWindows
 from dhanhq.dhan_http import DhanHTTP
 
+"""Conversion of this many candles must beat the budget"""
+BENCHMARK_CANDLES = 100000
+CONVERSION_BUDGET_SECONDS = 0.05
+
+
+def _daily_candles(self, method, endpoint, payload=None):
+    # One candle per day from fromDate to toDate, both included, so that windows overlap by a day.
+    start = datetime.datetime.fromisoformat(payload['fromDate']).replace(tzinfo=datetime.timezone.utc)
+    end = datetime.datetime.fromisoformat(payload['toDate']).replace(tzinfo=datetime.timezone.utc)
+    days = (end - start).days + 1
+    timestamps = [int((start + datetime.timedelta(days=day)).timestamp()) for day in range(days)]
+    return {'status': 'success', 'remarks': '',
+            'data': {'open': [1.0] * days, 'close': [float(t) for t in timestamps], 'timestamp': timestamps}}
+
 class TestDhanhq_HistoricalData:
     
     @patch("dhanhq.dhan_http.DhanHTTP.post")
@@ -144,3 +163,134 @@ class TestDhanhq_HistoricalData:
         assert json_response['status'] == DhanHTTP.HttpResponseStatus.FAILURE.value
         assert "expiry_code value must be" in json_response['remarks']
         mock_create_request.assert_not_called()
+
+
+class TestDhanhq_HistoricalDataRange:
+    def test_date_windows(self):
+        assert CandleWindows.date_windows('2026-01-01', '2026-03-01', 30) == [
+            ('2026-01-01', '2026-01-31'), ('2026-01-31', '2026-03-01')]
+        assert CandleWindows.date_windows('2026-01-01 09:15:00', '2026-01-02 15:30:00', 1) == [
+            ('2026-01-01 09:15:00', '2026-01-02 09:15:00'), ('2026-01-02 09:15:00', '2026-01-02 15:30:00')]
+        assert CandleWindows.date_windows(datetime.date(2026, 1, 1), '2026-01-01', 90) == [('2026-01-01', '2026-01-01')]
+        with pytest.raises(ValueError):
+            CandleWindows.date_windows('2026-02-01', '2026-01-01', 90)
+
+    @patch.object(DhanHTTP, '_send_request', _daily_candles)
+    def test_intraday_range_is_split_and_stitched(self, dhanhq_obj):
+        response = dhanhq_obj.intraday_minute_data_range('1333', 'NSE_EQ', 'EQUITY', '2025-01-01', '2026-01-01')
+        assert response['status'] == 'success'
+        timestamps = response['data']['timestamp']
+        assert len(timestamps) == 366
+        assert timestamps == sorted(set(timestamps))
+        assert response['data']['close'] == [float(t) for t in timestamps]
+
+    def test_windows_are_fetched_concurrently(self, dhanhq_obj):
+        # A year of minute candles is 5 windows of at most 90 days, all in flight at once.
+        barrier = threading.Barrier(5, timeout=5)
+        payloads = []
+
+        def send_request(self, method, endpoint, payload=None):
+            barrier.wait()
+            payloads.append(payload)
+            return _daily_candles(self, method, endpoint, payload)
+        with patch.object(DhanHTTP, '_send_request', send_request):
+            response = dhanhq_obj.intraday_minute_data_range('1333', 'NSE_EQ', 'EQUITY', '2025-01-01',
+                                                             '2026-01-01', interval=5, oi=True)
+        assert response['status'] == 'success'
+        assert sorted(payload['fromDate'] for payload in payloads)[0] == '2025-01-01'
+        assert all(payload['interval'] == 5 and payload['oi'] for payload in payloads)
+
+    @patch.object(DhanHTTP, '_send_request', _daily_candles)
+    def test_daily_range(self, dhanhq_obj):
+        response = dhanhq_obj.historical_daily_data_range('1333', 'NSE_EQ', 'EQUITY', '2020-01-01', '2026-01-01',
+                                                          max_workers=2)
+        assert len(response['data']['timestamp']) == (datetime.date(2026, 1, 1) - datetime.date(2020, 1, 1)).days + 1
+
+    def test_failed_window_fails_the_range(self, dhanhq_obj):
+        def send_request(self, method, endpoint, payload=None):
+            if payload['fromDate'] > '2025-06-01':
+                return {'status': 'failure', 'remarks': {'error_code': 'DH-904'}, 'data': ''}
+            return _daily_candles(self, method, endpoint, payload)
+        with patch.object(DhanHTTP, '_send_request', send_request):
+            response = dhanhq_obj.intraday_minute_data_range('1333', 'NSE_EQ', 'EQUITY', '2025-01-01', '2026-01-01')
+        assert response['status'] == 'failure'
+        assert response['remarks'] == {'error_code': 'DH-904'}
+
+    @patch.object(DhanHTTP, '_send_request')
+    def test_invalid_arguments(self, mock_send_request, dhanhq_obj):
+        assert dhanhq_obj.intraday_minute_data_range('1', 'NSE_EQ', 'EQUITY', '2025-01-01', '2025-02-01',
+                                                     interval=3)['status'] == 'failure'
+        assert dhanhq_obj.historical_daily_data_range('1', 'NSE_EQ', 'EQUITY', '2025-01-01', '2025-02-01',
+                                                      expiry_code=7)['status'] == 'failure'
+        assert dhanhq_obj.historical_daily_data_range('1', 'NSE_EQ', 'EQUITY', '2025-02-01',
+                                                      '2025-01-01')['status'] == 'failure'
+        mock_send_request.assert_not_called()
+
+    @patch.object(DhanHTTP, '_send_request')
+    def test_empty_windows(self, mock_send_request, dhanhq_obj):
+        mock_send_request.return_value = {'status': 'success', 'remarks': '', 'data': {'timestamp': []}}
+        response = dhanhq_obj.intraday_minute_data_range('1333', 'NSE_EQ', 'EQUITY', '2025-01-01', '2025-01-02')
+        assert response == {'status': 'success', 'remarks': '', 'data': {}}
+
+    @patch.object(DhanHTTP, '_send_request')
+    def test_candles_as_arrays(self, mock_send_request, dhanhq_obj):
+        # 1767239100 is 2026-01-01 09:15 IST.
+        mock_send_request.return_value = {'status': 'success', 'remarks': '', 'data': {
+            'open': [10, 11.5], 'close': [11, 12.5], 'volume': [100, 200], 'open_interest': [5, 6],
+            'timestamp': [1767239100, 1767239160]}}
+        response = dhanhq_obj.intraday_minute_data('1333', 'NSE_EQ', 'EQUITY', '2026-01-01', '2026-01-02',
+                                                   oi=True, result='arrays')
+        data = response['data']
+        assert response['status'] == 'success'
+        assert data['timestamp'].dtype == np.dtype('datetime64[s]')
+        assert data['timestamp'][0] == np.datetime64('2026-01-01T09:15:00')
+        assert data['open'].dtype == np.float64 and data['open'].tolist() == [10.0, 11.5]
+        assert data['volume'].dtype == np.int64 and data['open_interest'].dtype == np.int64
+
+    @patch.object(DhanHTTP, '_send_request')
+    def test_candles_as_frame(self, mock_send_request, dhanhq_obj):
+        mock_send_request.return_value = {'status': 'success', 'remarks': '', 'data': {
+            'close': [11.0, 12.0], 'volume': [100, 200], 'timestamp': [1767205800, 1767292200]}}
+        frame = dhanhq_obj.historical_daily_data('1333', 'NSE_EQ', 'EQUITY', '2026-01-01', '2026-01-03',
+                                                 result='frame')['data']
+        assert list(frame.columns) == ['close', 'volume']
+        assert frame.index.name == 'timestamp'
+        assert str(frame.index.tz) == 'UTC+05:30'
+        assert frame.index[0].isoformat() == '2026-01-01T00:00:00+05:30'
+        assert frame['volume'].tolist() == [100, 200]
+
+    @patch.object(DhanHTTP, '_send_request')
+    def test_failures_and_invalid_result(self, mock_send_request, dhanhq_obj):
+        failure = {'status': 'failure', 'remarks': {'error_code': 'DH-904'}, 'data': ''}
+        mock_send_request.return_value = failure
+        assert dhanhq_obj.historical_daily_data('1', 'NSE_EQ', 'EQUITY', '2026-01-01', '2026-01-02',
+                                                result='frame') == failure
+        mock_send_request.reset_mock()
+        args = ('1', 'NSE_EQ', 'EQUITY', '2026-01-01', '2026-01-02')
+        for fetch in (dhanhq_obj.intraday_minute_data, dhanhq_obj.historical_daily_data,
+                      dhanhq_obj.intraday_minute_data_range, dhanhq_obj.historical_daily_data_range,
+                      dhanhq_obj.sync_candles):
+            response = fetch(*args, result='list')
+            assert response['status'] == 'failure' and 'result' in response['remarks']
+        mock_send_request.assert_not_called()
+
+    def test_missing_volume_and_oi_stay_float(self, dhanhq_obj):
+        data = dhanhq_obj.candles_as_arrays({'volume': [100, None], 'open_interest': [5.0, float('nan')],
+                                             'close': [1.0, None]})
+        assert data['volume'].dtype == np.float64 and data['volume'][0] == 100 and np.isnan(data['volume'][1])
+        assert data['open_interest'].dtype == np.float64 and np.isnan(data['open_interest'][1])
+        assert np.isnan(data['close'][1])
+        assert dhanhq_obj.candles_as_arrays({'volume': np.array([1.0, 2.0])})['volume'].dtype == np.int64
+
+    def test_conversion_is_vectorized(self, dhanhq_obj):
+        count = BENCHMARK_CANDLES
+        data = {'timestamp': list(range(1767239100, 1767239100 + 60 * count, 60)),
+                **{field: [100.5] * count for field in ('open', 'high', 'low', 'close')},
+                'volume': [1000] * count}
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            frame = dhanhq_obj.candles_as_frame(data)
+            timings.append(time.perf_counter() - start)
+        assert len(frame) == count and frame.index.is_monotonic_increasing
+        assert min(timings) < CONVERSION_BUDGET_SECONDS
@@ -1,3 +1,4 @@
+import json
 from json import dumps as json_dumps
 from unittest.mock import patch
 
@@ -78,3 +79,48 @@ class TestDhanhq_Orders:
         mock_update_request.assert_called_once()
         assert mock_update_request.call_args[0][0] == endpoint
 
+    def test_prepare_order_validates_and_normalizes_fields(self, dhanhq_obj):
+        prepared = dhanhq_obj.prepare_order("1333", "nse_eq", "buy", "limit", "intraday")
+        assert prepared.endpoint == '/orders'
+        assert prepared.fields["transactionType"] == "BUY"
+        assert prepared.fields["exchangeSegment"] == "NSE_EQ"
+        assert "amoTime" not in prepared.fields
+        with pytest.raises(ValueError):
+            dhanhq_obj.prepare_order("1333", "NSE_EQ", "HOLD", "LIMIT", "INTRADAY")
+        with pytest.raises(ValueError):
+            dhanhq_obj.prepare_order("1333", "NSE_EQ", "BUY", "LIMIT", "CNC", after_market_order=True,
+                                     amo_time="CLOSE")
+
+    @patch("dhanhq.dhan_http.DhanHTTP._send_cached")
+    def test_place_prepared_order_sends_encoded_payload(self, mock_send_cached, dhanhq_obj):
+        mock_send_cached.return_value = {'status': 'success', 'remarks': '', 'data': {'orderId': '112'}}
+        prepared = dhanhq_obj.prepare_order("1333", "NSE_EQ", "BUY", "LIMIT", "INTRADAY", should_slice=True)
+        response = dhanhq_obj.place_prepared_order(prepared, 10, 1428.5, tag="open-1")
+
+        method, endpoint, body, correlation_id = mock_send_cached.call_args[0]
+        assert (method, endpoint, correlation_id) == (DhanHTTP.HttpMethods.POST, '/orders/slicing', "open-1")
+        assert json.loads(body) == {
+            "transactionType": "BUY", "exchangeSegment": "NSE_EQ", "productType": "INTRADAY",
+            "orderType": "LIMIT", "validity": "DAY", "securityId": "1333", "disclosedQuantity": 0,
+            "afterMarketOrder": False, "boProfitValue": None, "boStopLossValue": None,
+            "dhanClientId": "test_client_id", "quantity": 10, "price": 1428.5, "triggerPrice": 0.0,
+            "correlationId": "open-1",
+        }
+        assert response['data']['orderId'] == '112'
+        latencies = dhanhq_obj.get_order_ack_latencies()
+        assert latencies[-1]['order_id'] == '112'
+        assert latencies[-1]['correlation_id'] == "open-1"
+        assert latencies[-1]['latency'] >= 0
+
+    def test_place_prepared_order_rejects_non_finite_price(self, dhanhq_obj):
+        prepared = dhanhq_obj.prepare_order("1333", "NSE_EQ", "BUY", "LIMIT", "INTRADAY")
+        with pytest.raises(ValueError):
+            dhanhq_obj.place_prepared_order(prepared, 10, float('nan'))
+
+    @patch("dhanhq.dhan_http.DhanHTTP.start_keep_alive")
+    @patch("dhanhq.dhan_http.DhanHTTP.stop_keep_alive")
+    def test_low_latency_mode(self, mock_stop_keep_alive, mock_start_keep_alive, dhanhq_obj):
+        dhanhq_obj.enable_low_latency_mode(connections=3, keep_alive_interval=15)
+        mock_start_keep_alive.assert_called_once_with(15, 3)
+        dhanhq_obj.disable_low_latency_mode()
+        mock_stop_keep_alive.assert_called_once_with()
@@ -1,4 +1,4 @@
-from json import dumps as json_dumps
+from json import dumps as json_dumps, loads as json_loads
 from unittest.mock import patch
 import pytest
 from dhanhq import DhanContext
@@ -100,3 +100,24 @@ class TestDhanhq_SuperOrder:
         endpoint = f"/super/orders/{order_id}/{leg}"
         dhanhq_obj.cancel_super_order(order_id, leg)
         mock_delete_request.assert_called_once_with(endpoint)
+
+    @patch("dhanhq.dhan_http.DhanHTTP._send_cached")
+    def test_place_prepared_super_order(self, mock_send_cached, dhanhq_obj):
+        mock_send_cached.return_value = {'status': 'success', 'remarks': '', 'data': {'orderId': 'ORD002'}}
+        prepared = dhanhq_obj.prepare_super_order("11536", "nse_eq", "buy", "limit", "cnc")
+        dhanhq_obj.place_prepared_super_order(prepared, 10, 100, targetPrice=110, stopLossPrice=90, trailingJump=1)
+
+        method, endpoint, body, correlation_id = mock_send_cached.call_args[0]
+        assert (method, endpoint, correlation_id) == (DhanHTTP.HttpMethods.POST, "/super/orders", None)
+        assert json_loads(body) == {
+            "transactionType": "BUY", "exchangeSegment": "NSE_EQ", "productType": "CNC", "orderType": "LIMIT",
+            "securityId": "11536", "dhanClientId": "test_client_id", "quantity": 10, "price": 100.0,
+            "targetPrice": 110.0, "stopLossPrice": 90.0, "trailingJump": 1.0,
+        }
+
+    def test_place_prepared_super_order_validates_legs(self, dhanhq_obj):
+        prepared = dhanhq_obj.prepare_super_order("11536", "NSE_EQ", "SELL", "LIMIT", "CNC")
+        with pytest.raises(ValueError, match="For SELL"):
+            dhanhq_obj.place_prepared_super_order(prepared, 10, 100, targetPrice=110)
+        with pytest.raises(ValueError):
+            dhanhq_obj.prepare_super_order("11536", "NSE_EQ", "SHORT", "LIMIT", "CNC")
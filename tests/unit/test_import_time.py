@@ -0,0 +1,54 @@
+import json
+import subprocess
+import sys
+
+import dhanhq
+
+"""Generous ceiling for `import dhanhq` in a fresh interpreter; the REST core needs only requests"""
+IMPORT_BUDGET_SECONDS = 1.0
+
+HEAVY_MODULES = ('websockets', 'asyncio', 'pandas', 'dhanhq.marketfeed', 'dhanhq.orderupdate',
+                 'dhanhq.fulldepth', 'dhanhq.global_stocks_feed', 'dhanhq.async_dhanhq')
+
+
+def _run_fresh(code):
+    """Run code in a new interpreter and return what it prints as JSON."""
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+class TestImportTime:
+    def test_rest_client_import_does_not_load_feeds_or_pandas(self):
+        loaded = _run_fresh(
+            'import json, sys\n'
+            'from dhanhq import DhanContext, dhanhq\n'
+            'dhanhq(DhanContext("client_id", "access_token"))\n'
+            f'print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n')
+        assert loaded == []
+
+    def test_import_time_benchmark(self):
+        timings = _run_fresh(
+            'import json, subprocess, sys\n'
+            'code = "import time; t = time.perf_counter(); import dhanhq; print(time.perf_counter() - t)"\n'
+            'print(json.dumps([float(subprocess.run([sys.executable, "-c", code], check=True,\n'
+            '                  capture_output=True, text=True).stdout) for _ in range(3)]))\n')
+        assert len(timings) == 3 and all(timing > 0 for timing in timings)
+        assert min(timings) < IMPORT_BUDGET_SECONDS, f'import dhanhq took {min(timings) * 1000:.1f} ms at best'
+
+    def test_feed_classes_load_on_first_access(self):
+        loaded = _run_fresh(
+            'import json, sys\n'
+            'import dhanhq\n'
+            'feed = dhanhq.MarketFeed\n'
+            'print(json.dumps([feed.__module__, "websockets" in sys.modules]))\n')
+        assert loaded == ['dhanhq.marketfeed', True]
+
+    def test_lazy_names_are_listed_and_unknown_names_raise(self):
+        assert {'MarketFeed', 'OrderUpdate', 'FullDepth', 'GlobalStocksFeed', 'AsyncDhanHQ'} <= set(dir(dhanhq))
+        assert dhanhq.MarketFeed.__module__ == 'dhanhq.marketfeed'
+        try:
+            dhanhq.NoSuchThing
+        except AttributeError as e:
+            assert 'NoSuchThing' in str(e)
+        else:
+            raise AssertionError('expected AttributeError')
@@ -0,0 +1,62 @@
+import io
+
+import pytest
+
+from dhanhq import InstrumentDiff, InstrumentMaster
+from sample_data import COMPACT_CSV
+
+NEW_CONTRACT = ('NSE,D,35003,OPTIDX,0,NIFTY-Nov2026-25000-CE,75.0,NIFTY 24 NOV 25000 CALL,2026-11-24 14:30:00,'
+                '25000.0,CE,5.0,M,OP,NA,\n')
+
+
+def _master(csv):
+    return InstrumentMaster.from_csv(io.StringIO(csv), InstrumentMaster.COMPACT)
+
+
+@pytest.fixture
+def old():
+    return _master(COMPACT_CSV)
+
+
+@pytest.fixture
+def new():
+    # The crude oil future expired, a November contract was listed and the NIFTY lot size went down.
+    lines = [line for line in COMPACT_CSV.splitlines(keepends=True) if not line.startswith('MCX')]
+    csv = ''.join(line.replace(',75.0,', ',65.0,') if ',OPTIDX,' in line else line for line in lines)
+    return _master(csv.replace('2885,EQUITY,0,RELIANCE,1.0,Reliance Industries,,-0.01,XX,5.0',
+                               '2885,EQUITY,0,RELIANCE,1.0,Reliance Industries,,-0.01,XX,10.0') + NEW_CONTRACT)
+
+
+class TestInstrumentDiff:
+    def test_added_removed_and_changed(self, old, new):
+        diff = new.diff(old)
+        assert isinstance(diff, InstrumentDiff)
+        assert diff.added_ids() == [('NSE_FNO', '35003')]
+        assert diff.removed_ids() == [('MCX_COMM', '4321')]
+        assert diff.changed_ids() == [('NSE_EQ', '2885'), ('NSE_FNO', '35001'), ('NSE_FNO', '35002')]
+        assert diff.changed_ids('tick_size') == [('NSE_EQ', '2885')]
+        assert new.row(int(diff.added[0]))['trading_symbol'] == 'NIFTY-Nov2026-25000-CE'
+        assert old.row(int(diff.removed[0]))['trading_symbol'] == 'CRUDEOIL-Nov2026-FUT'
+
+    def test_lot_size_audit(self, old, new):
+        diff = new.diff(old)
+        assert diff.changes('lot_size') == [
+            {'exchange_segment': 'NSE_FNO', 'security_id': '35001', 'trading_symbol': 'NIFTY-Oct2026-25000-CE',
+             'old': 75, 'new': 65},
+            {'exchange_segment': 'NSE_FNO', 'security_id': '35002', 'trading_symbol': 'NIFTY-Oct2026-25000-PE',
+             'old': 75, 'new': 65},
+        ]
+        assert diff.summary() == {'added': 1, 'removed': 1, 'changed': 3,
+                                  'columns': {'lot_size': 2, 'tick_size': 1}}
+        with pytest.raises(ValueError):
+            diff.changes('security_id')
+
+    def test_identical_snapshots(self, old):
+        diff = _master(COMPACT_CSV).diff(old)
+        assert not diff
+        assert diff.summary() == {'added': 0, 'removed': 0, 'changed': 0, 'columns': {}}
+
+    def test_missing_values_are_equal(self, old):
+        # Strike and expiry are NaN/NaT for equities; that is not a change.
+        diff = InstrumentDiff.between(old, old)
+        assert len(diff.changed_new) == 0
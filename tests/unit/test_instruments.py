@@ -0,0 +1,81 @@
+import datetime
+import io
+from unittest.mock import patch
+
+import numpy as np
+
+from dhanhq import InstrumentMaster
+from sample_data import COMPACT_CSV, DETAILED_CSV, GLOBAL_CSV
+
+
+def _master(csv, source):
+    return InstrumentMaster.from_csv(io.StringIO(csv), source)
+
+
+class TestInstrumentMaster:
+    def test_compact_master_is_normalised_and_typed(self):
+        master = _master(COMPACT_CSV, InstrumentMaster.COMPACT)
+        assert len(master) == 7
+        assert master.columns['lot_size'].dtype == np.int64
+        assert master.columns['tick_size'].dtype == np.float64
+        assert master.columns['expiry'].dtype == np.dtype('datetime64[D]')
+        assert list(master.columns['exchange_segment']) == ['NSE_EQ', 'BSE_EQ', 'IDX_I', 'NSE_FNO', 'NSE_FNO',
+                                                            'NSE_FNO', 'MCX_COMM']
+        equity = master.get(2885, 'NSE_EQ')
+        assert equity['trading_symbol'] == 'RELIANCE'
+        assert equity['strike'] is None and equity['expiry'] is None and equity['option_type'] == ''
+        future = master.by_symbol('NIFTY-Oct2026-FUT', 'NSE_FNO')
+        assert future['underlying_symbol'] == 'NIFTY'
+        assert future['expiry'] == datetime.date(2026, 10, 27)
+        assert future['lot_size'] == 75
+
+    def test_security_ids_are_scoped_by_segment(self):
+        master = _master(COMPACT_CSV, InstrumentMaster.COMPACT)
+        assert master.by_symbol('RELIANCE', 'BSE_EQ')['security_id'] == '500325'
+        assert master.get('500325', 'NSE_EQ') is None
+        assert master.security_ids(['RELIANCE', 'NIFTY', 'UNKNOWN'], 'NSE_EQ') == ['2885', None, None]
+
+    def test_option_lookup(self):
+        master = _master(COMPACT_CSV, InstrumentMaster.COMPACT)
+        put = master.option('NIFTY', '2026-10-27', 25000, 'PE')
+        assert put['security_id'] == '35002'
+        assert master.option('NIFTY', datetime.datetime(2026, 10, 27, 15, 30), 25000.0, 'CE')['security_id'] == '35001'
+        assert master.option('NIFTY', datetime.date(2026, 10, 27), 25100, 'CE') is None
+
+    def test_detailed_master_indexes_isin(self):
+        master = _master(DETAILED_CSV, InstrumentMaster.DETAILED)
+        listings = master.by_isin('INE002A01018')
+        listed = [(i['exchange_segment'], i['security_id']) for i in listings]
+        assert listed == [('NSE_EQ', '2885'), ('BSE_EQ', '500325')]
+        assert master.by_symbol('RELIANCE', 'NSE_EQ')['display_name'] == 'Reliance Industries'
+        call = master.option('NIFTY', '2026-10-27', 25000, 'CE')
+        assert call['isin'] == '' and call['tick_size'] == 0.05
+
+    def test_global_instruments_can_be_combined(self):
+        master = InstrumentMaster.concat([_master(COMPACT_CSV, InstrumentMaster.COMPACT),
+                                          _master(GLOBAL_CSV, InstrumentMaster.GLOBAL)])
+        apple = master.get('AAPL', 'INX_EQ')
+        assert apple['isin'] == 'US0378331005'
+        assert master.by_isin('US0378331005')[0]['trading_symbol'] == 'AAPL'
+        assert len(master.to_frame()) == 8
+
+    @patch("requests.get")
+    def test_fetch_instrument_master(self, mock_requests_get, dhanhq_obj):
+        mock_requests_get.return_value.__enter__.return_value.iter_content.return_value = [DETAILED_CSV.encode()]
+        master = dhanhq_obj.fetch_instrument_master()
+        mock_requests_get.assert_called_once_with('https://images.dhan.co/api-data/api-scrip-master-detailed.csv',
+                                                  stream=True)
+        assert master.get('35001', 'NSE_FNO')['lot_size'] == 75
+        assert master.by_symbol('RELIANCE', 'BSE_EQ')['isin'] == 'INE002A01018'
+
+    @patch("requests.get")
+    def test_fetch_instrument_master_with_filters(self, mock_requests_get):
+        mock_requests_get.return_value.__enter__.return_value.iter_content.return_value = [DETAILED_CSV.encode()]
+        master = InstrumentMaster.fetch(exchange_segments=['NSE_FNO', 'NSE_EQ'], instruments=['OPTIDX'])
+        assert len(master) == 1
+        assert master.option('NIFTY', '2026-10-27', 25000, 'CE')['security_id'] == '35001'
+
+    @patch("requests.get")
+    def test_fetch_instrument_master_failure(self, mock_requests_get, dhanhq_obj):
+        mock_requests_get.side_effect = Exception('network down')
+        assert dhanhq_obj.fetch_instrument_master() is None
@@ -0,0 +1,85 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from dhanhq import MetricsRegistry
+from dhanhq.dhan_http import DhanHTTP
+
+
+def _response(status_code, content):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.elapsed = datetime.timedelta(milliseconds=20)
+    return response
+
+
+class TestMetricsRegistry:
+    @pytest.mark.parametrize('endpoint, template', [
+        ('/orders/112111182198', '/orders/{id}'),
+        ('/orders/external/my-tag', '/orders/external/{id}'),
+        ('/trades/2026-10-01/2026-10-17/0', '/trades/{id}/{id}/{id}'),
+        ('/super/orders/112111182198/ENTRY_LEG', '/super/orders/{id}/ENTRY_LEG'),
+        ('/edis/inquire/INE002A01018', '/edis/inquire/{id}'),
+        ('/ledger?from-date=2026-10-01&to-date=2026-10-17', '/ledger'),
+        ('/fundlimit', '/fundlimit'),
+    ])
+    def test_endpoint_template(self, endpoint, template):
+        assert MetricsRegistry().endpoint_template(endpoint) == template
+
+    def test_snapshot_aggregates_per_template(self):
+        metrics = MetricsRegistry()
+        metrics.record('GET', '/orders/1', 0.02, 200, response_bytes=100, server_time=0.015)
+        metrics.record('GET', '/orders/2', 0.04, 200, response_bytes=50, server_time=0.025)
+        metrics.record('GET', '/orders/3', 0.3, 400, error_code='DH-905')
+        snapshot = metrics.snapshot()['GET /orders/{id}']
+        assert snapshot['count'] == 3
+        assert snapshot['statuses'] == {200: 2, 400: 1}
+        assert snapshot['error_codes'] == {'DH-905': 1}
+        assert snapshot['response_bytes'] == 150
+        assert snapshot['latency']['max'] == 0.3
+        assert snapshot['latency']['server_time_mean'] == pytest.approx(0.02)
+        assert 0.025 < snapshot['latency']['p50'] <= 0.05
+        assert 0.25 < snapshot['latency']['p99'] <= 0.3
+
+    def test_prometheus_export(self):
+        metrics = MetricsRegistry(buckets=(0.1, 1.0))
+        metrics.record('POST', '/orders', 0.05, 200, request_bytes=120)
+        metrics.record('POST', '/orders', 2.0, 400, error_code='DH-906')
+        text = metrics.to_prometheus()
+        assert 'dhanhq_requests_total{method="POST",endpoint="/orders",status="400"} 1' in text
+        assert 'dhanhq_errors_total{method="POST",endpoint="/orders",error_code="DH-906"} 1' in text
+        assert 'dhanhq_request_duration_seconds_bucket{method="POST",endpoint="/orders",le="0.1"} 1' in text
+        assert 'dhanhq_request_duration_seconds_bucket{method="POST",endpoint="/orders",le="+Inf"} 2' in text
+        assert 'dhanhq_request_duration_seconds_count{method="POST",endpoint="/orders"} 2' in text
+        assert 'dhanhq_request_bytes_total{method="POST",endpoint="/orders"} 120' in text
+
+
+class TestDhanHTTP_Metrics:
+    @patch("requests.Session.get")
+    def test_responses_and_error_codes_are_recorded(self, mock_get):
+        dhan_http = DhanHTTP("test_client_id", "test_access_token", rate_limiter=False, metrics=True)
+        mock_get.side_effect = [
+            _response(200, b'{"orderId": "1"}'),
+            _response(400, b'{"errorCode": "DH-905", "errorType": "Input_Exception", "errorMessage": "bad"}'),
+        ]
+        dhan_http.get('/orders/1')
+        dhan_http.get('/orders/2')
+        snapshot = dhan_http.get_metrics()['GET /orders/{id}']
+        assert snapshot['statuses'] == {200: 1, 400: 1}
+        assert snapshot['error_codes'] == {'DH-905': 1}
+        assert snapshot['latency']['server_time_mean'] == pytest.approx(0.02)
+
+    @patch("requests.Session.post")
+    def test_transport_errors_are_recorded(self, mock_post):
+        dhan_http = DhanHTTP("test_client_id", "test_access_token", rate_limiter=False, metrics=True)
+        mock_post.side_effect = requests.exceptions.ConnectionError('reset')
+        dhan_http.post('/orders', {"securityId": "1333"})
+        snapshot = dhan_http.get_metrics()['POST /orders']
+        assert snapshot['statuses'] == {MetricsRegistry.TRANSPORT_ERROR: 1}
+        assert snapshot['request_bytes'] > 0
+
+    def test_metrics_are_off_by_default(self):
+        assert DhanHTTP("test_client_id", "test_access_token").get_metrics() is None
@@ -0,0 +1,118 @@
+import datetime
+import io
+
+import pytest
+
+from dhanhq import InstrumentMaster, OptionsIndex
+
+HEADER = ('SEM_EXM_EXCH_ID,SEM_SEGMENT,SEM_SMST_SECURITY_ID,SEM_INSTRUMENT_NAME,SEM_TRADING_SYMBOL,SEM_LOT_UNITS,'
+          'SEM_CUSTOM_SYMBOL,SEM_EXPIRY_DATE,SEM_STRIKE_PRICE,SEM_OPTION_TYPE,SEM_TICK_SIZE,SEM_EXPIRY_FLAG')
+
+"""NIFTY weekly expiries on Tuesdays; 2026-10-27 and 2026-11-24 are the monthly ones"""
+NIFTY_EXPIRIES = [('2026-10-20', 'W'), ('2026-10-27', 'M'), ('2026-11-03', 'W'), ('2026-11-10', 'W'),
+                  ('2026-11-24', 'M')]
+STRIKES = [24800, 24900, 25000, 25100, 25200]
+
+
+def _rows(flags=True):
+    rows = ['NSE,E,2885,EQUITY,RELIANCE,1.0,Reliance Industries,,-0.01,XX,5.0,NA']
+    security_id = 40000
+    for expiry, flag in NIFTY_EXPIRIES:
+        for strike in STRIKES:
+            for option_type in ('CE', 'PE'):
+                security_id += 1
+                rows.append(f'NSE,D,{security_id},OPTIDX,NIFTY-{expiry}-{strike}-{option_type},75.0,'
+                            f'NIFTY {expiry} {strike} {option_type},{expiry} 14:30:00,{strike}.0,{option_type},5.0,'
+                            f'{flag if flags else "NA"}')
+    rows.append(f'NSE,D,{security_id + 1},FUTIDX,NIFTY-Oct2026-FUT,75.0,NIFTY OCT FUT,2026-10-27 14:30:00,'
+                f'-0.01,XX,10.0,M')
+    # A duplicate of the first 25000 call, and a strike listed only as a put.
+    rows.append('NSE,D,49999,OPTIDX,NIFTY-2026-10-20-25000-CE,75.0,NIFTY DUP,2026-10-20 14:30:00,25000.0,CE,5.0,W')
+    rows.append('NSE,D,49998,OPTIDX,NIFTY-2026-10-20-25300-PE,75.0,NIFTY 25300 PE,2026-10-20 14:30:00,25300.0,PE,'
+                '5.0,W')
+    rows.append('BSE,D,80001,OPTIDX,SENSEX-Oct2026-82000-CE,20.0,SENSEX 82000 CALL,2026-10-22 14:30:00,82000.0,CE,'
+                '5.0,W')
+    return HEADER + '\n' + '\n'.join(rows) + '\n'
+
+
+def _index(flags=True, exchange_segments=None, as_of='2026-10-01'):
+    master = InstrumentMaster.from_csv(io.StringIO(_rows(flags)), InstrumentMaster.COMPACT)
+    return master.options_index(exchange_segments, as_of)
+
+
+@pytest.fixture
+def index():
+    return _index()
+
+
+class TestOptionsIndex:
+    def test_expiries(self, index):
+        assert index.underlyings() == ['NIFTY', 'SENSEX']
+        assert index.expiries('NIFTY')[0] == datetime.date(2026, 10, 20)
+        assert len(index.expiries('NIFTY')) == 5
+        assert index.expiries('NIFTY', 'MONTH') == [datetime.date(2026, 10, 27), datetime.date(2026, 11, 24)]
+        assert index.expiries('NIFTY', after='2026-11-04') == [datetime.date(2026, 11, 10), datetime.date(2026, 11, 24)]
+        assert index.expiries('BANKNIFTY') == []
+
+    def test_expiry_codes(self, index):
+        assert index.expiry_date('NIFTY', 0, 'WEEK', on='2026-10-20') == datetime.date(2026, 10, 20)
+        assert index.expiry_date('NIFTY', 1, 'WEEK', on='2026-10-21') == datetime.date(2026, 11, 3)
+        assert index.expiry_date('NIFTY', 0, 'MONTH', on='2026-10-28') == datetime.date(2026, 11, 24)
+        assert index.expiry_date('NIFTY', 2, 'MONTH', on='2026-10-01') is None
+        assert index.next_expiry('NIFTY', on=datetime.date(2026, 11, 4)) == datetime.date(2026, 11, 10)
+        assert index.next_expiry('UNKNOWN', on='2026-10-01') is None
+
+    def test_dates_before_the_master_are_not_resolved(self):
+        index = _index(as_of='2026-10-21')
+        assert index.as_of == datetime.date(2026, 10, 21)
+        # The 2026-10-20 expiry is gone from a master taken after it, so codes from before would be off by one.
+        assert index.expiry_date('NIFTY', 0, 'WEEK', on='2026-10-19') is None
+        assert index.next_expiry('NIFTY', 'MONTH', on=datetime.date(2026, 10, 1)) is None
+        assert index.expiry_calendar('NIFTY', on='2026-10-20') == {'WEEK': {}, 'MONTH': {}}
+        assert index.expiry_date('NIFTY', 0, 'WEEK', on='2026-10-21') == datetime.date(2026, 10, 27)
+        assert OptionsIndex.from_master(InstrumentMaster.from_csv(io.StringIO(_rows()), InstrumentMaster.COMPACT)
+                                        ).as_of == datetime.datetime.now(OptionsIndex.IST).date()
+
+    def test_expiry_calendar(self, index):
+        assert index.expiry_calendar('NIFTY', on='2026-10-21', count=2) == {
+            'WEEK': {0: datetime.date(2026, 10, 27), 1: datetime.date(2026, 11, 3)},
+            'MONTH': {0: datetime.date(2026, 10, 27), 1: datetime.date(2026, 11, 24)},
+        }
+
+    def test_monthly_expiries_without_flags(self):
+        index = _index(flags=False)
+        assert index.expiries('NIFTY', 'MONTH') == [datetime.date(2026, 10, 27), datetime.date(2026, 11, 24)]
+        assert index.expiries('SENSEX', 'MONTH') == [datetime.date(2026, 10, 22)]
+
+    def test_atm_strike(self, index):
+        assert index.atm_strike('NIFTY', '2026-10-27', 25040) == 25000.0
+        assert index.atm_strike('NIFTY', '2026-10-27', 25060) == 25100.0
+        assert index.atm_strike('NIFTY', '2026-10-27', 25050) == 25000.0
+        assert index.atm_strike('NIFTY', '2026-10-27', 10000) == 24800.0
+        assert index.atm_strike('NIFTY', '2026-10-27', 99999) == 25200.0
+        assert index.atm_strike('NIFTY', '2026-10-28', 25000) is None
+
+    def test_strike_ladder(self, index):
+        ladder = index.strike_ladder('NIFTY', '2026-10-20', 25010, strikes_around=2)
+        assert [(rung['strike'], rung['offset']) for rung in ladder] == [
+            (24800.0, -2), (24900.0, -1), (25000.0, 0), (25100.0, 1), (25200.0, 2)]
+        assert ladder[2]['CE'] == '40005' and ladder[2]['PE'] == '40006'
+
+        ladder = index.strike_ladder('NIFTY', '2026-10-20', 25300, strikes_around=2)
+        assert [rung['offset'] for rung in ladder] == [-2, -1, 0]
+        assert ladder[-1] == {'strike': 25300.0, 'offset': 0, 'CE': None, 'PE': '49998'}
+        assert index.strike_ladder('NIFTY', '2026-10-28', 25000) == []
+
+    def test_security_id(self, index):
+        assert index.security_id('NIFTY', '2026-11-24', 25100, 'PE') == '40048'
+        assert index.security_id('NIFTY', datetime.date(2026, 10, 20), 25000.0, 'CE') == '40005'
+        assert index.security_id('NIFTY', '2026-10-20', 25300, 'CE') is None
+        assert index.security_id('NIFTY', '2026-10-20', 25050, 'CE') is None
+        assert index.security_id('SENSEX', '2026-10-22', 82000, 'CE') == '80001'
+
+    def test_exchange_segments_and_empty_index(self):
+        assert _index(exchange_segments=['BSE_FNO']).underlyings() == ['SENSEX']
+        empty = _index(exchange_segments=['MCX_COMM'])
+        assert empty.underlyings() == []
+        assert empty.atm_strike('NIFTY', '2026-10-20', 25000) is None
+        assert isinstance(empty, OptionsIndex)
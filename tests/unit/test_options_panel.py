@@ -0,0 +1,139 @@
+import datetime
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from dhanhq import OptionsPanel
+from dhanhq.dhan_http import DhanHTTP
+
+IST = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+
+
+def _offset(strike):
+    return 0 if strike == 'ATM' else int(strike[3:])
+
+
+def _rolling_option(self, method, endpoint, payload=None):
+    # One candle per day from fromDate to toDate, both included; close encodes strike and option type.
+    start = datetime.datetime.fromisoformat(payload['fromDate']).replace(tzinfo=IST)
+    days = (datetime.datetime.fromisoformat(payload['toDate']).replace(tzinfo=IST) - start).days + 1
+    timestamps = [int((start + datetime.timedelta(days=day)).timestamp()) for day in range(days)]
+    sign = 1 if payload['drvOptionType'] == 'CALL' else -1
+    part = {'timestamp': timestamps, 'close': [sign * (100.0 + _offset(payload['strike']))] * days,
+            'iv': [10.0 + payload['expiryCode']] * days, 'oi': [1000] * days}
+    key = 'ce' if payload['drvOptionType'] == 'CALL' else 'pe'
+    return {'status': 'success', 'remarks': '', 'data': {key: part, 'pe' if key == 'ce' else 'ce': None}}
+
+
+class TestExpiredOptionsSweep:
+    @patch.object(DhanHTTP, '_send_request', _rolling_option)
+    def test_sweep_builds_panel(self, dhanhq_obj):
+        response = dhanhq_obj.expired_options_sweep('13', 'NSE_FNO', 'OPTIDX', 'WEEK', '2025-01-01', '2025-03-01',
+                                                    strikes=range(-2, 3), expiry_codes=(1, 2),
+                                                    required_data=['close', 'iv', 'oi'])
+        assert response['status'] == 'success'
+        panel = response['data']
+        assert isinstance(panel, OptionsPanel)
+        assert panel.strikes == ('ATM-2', 'ATM-1', 'ATM', 'ATM+1', 'ATM+2')
+        assert panel.values.shape == (2, 2, 60, 5, 3)
+        assert panel.values.dtype == np.float32 and panel.failures == []
+        assert panel.get('close')[0].tolist() == [98.0, 99.0, 100.0, 101.0, 102.0]
+        assert panel.get('close', 'PUT')[-1].tolist() == [-98.0, -99.0, -100.0, -101.0, -102.0]
+        assert np.all(panel.get('iv', expiry_code=2) == 12.0)
+        series = panel.strike_data(1, 'CALL', 1)
+        assert series['oi'].tolist() == [1000.0] * 60
+        assert np.all(np.diff(series['timestamp']) == 86400)
+
+    def test_calls_are_fetched_concurrently(self, dhanhq_obj):
+        # 2 strikes x 2 option types x 2 windows of at most 30 days; the first 5 are in flight at once.
+        barrier = threading.Barrier(5, timeout=5)
+        lock = threading.Lock()
+        payloads = []
+
+        def send_request(self, method, endpoint, payload=None):
+            with lock:
+                payloads.append(payload)
+                first = len(payloads) <= 5
+            if first:
+                barrier.wait()
+            return _rolling_option(self, method, endpoint, payload)
+        with patch.object(DhanHTTP, '_send_request', send_request):
+            response = dhanhq_obj.expired_options_sweep('13', 'NSE_FNO', 'OPTIDX', 'MONTH', '2025-01-01',
+                                                        '2025-03-01', strikes=['ATM', 'atm+1'], interval=5)
+        assert response['status'] == 'success'
+        assert len(payloads) == 8
+        assert {(p['fromDate'], p['toDate']) for p in payloads} == {('2025-01-01', '2025-01-31'),
+                                                                    ('2025-01-31', '2025-03-01')}
+        assert all(p['interval'] == 5 and p['strike'] in ('ATM', 'ATM+1') for p in payloads)
+
+    def test_failed_calls_are_reported_and_left_nan(self, dhanhq_obj):
+        def send_request(self, method, endpoint, payload=None):
+            if payload['strike'] == 'ATM+1' and payload['drvOptionType'] == 'PUT' and payload['toDate'] == '2025-03-01':
+                return {'status': 'failure', 'remarks': {'error_code': 'DH-904'}, 'data': ''}
+            return _rolling_option(self, method, endpoint, payload)
+        with patch.object(DhanHTTP, '_send_request', send_request):
+            response = dhanhq_obj.expired_options_sweep('13', 'NSE_FNO', 'OPTIDX', 'WEEK', '2025-01-01',
+                                                        '2025-03-01', strikes=range(3), required_data=['close'],
+                                                        dtype='float64')
+        assert response['status'] == 'success'
+        assert response['remarks'] == '1 of 12 requests failed, see data.failures'
+        panel = response['data']
+        assert panel.failures == [{'expiry_code': 1, 'option_type': 'PUT', 'strike': 'ATM+1', 'from_date': '2025-01-31',
+                                   'to_date': '2025-03-01', 'remarks': {'error_code': 'DH-904'}}]
+        assert panel.values.dtype == np.float64
+        puts = panel.get('close', 'PUT')
+        # The windows share 2025-01-31, which the first one still delivered.
+        assert np.isnan(puts[31:, 1]).all() and (puts[:31, 1] == -101.0).all()
+        assert not np.isnan(puts[:, [0, 2]]).any() and not np.isnan(panel.get('close')).any()
+
+    def test_sweep_fails_when_every_call_fails(self, dhanhq_obj):
+        def send_request(self, method, endpoint, payload=None):
+            return {'status': 'failure', 'remarks': {'error_code': 'DH-901'}, 'data': ''}
+        with patch.object(DhanHTTP, '_send_request', send_request):
+            response = dhanhq_obj.expired_options_sweep('13', 'NSE_FNO', 'OPTIDX', 'WEEK', '2025-01-01',
+                                                        '2025-01-10', strikes=range(3))
+        assert response['status'] == 'failure' and response['remarks'] == {'error_code': 'DH-901'}
+
+    @patch.object(DhanHTTP, '_send_request')
+    def test_invalid_arguments(self, mock_send_request, dhanhq_obj):
+        sweep = dhanhq_obj.expired_options_sweep
+        assert sweep('13', 'NSE_FNO', 'OPTIDX', 'DAY', '2025-01-01', '2025-02-01')['status'] == 'failure'
+        assert sweep('13', 'NSE_FNO', 'OPTIDX', 'WEEK', '2025-01-01', '2025-02-01',
+                     option_types=['CE'])['status'] == 'failure'
+        assert sweep('13', 'NSE_FNO', 'OPTIDX', 'WEEK', '2025-01-01', '2025-02-01',
+                     required_data=['vega'])['status'] == 'failure'
+        assert sweep('13', 'NSE_FNO', 'OPTIDX', 'WEEK', '2025-01-01', '2025-02-01', interval=2)['status'] == 'failure'
+        assert sweep('13', 'NSE_FNO', 'OPTIDX', 'WEEK', '2025-02-01', '2025-01-01')['status'] == 'failure'
+        mock_send_request.assert_not_called()
+
+
+class TestOptionsPanel:
+    def test_missing_candles_are_nan(self):
+        data = {'ce': {'timestamp': [20, 10], 'close': [2.0, 1.0]}}
+        later = {'ce': {'timestamp': [30], 'close': [3.0]}}
+        panel = OptionsPanel.from_responses([(0, 'CALL', 'ATM', data), (0, 'CALL', 'ATM+1', later),
+                                             (0, 'CALL', 'ATM-1', {'ce': None})],
+                                            [0], ['CALL'], ['ATM-1', 'ATM', 'ATM+1'], ['close', 'iv'])
+        assert panel.timestamps.tolist() == [10, 20, 30]
+        close = panel.get('close')
+        assert close[:2, 1].tolist() == [1.0, 2.0] and np.isnan(close[2, 1])
+        assert close[2, 2] == 3.0
+        assert np.isnan(close[:, 0]).all() and np.isnan(panel.get('iv')).all()
+
+    def test_to_frame(self):
+        panel = OptionsPanel.from_responses([(1, 'PUT', 'ATM', {'pe': {'timestamp': [1767239100], 'iv': [15.0]}})],
+                                            [1], ['PUT'], ['ATM'], ['iv'])
+        frame = panel.to_frame()
+        assert frame.loc[:, (1, 'PUT', 'ATM', 'iv')].tolist() == [15.0]
+        assert frame.index[0].isoformat() == '2026-01-01T09:15:00+05:30'
+
+    def test_lookups_of_unswept_values(self):
+        panel = OptionsPanel.from_responses([], [1], ['CALL'], ['ATM'], ['close'])
+        assert panel.values.shape == (1, 1, 0, 1, 1)
+        for lookup in (lambda: panel.get('iv'), lambda: panel.get('close', 'PUT'),
+                       lambda: panel.get('close', expiry_code=2), lambda: panel.strike_data(5)):
+            with pytest.raises(ValueError):
+                lookup()
+        assert OptionsPanel.strike_name(-3) == 'ATM-3' and OptionsPanel.strike_name(0) == 'ATM'
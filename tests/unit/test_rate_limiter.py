@@ -0,0 +1,131 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from dhanhq.dhan_http import DhanHTTP
+from dhanhq.rate_limiter import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestTokenBucket:
+    def test_allows_burst_up_to_rate_then_spaces_requests(self):
+        bucket = TokenBucket(5, 1)
+        for _ in range(5):
+            at = bucket.earliest(0.0)
+            assert at == 0.0
+            bucket.consume(at)
+        assert bucket.earliest(0.0) == pytest.approx(0.2)
+        assert bucket.remaining(0.0) == 0
+        assert bucket.remaining(1.0) == 5
+
+
+class TestRateLimiter:
+    @pytest.mark.parametrize("method, endpoint, family", [
+        ('POST', '/orders', RateLimiter.ORDER),
+        ('DELETE', '/super/orders/1/ENTRY_LEG', RateLimiter.ORDER),
+        ('GET', '/orders', RateLimiter.NON_TRADING),
+        ('POST', '/charts/intraday', RateLimiter.DATA),
+        ('POST', '/marketfeed/ltp', RateLimiter.QUOTE),
+        ('POST', '/optionchain', RateLimiter.OPTION_CHAIN),
+        ('POST', '/optionchain/expirylist', RateLimiter.NON_TRADING),
+        ('POST', '/killswitch?killSwitchStatus=ACTIVATE', RateLimiter.NON_TRADING),
+    ])
+    def test_classify(self, method, endpoint, family):
+        assert RateLimiter.classify(method, endpoint) == family
+
+    def test_option_chain_is_one_request_per_three_seconds(self, clock):
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        assert limiter.acquire(RateLimiter.OPTION_CHAIN) == 0
+        assert limiter.acquire(RateLimiter.OPTION_CHAIN) == pytest.approx(3)
+        assert clock.now == pytest.approx(3)
+
+    def test_reservations_are_served_in_order(self, clock):
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        delays = [limiter.reserve(RateLimiter.DATA) for _ in range(8)]
+        assert delays[:5] == [0, 0, 0, 0, 0]
+        assert delays[5:] == pytest.approx([0.2, 0.4, 0.6])
+
+    def test_priority_requests_take_the_earliest_slot_and_push_queued_ones_back(self, clock):
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        queued = [limiter.book(RateLimiter.ORDER) for _ in range(12)]
+        assert [limiter.delay(reservation) for reservation in queued[-2:]] == pytest.approx([0.1, 0.2])
+        assert limiter.reserve(RateLimiter.ORDER, priority=True) == pytest.approx(0.1)
+        assert [limiter.delay(reservation) for reservation in queued[-2:]] == pytest.approx([0.2, 0.3])
+        assert limiter.reserve(RateLimiter.ORDER) == pytest.approx(0.4)
+
+    def test_priority_requests_never_exceed_rate(self, clock):
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        reservations = [limiter.book(RateLimiter.ORDER, priority=index % 3 == 0) for index in range(30)]
+        # The same slots as 30 normal requests, with the queued priority requests taking the earliest.
+        assert sorted(reservation.at for reservation in reservations) == pytest.approx([0] * 10 + [
+            step / 10 for step in range(1, 21)])
+        assert [reservation.at for reservation in reservations[12::3]] == pytest.approx([0.1, 0.2, 0.3, 0.4, 0.5, 0.6])
+        # Behind the 6 queued priority requests, ahead of the 14 normal ones.
+        assert limiter.acquire(RateLimiter.ORDER, priority=True) == pytest.approx(0.7)
+        assert limiter.reserve(RateLimiter.ORDER) == pytest.approx(2.2 - 0.7)
+
+    def test_all_windows_of_a_family_apply(self, clock):
+        limiter = RateLimiter({RateLimiter.ORDER: ((10, 1), (3, 60))}, clock=clock, sleep=clock.sleep)
+        delays = [limiter.reserve(RateLimiter.ORDER) for _ in range(4)]
+        assert delays == pytest.approx([0, 0, 0, 20])
+
+    def test_remaining_budget(self, clock):
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        limiter.acquire(RateLimiter.ORDER)
+        limiter.acquire(RateLimiter.ORDER)
+        budget = limiter.remaining()
+        assert budget[RateLimiter.ORDER] == {1: 8, 60: 248, 3600: 998, 86400: 6998}
+        assert limiter.remaining(RateLimiter.QUOTE) == {1: 1}
+
+    def test_concurrent_callers_never_exceed_rate(self):
+        limiter = RateLimiter({RateLimiter.QUOTE: ((100, 1),)})
+        delays = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(50):
+                delay = limiter.reserve(RateLimiter.QUOTE)
+                with lock:
+                    delays.append(delay)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sum(1 for d in delays if d <= 0) <= 100
+        assert max(delays) <= 1.0 + 0.05
+
+
+class TestDhanHTTP_RateLimiting:
+    @patch("requests.Session.post")
+    def test_send_request_acquires_family_slot(self, mock_requests_session_post):
+        dhan_http = DhanHTTP("test_client_id", "test_access_token")
+        with patch.object(dhan_http.rate_limiter, 'acquire') as mock_acquire:
+            dhan_http._send_request(DhanHTTP.HttpMethods.POST, '/charts/historical', {"a": 1})
+        mock_acquire.assert_called_once_with(RateLimiter.DATA, False)
+
+    def test_rate_limiter_can_be_disabled(self):
+        dhan_http = DhanHTTP("test_client_id", "test_access_token", rate_limiter=False)
+        assert dhan_http.rate_limiter is None
+        assert dhan_http.get_rate_limit_budget() is None
+
+    def test_rate_limit_budget(self):
+        dhan_http = DhanHTTP("test_client_id", "test_access_token")
+        assert dhan_http.get_rate_limit_budget(RateLimiter.OPTION_CHAIN) == {3: 1}
@@ -0,0 +1,110 @@
+import datetime
+import time
+
+import numpy as np
+import pytest
+
+from dhanhq import Resampler, dhanhq
+
+"""Resampling a year of 1 minute NSE candles must beat the budget"""
+BENCHMARK_DAYS = 250
+RESAMPLE_BUDGET_SECONDS = 0.05
+
+IST = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+
+
+def _epoch(text):
+    return int(datetime.datetime.fromisoformat(text).replace(tzinfo=IST).timestamp())
+
+
+def _minute_candles(days, start='09:15', minutes=375):
+    """1 minute candles of whole sessions; prices and OI rise by one per minute, volume is 1."""
+    timestamps = np.concatenate([_epoch(f'{day} {start}') + 60 * np.arange(minutes) for day in days])
+    count = len(timestamps)
+    prices = np.arange(count, dtype=np.float64)
+    return {'open': prices, 'high': prices + 0.5, 'low': prices - 0.5, 'close': prices + 0.25,
+            'volume': np.ones(count, dtype=np.int64), 'open_interest': np.arange(count) * 10,
+            'timestamp': timestamps}
+
+
+def _times(bars):
+    return [datetime.datetime.fromtimestamp(int(t), IST).strftime('%Y-%m-%d %H:%M') for t in bars['timestamp']]
+
+
+class TestResampler:
+    def test_75_minute_bars_align_to_nse_session(self):
+        bars = Resampler.resample(_minute_candles(['2026-01-01']), 75)
+        assert _times(bars) == ['2026-01-01 09:15', '2026-01-01 10:30', '2026-01-01 11:45', '2026-01-01 13:00',
+                                '2026-01-01 14:15']
+        assert bars['open'].tolist() == [0.0, 75.0, 150.0, 225.0, 300.0]
+        assert bars['high'].tolist() == [74.5, 149.5, 224.5, 299.5, 374.5]
+        assert bars['low'].tolist() == [-0.5, 74.5, 149.5, 224.5, 299.5]
+        assert bars['close'].tolist() == [74.25, 149.25, 224.25, 299.25, 374.25]
+        assert bars['volume'].tolist() == [75] * 5
+        assert bars['open_interest'].tolist() == [740, 1490, 2240, 2990, 3740]
+
+    def test_last_bar_of_session_is_shorter(self):
+        bars = Resampler.resample(_minute_candles(['2026-01-01', '2026-01-02']), 10)
+        assert len(bars['timestamp']) == 2 * 38
+        assert _times(bars)[37:39] == ['2026-01-01 15:25', '2026-01-02 09:15']
+        assert bars['volume'][37] == 5
+
+    def test_candles_outside_session_are_left_out(self):
+        candles = _minute_candles(['2026-01-01'], start='09:00', minutes=400)
+        bars = Resampler.resample(candles, 30, session='NSE_EQ')
+        assert _times(bars)[0] == '2026-01-01 09:15'
+        assert bars['open'][0] == 15.0
+        assert bars['volume'].sum() == 375
+
+    def test_daily_bars(self):
+        bars = dhanhq.resample_candles(_minute_candles(['2026-01-01', '2026-01-02']), 'D')
+        assert bars['timestamp'].tolist() == [_epoch('2026-01-01'), _epoch('2026-01-02')]
+        assert bars['open'].tolist() == [0.0, 375.0]
+        assert bars['close'].tolist() == [374.25, 749.25]
+        assert bars['open_interest'].tolist() == [3740, 7490]
+
+    def test_mcx_session(self):
+        candles = _minute_candles(['2026-01-01'], start='09:00', minutes=14 * 60 + 30)
+        bars = Resampler.resample(candles, 60, session='MCX_COMM')
+        assert _times(bars)[0] == '2026-01-01 09:00' and _times(bars)[-1] == '2026-01-01 23:00'
+        assert bars['volume'][-1] == 30
+
+    def test_datetime64_and_list_input(self):
+        candles = _minute_candles(['2026-01-01'])
+        arrays = dhanhq.candles_as_arrays({field: values.tolist() for field, values in candles.items()})
+        bars = Resampler.resample(arrays, 3)
+        assert bars['timestamp'][1] == np.datetime64('2026-01-01T09:18:00')
+        assert len(bars['timestamp']) == 125
+        listed = Resampler.resample({field: values.tolist() for field, values in candles.items()}, 3)
+        assert listed['close'].tolist() == bars['close'].tolist()
+
+    def test_unordered_and_empty_input(self):
+        candles = _minute_candles(['2026-01-01'])
+        reverse = {field: values[::-1] for field, values in candles.items()}
+        assert Resampler.resample(reverse, 75)['open'].tolist() == [0.0, 75.0, 150.0, 225.0, 300.0]
+        assert len(Resampler.resample({'timestamp': [], 'close': []}, 5)['close']) == 0
+        night = _minute_candles(['2026-01-01'], start='16:00', minutes=10)
+        assert len(Resampler.resample(night, 5)['timestamp']) == 0
+
+    def test_invalid_arguments(self):
+        candles = _minute_candles(['2026-01-01'])
+        for interval in (0, -5, 2.5, 'W', True):
+            with pytest.raises(ValueError):
+                Resampler.resample(candles, interval)
+        with pytest.raises(ValueError):
+            Resampler.resample(candles, 5, session='NYSE')
+        with pytest.raises(ValueError):
+            Resampler.resample(candles, 5, session=('15:30', '09:15'))
+        assert Resampler.session((datetime.time(9, 15), '15:30')) == (33300, 55800)
+
+    def test_resampling_is_vectorized(self):
+        start = datetime.date(2025, 1, 1)
+        candles = _minute_candles([(start + datetime.timedelta(days=day)).isoformat()
+                                   for day in range(BENCHMARK_DAYS)])
+        timings = []
+        for _ in range(5):
+            begin = time.perf_counter()
+            bars = Resampler.resample(candles, 75)
+            timings.append(time.perf_counter() - begin)
+        assert len(bars['timestamp']) == 5 * BENCHMARK_DAYS
+        assert min(timings) < RESAMPLE_BUDGET_SECONDS
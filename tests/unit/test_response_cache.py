@@ -0,0 +1,160 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from dhanhq import DhanContext
+from dhanhq.dhan_http import DhanHTTP
+from dhanhq.orderupdate import OrderUpdate
+from dhanhq.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _response(content=b'{"availabelBalance": 100}', status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def dhan_http(clock):
+    return DhanHTTP("test_client_id", "test_access_token", rate_limiter=False,
+                    response_cache=ResponseCache(clock=clock))
+
+
+class TestResponseCache:
+    def test_only_configured_endpoints_are_cacheable(self):
+        cache = ResponseCache()
+        assert cache.key('GET', '/fundlimit') == ('GET', '/fundlimit', None)
+        assert cache.key('POST', '/optionchain/expirylist', '{}') is not None
+        assert cache.key('GET', '/orders') is None
+        assert cache.key('DELETE', '/positions') is None
+
+    def test_entries_expire_after_ttl(self, clock):
+        cache = ResponseCache({'/positions': 2}, clock=clock)
+        key = cache.key('GET', '/positions')
+        cache.put(key, {'status': 'success', 'remarks': '', 'data': [1]})
+        clock.now = 1.9
+        assert cache.get(key)['data'] == [1]
+        clock.now = 2.0
+        assert cache.get(key) is None
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 0, 'invalidations': 0, 'size': 0}
+
+    def test_failures_are_not_cached(self):
+        cache = ResponseCache()
+        key = cache.key('GET', '/holdings')
+        cache.put(key, {'status': 'failure', 'remarks': 'x', 'data': ''})
+        assert cache.get(key) is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResponseCache({'/holdings': 60}, maxsize=2)
+        keys = [('GET', '/holdings', str(i)) for i in range(3)]
+        for key in keys[:2]:
+            cache.put(key, {'status': 'success', 'data': key[2]})
+        cache.get(keys[0])
+        cache.put(keys[2], {'status': 'success', 'data': '2'})
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.stats()['evictions'] == 1
+
+    def test_hits_return_independent_copies(self):
+        cache = ResponseCache()
+        key = cache.key('GET', '/holdings')
+        cache.put(key, {'status': 'success', 'data': [{'qty': 1}]})
+        cache.get(key)['data'][0]['qty'] = 99
+        assert cache.get(key)['data'][0]['qty'] == 1
+
+    def test_invalidate_for_write(self):
+        cache = ResponseCache()
+        for endpoint in ('/fundlimit', '/positions', '/globalstocks/marketstatus'):
+            cache.put(cache.key('GET', endpoint), {'status': 'success', 'data': {}})
+        cache.invalidate_for_write('POST', '/orders')
+        assert cache.stats()['size'] == 1
+        assert cache.stats()['invalidations'] == 2
+
+    def test_response_fetched_across_an_invalidation_is_not_cached(self):
+        cache = ResponseCache()
+        key = cache.key('GET', '/positions')
+        generation = cache.generation(key)
+        cache.invalidate_for_write('POST', '/orders')
+        cache.put(key, {'status': 'success', 'data': ['before the order']}, generation)
+        assert cache.get(key) is None
+        cache.put(key, {'status': 'success', 'data': ['after the order']}, cache.generation(key))
+        assert cache.get(key)['data'] == ['after the order']
+        generation = cache.generation(key)
+        cache.invalidate()
+        cache.put(key, {'status': 'success', 'data': []}, generation)
+        assert cache.stats()['size'] == 0
+
+
+class TestDhanHTTP_ResponseCache:
+    @patch("requests.Session.get")
+    def test_repeated_reads_are_served_from_cache(self, mock_get, dhan_http):
+        mock_get.return_value = _response()
+        first = dhan_http.get('/fundlimit')
+        second = dhan_http.get('/fundlimit')
+        assert first == second
+        assert mock_get.call_count == 1
+        assert dhan_http.get_cache_stats()['hits'] == 1
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_own_order_placement_invalidates_dependent_reads(self, mock_post, mock_get, dhan_http):
+        mock_get.return_value = _response()
+        mock_post.return_value = _response(b'{"orderId": "1"}')
+        dhan_http.get('/positions')
+        dhan_http.post('/orders', {"securityId": "1333"})
+        dhan_http.get('/positions')
+        assert mock_get.call_count == 2
+
+    @patch("requests.Session.get")
+    def test_read_in_flight_during_an_order_is_not_cached(self, mock_get, dhan_http):
+        def get(*args, **kwargs):
+            # The order is placed from another thread while the positions are still on the wire.
+            if mock_get.call_count == 1:
+                with patch("requests.Session.post", return_value=_response(b'{"orderId": "1"}')):
+                    dhan_http.post('/orders', {"securityId": "1333"})
+            return _response()
+        mock_get.side_effect = get
+        dhan_http.get('/positions')
+        dhan_http.get('/positions')
+        assert mock_get.call_count == 2
+
+    @patch("requests.Session.post")
+    def test_expiry_list_is_cached_per_payload(self, mock_post, dhan_http):
+        mock_post.return_value = _response(b'{"data": ["2026-10-29"]}')
+        dhan_http.post('/optionchain/expirylist', {"UnderlyingScrip": 13, "UnderlyingSeg": "IDX_I"})
+        dhan_http.post('/optionchain/expirylist', {"UnderlyingScrip": 13, "UnderlyingSeg": "IDX_I"})
+        dhan_http.post('/optionchain/expirylist', {"UnderlyingScrip": 25, "UnderlyingSeg": "IDX_I"})
+        assert mock_post.call_count == 2
+
+    @patch("requests.Session.get")
+    def test_cache_is_off_by_default(self, mock_get):
+        dhan_http = DhanHTTP("test_client_id", "test_access_token", rate_limiter=False)
+        mock_get.return_value = _response()
+        dhan_http.get('/fundlimit')
+        dhan_http.get('/fundlimit')
+        assert mock_get.call_count == 2
+        assert dhan_http.get_cache_stats() is None
+
+    def test_order_alert_invalidates_cache(self):
+        dhan_context = DhanContext("test_client_id", "test_access_token", response_cache=True)
+        cache = dhan_context.get_dhan_http().response_cache
+        cache.put(cache.key('GET', '/positions'), {'status': 'success', 'data': []})
+        order_update = OrderUpdate(dhan_context)
+        order_update.on_update = lambda data: None
+        order_update.handle_order_update({'Type': 'order_alert', 'Data': {}})
+        assert cache.stats()['size'] == 0
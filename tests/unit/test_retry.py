@@ -0,0 +1,137 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from dhanhq.dhan_http import DhanHTTP
+from dhanhq.retry import RetryPolicy
+
+
+def _response(status_code, content):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+@pytest.fixture
+def sleeps():
+    return []
+
+
+@pytest.fixture
+def dhan_http(sleeps):
+    policy = RetryPolicy(max_attempts=3, sleep=sleeps.append, rng=lambda: 1.0)
+    return DhanHTTP("test_client_id", "test_access_token", rate_limiter=False, retry_policy=policy)
+
+
+class TestRetryPolicy:
+    def test_backoff_is_exponential_and_capped(self):
+        policy = RetryPolicy(backoff_base=0.5, backoff_max=3, rng=lambda: 1.0)
+        assert [policy.backoff(a) for a in range(1, 5)] == [0.5, 1.0, 2.0, 3]
+
+    def test_backoff_is_jittered(self):
+        policy = RetryPolicy(backoff_base=1, rng=lambda: 0.25)
+        assert policy.backoff(2) == 0.5
+
+    def test_retry_kind(self):
+        policy = RetryPolicy()
+        assert policy.retry_kind('GET', '/positions') == RetryPolicy.IDEMPOTENT
+        assert policy.retry_kind('POST', '/orders', 'tag-1') == RetryPolicy.ORDER_PLACEMENT
+        assert policy.retry_kind('POST', '/super/orders', 'tag-1') == RetryPolicy.ORDER_PLACEMENT
+        assert policy.retry_kind('POST', '/orders', None) is None
+        assert policy.retry_kind('PUT', '/orders/1', 'tag-1') is None
+        assert RetryPolicy(retry_order_placement=False).retry_kind('POST', '/orders', 'tag-1') is None
+
+    def test_placement_outcome(self):
+        assert RetryPolicy.placement_outcome({'status': 'success', 'remarks': '', 'data': {'orderId': '1'}}) == 'placed'
+        assert RetryPolicy.placement_outcome({'status': 'failure', 'remarks': {'error_code': 'DH-906'},
+                                              'data': ''}) == 'absent'
+        assert RetryPolicy.placement_outcome({'status': 'failure', 'remarks': 'timed out', 'data': ''}) == 'unknown'
+        assert RetryPolicy.placement_outcome({'status': 'failure', 'remarks': {'error_code': 'DH-904'},
+                                              'data': ''}) == 'unknown'
+        assert RetryPolicy.placement_outcome({'status': 'failure', 'remarks': {'error_code': None},
+                                              'data': ''}) == 'unknown'
+
+
+class TestDhanHTTP_Retry:
+    @patch("requests.Session.get")
+    def test_get_is_retried_on_connection_error(self, mock_get, dhan_http, sleeps):
+        mock_get.side_effect = [requests.exceptions.ConnectionError("reset"), _response(200, b'{"ok": 1}')]
+        response = dhan_http.get('/positions')
+        assert response['status'] == 'success'
+        assert mock_get.call_count == 2
+        assert sleeps == [0.25]
+
+    @patch("requests.Session.get")
+    def test_get_is_retried_on_retryable_status_until_max_attempts(self, mock_get, dhan_http, sleeps):
+        mock_get.return_value = _response(503, b'{"errorCode": "DH-908"}')
+        response = dhan_http.get('/positions')
+        assert response['status'] == 'failure'
+        assert mock_get.call_count == 3
+        assert sleeps == [0.25, 0.5]
+
+    @patch("requests.Session.get")
+    def test_client_errors_are_not_retried(self, mock_get, dhan_http):
+        mock_get.return_value = _response(400, b'{"errorCode": "DH-905"}')
+        dhan_http.get('/positions')
+        assert mock_get.call_count == 1
+
+    @patch("requests.Session.post")
+    def test_untagged_placement_is_not_retried(self, mock_post, dhan_http):
+        mock_post.side_effect = requests.exceptions.ReadTimeout("timed out")
+        response = dhan_http.post('/orders', {"securityId": "1333"})
+        assert response['status'] == 'failure'
+        assert mock_post.call_count == 1
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_tagged_placement_returns_existing_order_instead_of_duplicating(self, mock_post, mock_get, dhan_http):
+        mock_post.side_effect = requests.exceptions.ReadTimeout("timed out")
+        mock_get.return_value = _response(200, b'{"orderId": "112", "orderStatus": "PENDING"}')
+        response = dhan_http.post('/orders', {"securityId": "1333", "correlationId": "tag-1"})
+        assert mock_post.call_count == 1
+        assert mock_get.call_args[0][0] == dhan_http.base_url + '/orders/external/tag-1'
+        assert response['data']['orderId'] == "112"
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_tagged_placement_is_resent_when_order_is_absent(self, mock_post, mock_get, dhan_http):
+        mock_post.side_effect = [requests.exceptions.ConnectionError("reset"),
+                                 _response(200, b'{"orderId": "113", "orderStatus": "TRANSIT"}')]
+        mock_get.return_value = _response(404, b'{"errorCode": "DH-906", "errorMessage": "Order not found"}')
+        response = dhan_http.post('/super/orders', {"securityId": "1333", "correlationId": "tag-2"})
+        assert mock_post.call_count == 2
+        assert response['data']['orderId'] == "113"
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_tagged_placement_is_not_resent_when_lookup_fails(self, mock_post, mock_get, dhan_http):
+        mock_post.side_effect = requests.exceptions.ConnectionError("reset")
+        mock_get.side_effect = requests.exceptions.ConnectionError("reset")
+        response = dhan_http.post('/orders', {"securityId": "1333", "correlationId": "tag-3"})
+        assert mock_post.call_count == 1
+        assert response['remarks'] == "reset"
+
+    @pytest.mark.parametrize('status_code, body', [
+        (429, b'{"errorCode": "DH-904", "errorMessage": "Too many requests"}'),
+        (500, b'{"errorCode": "DH-908", "errorMessage": "Internal server error"}'),
+        (503, b'{"errorType": "Service Unavailable"}'),
+    ])
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_tagged_placement_is_not_resent_when_lookup_is_rejected(self, mock_post, mock_get, status_code, body,
+                                                                    dhan_http):
+        mock_post.side_effect = requests.exceptions.ReadTimeout("read timed out")
+        mock_get.return_value = _response(status_code, body)
+        response = dhan_http.post('/orders', {"securityId": "1333", "correlationId": "tag-4"})
+        assert mock_post.call_count == 1
+        assert response['status'] == 'failure'
+        assert response['remarks'] == "read timed out"
+
+    @patch("requests.Session.get")
+    def test_no_retry_without_policy(self, mock_get):
+        dhan_http = DhanHTTP("test_client_id", "test_access_token", rate_limiter=False)
+        mock_get.side_effect = requests.exceptions.ConnectionError("reset")
+        dhan_http.get('/positions')
+        assert mock_get.call_count == 1
@@ -0,0 +1,146 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from dhanhq import Security, scrip_master
+from sample_data import DETAILED_CSV, GLOBAL_CSV
+
+CSV = b"""SEM_EXM_EXCH_ID,SEM_SEGMENT,SEM_SMST_SECURITY_ID,SEM_INSTRUMENT_NAME,SEM_TRADING_SYMBOL,SEM_LOT_UNITS,\
+SEM_CUSTOM_SYMBOL,SEM_EXPIRY_DATE,SEM_STRIKE_PRICE,SEM_OPTION_TYPE,SEM_TICK_SIZE,SM_SYMBOL_NAME
+NSE,E,2885,EQUITY,RELIANCE,1.0,Reliance Industries,,-0.01,XX,5.0,RELIANCE INDUSTRIES LTD
+BSE,E,500325,EQUITY,RELIANCE,1.0,Reliance Industries,,-0.01,XX,5.0,RELIANCE INDUSTRIES LTD
+NSE,D,35001,OPTIDX,NIFTY-Oct2026-25000-CE,75.0,NIFTY 27 OCT 25000 CALL,2026-10-27 14:30:00,25000.0,CE,5.0,
+NSE,D,35002,OPTIDX,NIFTY-Oct2026-25000-PE,75.0,NIFTY 27 OCT 25000 PUT,2026-10-27 14:30:00,25000.0,PE,5.0,
+NSE,D,35100,FUTIDX,NIFTY-Oct2026-FUT,75.0,NIFTY OCT FUT,2026-10-27 14:30:00,-0.01,XX,10.0,
+MCX,M,4321,FUTCOM,CRUDEOIL-Nov2026-FUT,100.0,CRUDEOIL NOV FUT,2026-11-19 23:30:00,-0.01,XX,100.0,
+"""
+
+
+CSVS = {
+    Security.COMPACT_CSV_URL: CSV,
+    Security.DETAILED_CSV_URL: DETAILED_CSV.encode(),
+    Security.GLOBAL_STOCKS_CSV_URL: GLOBAL_CSV.encode(),
+}
+
+
+def _concurrent_responses(count):
+    # Every download waits until all of them have started, so sequential downloads time out.
+    barrier = threading.Barrier(count, timeout=5)
+
+    def get(url, stream=False):
+        barrier.wait()
+        response = MagicMock()
+        response.__enter__.return_value.iter_content.return_value = [CSVS[url]]
+        return response
+    return get
+
+
+def _csv_file(tmp_path):
+    path = tmp_path / 'scrip_master.csv'
+    path.write_bytes(CSV)
+    return str(path)
+
+
+class TestScripMaster:
+    def test_read_uses_compact_dtypes(self, tmp_path):
+        frame = scrip_master.read(_csv_file(tmp_path), 'compact', chunksize=2)
+        assert len(frame) == 6
+        assert frame['SEM_SMST_SECURITY_ID'].dtype == np.int32
+        assert frame['SEM_TICK_SIZE'].dtype == np.float32
+        assert isinstance(frame['SEM_INSTRUMENT_NAME'].dtype, pd.CategoricalDtype)
+        assert isinstance(frame['SEM_SEGMENT'].dtype, pd.CategoricalDtype)
+        assert set(frame['SEM_INSTRUMENT_NAME'].cat.categories) == {'EQUITY', 'OPTIDX', 'FUTIDX', 'FUTCOM'}
+
+    def test_read_keeps_blank_or_text_security_ids_as_strings(self, tmp_path):
+        csv = CSV.replace(b'NSE,D,35100,', b'NSE,D,,').replace(b'MCX,M,4321,', b'MCX,M,X4321,')
+        filename = tmp_path / 'odd.csv'
+        filename.write_bytes(csv)
+        frame = scrip_master.read(str(filename), 'compact', chunksize=2)
+        ids = frame['SEM_SMST_SECURITY_ID']
+        assert ids.tolist()[:4] == ['2885', '500325', '35001', '35002']
+        assert pd.isna(ids[4]) and ids[5] == 'X4321'
+        assert scrip_master.read(str(filename), 'compact', exchange_segments=['NSE_EQ'])[
+            'SEM_SMST_SECURITY_ID'].dtype == np.int32
+
+    def test_read_selects_columns_and_filters_rows_per_block(self, tmp_path):
+        columns = ['SEM_SMST_SECURITY_ID', 'SEM_TRADING_SYMBOL']
+        frame = scrip_master.read(_csv_file(tmp_path), 'compact', columns=columns,
+                                  exchange_segments=['NSE_FNO'], instruments=['OPTIDX'], chunksize=2)
+        assert list(frame.columns) == ['SEM_SMST_SECURITY_ID', 'SEM_TRADING_SYMBOL']
+        assert frame['SEM_SMST_SECURITY_ID'].tolist() == [35001, 35002]
+
+    def test_read_with_row_filter(self, tmp_path):
+        frame = scrip_master.read(_csv_file(tmp_path), 'compact', columns=['SEM_TRADING_SYMBOL'],
+                                  row_filter=lambda block: block['SEM_LOT_UNITS'] > 50)
+        assert frame['SEM_TRADING_SYMBOL'].tolist() == ['NIFTY-Oct2026-25000-CE', 'NIFTY-Oct2026-25000-PE',
+                                                        'NIFTY-Oct2026-FUT', 'CRUDEOIL-Nov2026-FUT']
+
+    def test_read_without_matches(self, tmp_path):
+        frame = scrip_master.read(_csv_file(tmp_path), 'compact', columns=['SEM_TRADING_SYMBOL'],
+                                  exchange_segments=['BSE_FNO'])
+        assert len(frame) == 0
+        assert list(frame.columns) == ['SEM_TRADING_SYMBOL']
+
+    def test_exchange_segment(self, tmp_path):
+        frame = scrip_master.read(_csv_file(tmp_path), 'compact')
+        assert scrip_master.exchange_segment(frame, 'compact').tolist() == ['NSE_EQ', 'BSE_EQ', 'NSE_FNO', 'NSE_FNO',
+                                                                            'NSE_FNO', 'MCX_COMM']
+
+    @patch('requests.get')
+    def test_download_streams_chunks_to_disk(self, mock_get, tmp_path):
+        response = mock_get.return_value.__enter__.return_value
+        response.iter_content.return_value = [CSV[:100], CSV[100:]]
+        filename = str(tmp_path / 'a.csv')
+        assert scrip_master.download('https://example.com/a.csv', filename, chunk_size=100) is response
+        mock_get.assert_called_once_with('https://example.com/a.csv', stream=True)
+        response.iter_content.assert_called_once_with(100)
+        assert open(filename, 'rb').read() == CSV
+
+    @patch('requests.get')
+    def test_fetch_security_list_streamed(self, mock_get, tmp_path, dhanhq_obj):
+        mock_get.return_value.__enter__.return_value.iter_content.return_value = [CSV]
+        frame = dhanhq_obj.fetch_security_list('compact', str(tmp_path / 'list.csv'), stream=True,
+                                               exchange_segments=['NSE_EQ', 'BSE_EQ'])
+        assert frame['SEM_SMST_SECURITY_ID'].tolist() == [2885, 500325]
+        assert frame['SEM_SMST_SECURITY_ID'].dtype == np.int32
+
+    @patch('requests.get')
+    def test_fetch_all_downloads_concurrently(self, mock_get, tmp_path):
+        mock_get.side_effect = _concurrent_responses(3)
+        urls = {'compact': Security.COMPACT_CSV_URL, 'detailed': Security.DETAILED_CSV_URL,
+                'global': Security.GLOBAL_STOCKS_CSV_URL}
+        loaded = scrip_master.fetch_all(urls, str(tmp_path), columns={'global': ['SCRIP_CODE']})
+        assert [len(frame) for frame, _ in loaded.values()] == [6, 3, 1]
+        assert list(loaded['global'][0].columns) == ['SCRIP_CODE']
+        timing = loaded['detailed'][1]
+        assert timing['rows'] == 3
+        assert timing['total'] >= timing['download'] + timing['parse'] - 1e-9
+
+    @patch('requests.get')
+    def test_fetch_all_parses_in_processes(self, mock_get, tmp_path):
+        mock_get.side_effect = _concurrent_responses(2)
+        urls = {'compact': Security.COMPACT_CSV_URL, 'detailed': Security.DETAILED_CSV_URL}
+        with patch.object(scrip_master, 'ProcessPoolExecutor', wraps=ProcessPoolExecutor) as mock_pool:
+            loaded = scrip_master.fetch_all(urls, str(tmp_path), exchange_segments=['NSE_FNO'], processes=True)
+        assert mock_pool.call_args.kwargs['mp_context'].get_start_method() == 'spawn'
+        assert loaded['compact'][0]['SEM_SMST_SECURITY_ID'].tolist() == [35001, 35002, 35100]
+        assert loaded['detailed'][0]['SECURITY_ID'].tolist() == [35001]
+
+    @patch('requests.get')
+    def test_fetch_security_lists(self, mock_get, tmp_path, dhanhq_obj):
+        mock_get.side_effect = _concurrent_responses(3)
+        response = dhanhq_obj.fetch_security_lists(directory=str(tmp_path))
+        assert sorted(response['data']) == ['compact', 'detailed', 'global']
+        assert response['timings']['global']['rows'] == 1
+        assert dhanhq_obj.fetch_security_lists(['compact', 'weekly']) is None
+
+    @patch('requests.get')
+    def test_fetch_instrument_master_reports_timings(self, mock_get, dhanhq_obj):
+        mock_get.side_effect = _concurrent_responses(2)
+        master = dhanhq_obj.fetch_instrument_master(include_global=True)
+        assert len(master) == 4
+        assert sorted(master.timings) == ['detailed', 'global']
+        assert set(master.timings['global']) == {'download', 'parse', 'normalize', 'total', 'rows'}
@@ -0,0 +1,176 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+
+from dhanhq.scrip_master_cache import ScripMasterCache
+
+CSV = b"""SEM_EXM_EXCH_ID,SEM_SEGMENT,SEM_SMST_SECURITY_ID,SEM_INSTRUMENT_NAME,SEM_TRADING_SYMBOL,SEM_LOT_UNITS,\
+SEM_CUSTOM_SYMBOL,SEM_EXPIRY_DATE,SEM_STRIKE_PRICE,SEM_OPTION_TYPE,SEM_TICK_SIZE,SM_SYMBOL_NAME
+NSE,E,2885,EQUITY,RELIANCE,1.0,Reliance Industries,,-0.01,XX,5.0,RELIANCE INDUSTRIES LTD
+NSE,D,35001,OPTIDX,NIFTY-Oct2026-25000-CE,75.0,NIFTY 27 OCT 25000 CALL,2026-10-27 14:30:00,25000.0,CE,5.0,
+"""
+
+URL = 'https://images.dhan.co/api-data/api-scrip-master.csv'
+
+
+def _response(status_code, content=b'', headers=None):
+    # A streamed response, used as a context manager.
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    response.__enter__.return_value = response
+    response.iter_content.return_value = [content[:50], content[50:]]
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(f'{status_code}')
+    return response
+
+
+class Clock:
+    def __init__(self):
+        self.now = datetime(2026, 10, 16, 9, 0, tzinfo=ScripMasterCache.IST)
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return ScripMasterCache(str(tmp_path), clock=clock)
+
+
+class TestScripMasterCache:
+    def test_round_trip_keeps_types_and_missing_values(self, cache):
+        frame = pd.DataFrame({'id': [1, 2, 3], 'price': [1.5, np.nan, 3.0], 'name': ['a', None, 'ünï'],
+                              'empty': [np.nan, np.nan, np.nan]})
+        cache.write('test', frame, {'url': URL, 'date': '2026-10-16'})
+        loaded = cache.read('test')
+        pd.testing.assert_frame_equal(loaded, frame)
+
+    def test_round_trip_keeps_empty_strings_and_non_string_values(self, cache):
+        frame = pd.DataFrame({'blank': ['', '', ''], 'mixed': [1, 'a', None], 'none': [None, None, None]},
+                             dtype=object)
+        cache.write('test', frame, {'url': URL, 'date': '2026-10-16'})
+        loaded = cache.read('test')
+        assert loaded['blank'].tolist() == ['', '', '']
+        assert loaded['mixed'].tolist()[:2] == [1, 'a'] and pd.isna(loaded['mixed'][2])
+        assert loaded['none'].isna().all()
+        assert [layout for _, _, layout in cache.read_meta('test')['columns']] == [
+            {'rows': 3, 'encoding': 'text', 'values': 1}, {'rows': 3, 'encoding': 'json', 'values': 2},
+            {'rows': 3, 'encoding': 'text', 'values': 0}]
+
+    @patch('requests.get')
+    def test_damaged_cache_is_downloaded_again(self, mock_get, cache, tmp_path):
+        mock_get.return_value = _response(200, CSV, {'ETag': '"v1"'})
+        cache.load('compact', URL)
+        np.save(str(tmp_path / cache.read_meta('compact')['data'] / '0.npy'), np.zeros(1, dtype=np.int32))
+        assert cache.read('compact') is None
+        assert len(cache.load('compact', URL)) == 2
+        mock_get.assert_called_with(URL, stream=True)
+        assert mock_get.call_count == 2
+
+    @patch('requests.get')
+    def test_reused_within_the_day(self, mock_get, cache):
+        mock_get.return_value = _response(200, CSV, {'ETag': '"v1"'})
+        first = cache.load('compact', URL)
+        second = cache.load('compact', URL)
+        mock_get.assert_called_once_with(URL, stream=True)
+        pd.testing.assert_frame_equal(first, second)
+        assert second['SEM_SMST_SECURITY_ID'].tolist() == [2885, 35001]
+        # Streamed through a temporary file, which is gone afterwards.
+        assert sorted(os.listdir(cache.directory)) == [cache.read_meta('compact')['data'], 'compact.json']
+
+    @patch('requests.get')
+    def test_revalidated_after_day_rollover(self, mock_get, cache, clock):
+        mock_get.return_value = _response(200, CSV, {'ETag': '"v1"', 'Last-Modified': 'Thu, 15 Oct 2026 02:00:00 GMT'})
+        cache.load('compact', URL)
+        clock.now = clock.now.replace(day=17)
+        mock_get.return_value = _response(304)
+        with patch('pandas.read_csv') as mock_read_csv:
+            frame = cache.load('compact', URL)
+        mock_read_csv.assert_not_called()
+        mock_get.assert_called_with(URL, headers={'If-None-Match': '"v1"',
+                                                  'If-Modified-Since': 'Thu, 15 Oct 2026 02:00:00 GMT'}, stream=True)
+        assert len(frame) == 2
+        assert cache.read_meta('compact')['date'] == '2026-10-17'
+
+    @patch('requests.get')
+    def test_changed_server_copy_replaces_cache(self, mock_get, cache, clock):
+        mock_get.return_value = _response(200, CSV, {'ETag': '"v1"'})
+        cache.load('compact', URL)
+        clock.now = clock.now.replace(day=17)
+        mock_get.return_value = _response(200, CSV.rsplit(b'\n', 2)[0] + b'\n', {'ETag': '"v2"'})
+        assert len(cache.load('compact', URL)) == 1
+        assert cache.read_meta('compact')['etag'] == '"v2"'
+
+    @patch('requests.get')
+    def test_stale_cache_is_not_read_before_revalidation(self, mock_get, cache, clock):
+        mock_get.return_value = _response(200, CSV, {'ETag': '"v1"'})
+        cache.load('compact', URL)
+        clock.now = clock.now.replace(day=17)
+        mock_get.return_value = _response(200, CSV, {'ETag': '"v2"'})
+        with patch.object(ScripMasterCache, '_read_columns') as mock_read_columns:
+            cache.load('compact', URL)
+        mock_read_columns.assert_not_called()
+
+    def test_replacing_a_copy_never_exposes_a_partial_one(self, cache):
+        first = pd.DataFrame({'id': [1, 2]})
+        second = pd.DataFrame({'id': [3, 4, 5]})
+        cache.write('test', first, {'url': URL, 'date': '2026-10-16'})
+        read_columns = ScripMasterCache._read_columns
+
+        def replaced_while_read(self, meta):
+            # Another process publishes a new copy, and removes this one, while it is read.
+            if meta['rows'] == 2:
+                self.write('test', second, {'url': URL, 'date': '2026-10-17'})
+            return read_columns(self, meta)
+        with patch.object(ScripMasterCache, '_read_columns', replaced_while_read):
+            assert cache.read('test')['id'].tolist() == [3, 4, 5]
+        assert sorted(os.listdir(cache.directory)) == [cache.read_meta('test')['data'], 'test.json']
+
+    def test_concurrent_writers(self, cache):
+        frames = [pd.DataFrame({'id': list(range(i + 1))}) for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda frame: cache.write('test', frame, {'url': URL, 'date': '2026-10-16'}), frames))
+        assert len(cache.read('test')) in range(1, 9)
+        cache.clear('test')
+        assert os.listdir(cache.directory) == []
+
+    @patch('requests.get')
+    def test_stale_cache_is_used_when_refresh_fails(self, mock_get, cache, clock):
+        mock_get.return_value = _response(200, CSV)
+        cache.load('compact', URL)
+        clock.now = clock.now.replace(day=17)
+        mock_get.return_value = _response(503)
+        assert len(cache.load('compact', URL)) == 2
+
+    @patch('requests.get')
+    def test_failure_without_cache_raises(self, mock_get, cache):
+        mock_get.return_value = _response(503)
+        with pytest.raises(requests.HTTPError):
+            cache.load('compact', URL)
+
+    def test_resolve(self, tmp_path):
+        assert ScripMasterCache.resolve(None) is None
+        assert ScripMasterCache.resolve(False) is None
+        assert ScripMasterCache.resolve(True).directory == ScripMasterCache.DEFAULT_DIRECTORY
+        assert ScripMasterCache.resolve(str(tmp_path)).directory == str(tmp_path)
+
+    @patch('requests.get')
+    def test_fetch_helpers_use_the_cache(self, mock_get, tmp_path, dhanhq_obj):
+        mock_get.return_value = _response(200, CSV)
+        frame = dhanhq_obj.fetch_security_list('compact', cache=str(tmp_path))
+        master = dhanhq_obj.fetch_instrument_master('compact', cache=str(tmp_path))
+        mock_get.assert_called_once()
+        assert len(frame) == 2
+        assert master.option('NIFTY', '2026-10-27', 25000, 'CE')['security_id'] == '35001'
+        assert master.get('2885', 'NSE_EQ')['lot_size'] == 1
@@ -0,0 +1,93 @@
+import datetime
+import io
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from dhanhq import InstrumentMaster, SharedInstrumentMaster
+from sample_data import COMPACT_CSV, DETAILED_CSV, GLOBAL_CSV
+
+
+@pytest.fixture
+def master():
+    return InstrumentMaster.concat([InstrumentMaster.from_csv(io.StringIO(COMPACT_CSV), InstrumentMaster.COMPACT),
+                                    InstrumentMaster.from_csv(io.StringIO(DETAILED_CSV), InstrumentMaster.DETAILED),
+                                    InstrumentMaster.from_csv(io.StringIO(GLOBAL_CSV), InstrumentMaster.GLOBAL)])
+
+
+@pytest.fixture
+def shared(master, tmp_path):
+    return SharedInstrumentMaster.build(master, str(tmp_path / 'instruments.bin'), '2026-10-16')
+
+
+class TestSharedInstrumentMaster:
+    def test_rows_match_the_in_memory_master(self, master, shared):
+        assert len(shared) == len(master)
+        assert [shared.row(i) for i in range(len(shared))] == [master.row(i) for i in range(len(master))]
+
+    def test_lookups(self, master, shared):
+        assert shared.get(2885, 'NSE_EQ') == master.get(2885, 'NSE_EQ')
+        assert shared.get('2885', 'BSE_EQ') is None
+        assert shared.by_symbol('RELIANCE', 'BSE_EQ')['security_id'] == '500325'
+        assert shared.by_symbol('UNKNOWN', 'NSE_EQ') is None
+        assert [i['exchange_segment'] for i in shared.by_isin('INE002A01018')] == ['NSE_EQ', 'BSE_EQ']
+        assert shared.by_isin('') == []
+        assert shared.security_ids(['RELIANCE', 'NIFTY', 'UNKNOWN'], 'NSE_EQ') == ['2885', None, None]
+        assert shared.get('AAPL', 'INX_EQ')['tick_size'] == 0.01
+
+    def test_option_lookup(self, shared):
+        assert shared.option('NIFTY', '2026-10-27', 25000, 'PE')['security_id'] == '35002'
+        call = shared.option('NIFTY', datetime.date(2026, 10, 27), 25000.0, 'CE')
+        assert call['security_id'] == '35001' and call['expiry'] == datetime.date(2026, 10, 27)
+        assert shared.option('NIFTY', '2026-10-27', 25050, 'CE') is None
+        assert shared.option('NIFTY', '2026-10-28', 25000, 'CE') is None
+        assert shared.option('BANKNIFTY', '2026-10-27', 25000, 'CE') is None
+
+    def test_other_processes_attach_to_the_same_file(self, shared):
+        code = ('from dhanhq import SharedInstrumentMaster\n'
+                f'shared = SharedInstrumentMaster({shared.path!r})\n'
+                'print(shared.by_symbol("NIFTY-Oct2026-FUT", "NSE_FNO")["security_id"], shared.date)\n')
+        output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+        assert output.split() == ['35100', '2026-10-16']
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / 'other.bin'
+        path.write_bytes(b'not an instrument master')
+        with pytest.raises(ValueError):
+            SharedInstrumentMaster(str(path))
+
+    def test_open_reuses_todays_file_and_rebuilds_stale_ones(self, master, tmp_path):
+        path = str(tmp_path / 'instruments.bin')
+        with patch('dhanhq.scrip_master_cache.ScripMasterCache.today', return_value='2026-10-16'), \
+                patch.object(InstrumentMaster, 'fetch', return_value=master) as mock_fetch:
+            assert len(SharedInstrumentMaster.open(path)) == len(master)
+            SharedInstrumentMaster.open(path)
+        mock_fetch.assert_called_once_with('detailed', False, None, None, None)
+
+        with patch('dhanhq.scrip_master_cache.ScripMasterCache.today', return_value='2026-10-17'), \
+                patch.object(InstrumentMaster, 'fetch', return_value=master) as mock_fetch:
+            assert SharedInstrumentMaster.open(path).date == '2026-10-17'
+        mock_fetch.assert_called_once()
+
+    def test_concurrent_opens_build_once(self, master, tmp_path):
+        path = str(tmp_path / 'instruments.bin')
+        barrier = threading.Barrier(4)
+
+        def fetch(*args):
+            time.sleep(0.1)
+            return master
+
+        def open_shared(_):
+            barrier.wait()
+            return SharedInstrumentMaster.open(path)
+        with patch('dhanhq.scrip_master_cache.ScripMasterCache.today', return_value='2026-10-16'), \
+                patch.object(InstrumentMaster, 'fetch', side_effect=fetch) as mock_fetch, \
+                ThreadPoolExecutor(max_workers=4) as executor:
+            opened = list(executor.map(open_shared, range(4)))
+        mock_fetch.assert_called_once()
+        assert all(len(shared) == len(master) and shared.date == '2026-10-16' for shared in opened)
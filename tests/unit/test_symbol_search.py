@@ -0,0 +1,78 @@
+import io
+import time
+
+import numpy as np
+import pytest
+
+from dhanhq import InstrumentMaster, SymbolSearch
+from sample_data import COMPACT_CSV, GLOBAL_CSV
+
+"""Best of several searches over a master of this size must beat the budget"""
+BENCHMARK_ROWS = 200000
+SEARCH_BUDGET_SECONDS = 0.001
+
+
+@pytest.fixture
+def search():
+    master = InstrumentMaster.concat([InstrumentMaster.from_csv(io.StringIO(COMPACT_CSV), InstrumentMaster.COMPACT),
+                                      InstrumentMaster.from_csv(io.StringIO(GLOBAL_CSV), InstrumentMaster.GLOBAL)])
+    return master.symbol_search()
+
+
+def _ids(instruments):
+    return [instrument['security_id'] for instrument in instruments]
+
+
+class TestSymbolSearch:
+    def test_prefix_search_ranks_exact_matches_first(self, search):
+        assert isinstance(search, SymbolSearch)
+        assert _ids(search.search('nifty', limit=3)) == ['13', '35001', '35002']
+        assert _ids(search.search('Rel')) == ['2885', '500325']
+        assert _ids(search.search('NIFTY-Oct2026-25000-P')) == ['35002']
+        assert _ids(search.search('crude')) == ['4321']
+
+    def test_names_match_by_word(self, search):
+        assert _ids(search.search('industries')) == ['2885', '500325']
+        assert _ids(search.search('Apple')) == ['AAPL']
+        assert _ids(search.search('inc')) == ['AAPL']
+
+    def test_exchange_segment_filter(self, search):
+        assert _ids(search.search('reliance', exchange_segments=['BSE_EQ'])) == ['500325']
+        assert search.search('reliance', exchange_segments=['NSE_FNO']) == []
+        assert _ids(search.search('rel', exchange_segments=['BSE_EQ', 'NSE_EQ'])) == _ids(search.search('rel'))
+        assert _ids(search.search('nifty', limit=3, exchange_segments=['NSE_FNO', 'IDX_I'])) == ['13', '35001', '35002']
+        assert _ids(search.search('industries', exchange_segments=('NSE_EQ',))) == ['2885']
+
+    def test_fuzzy_match(self, search):
+        assert search.search('relaince') == []
+        assert _ids(search.search('relaince', fuzzy=True)) == ['2885', '500325']
+        assert _ids(search.fuzzy('APPEL', limit=1)) == ['AAPL']
+        assert all(instrument['instrument'] in ('EQUITY', 'INDEX') for instrument in search.fuzzy('NIFTY OCT'))
+        assert search.fuzzy('QQQQ') == []
+
+    def test_empty_queries(self, search):
+        assert search.search('') == []
+        assert search.search('   ') == []
+        assert search.search('RELIANCE', limit=0) == []
+
+    def test_search_is_sub_millisecond(self):
+        count = BENCHMARK_ROWS
+        symbols = np.array([f'NIFTY-Oct2026-{row}-CE' for row in range(count)], dtype=object)
+        names = np.array([f'NIFTY 27 OCT {row} CALL' for row in range(count)], dtype=object)
+        columns = {name: np.full(count, '', dtype=object) for name, dtype in InstrumentMaster.COLUMNS.items()
+                   if dtype is object}
+        columns.update(exchange_segment=np.full(count, 'NSE_FNO', dtype=object),
+                       security_id=np.arange(count).astype(str).astype(object), trading_symbol=symbols,
+                       display_name=names, expiry=np.full(count, '2026-10-27', dtype='datetime64[D]'),
+                       strike=np.arange(count, dtype=np.float64), lot_size=np.full(count, 75),
+                       tick_size=np.full(count, 0.05))
+        search = InstrumentMaster(columns).symbol_search()
+
+        for segments, expected in ((None, 10), (['NSE_FNO'], 10), (['NSE_EQ'], 0)):
+            timings = []
+            for _ in range(20):
+                start = time.perf_counter()
+                results = search.search('nifty', exchange_segments=segments)
+                timings.append(time.perf_counter() - start)
+            assert len(results) == expected
+            assert min(timings) < SEARCH_BUDGET_SECONDS